@@ -0,0 +1,149 @@
+"""
+Todo model benchmark: construction time, to_dict() time and memory.
+
+The slotted Todo is compared with the previous representation, a plain
+dataclass validating its dates in loops and converting with asdict(),
+which is reproduced here as LegacyTodo. Rows are decoded the way the
+backends do, once through the validating constructor and once through
+Todo.trusted().
+
+Usage:
+    python benchmarks/bench_model.py [--count N] [--repeat N]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import date, datetime
+from typing import Callable, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mvp.model import Todo  # noqa: E402
+
+
+@dataclass
+class LegacyTodo:
+    """The Todo model before it was slotted."""
+
+    task: str
+    category: str
+    task_id: Optional[int] = None
+    date_added: Optional[str] = None
+    due_date: Optional[str] = None
+    date_completed: Optional[str] = None
+    position: Optional[int] = None
+    modified_at: Optional[str] = None
+
+    def __post_init__(self):
+        for field in ["date_added", "due_date", "date_completed"]:
+            value = getattr(self, field)
+            if value and not isinstance(value, (str, date, datetime)):
+                raise ValueError(field)
+        for field in ["date_added", "due_date", "date_completed"]:
+            value = getattr(self, field)
+            if isinstance(value, (date, datetime)):
+                setattr(self, field, value.isoformat())
+
+
+def make_rows(count: int) -> List[tuple]:
+    """Return synthetic rows in the backends' column order."""
+    return [
+        (
+            i,
+            f"Task number {i}",
+            ("Coding", "Personal", "Study")[i % 3],
+            "2024-01-01T09:00:00",
+            "2024-02-01" if i % 2 else "",
+            "2024-01-15T17:30:00" if i % 5 == 0 else "",
+            i,
+            None,
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def legacy(rows: List[tuple]) -> list:
+    return [
+        LegacyTodo(
+            task_id=r[0], task=r[1], category=r[2], date_added=r[3],
+            due_date=r[4], date_completed=r[5], position=r[6],
+        )
+        for r in rows
+    ]
+
+
+def validated(rows: List[tuple]) -> list:
+    return [
+        Todo(
+            task_id=r[0], task=r[1], category=r[2], date_added=r[3],
+            due_date=r[4], date_completed=r[5], position=r[6],
+        )
+        for r in rows
+    ]
+
+
+def trusted(rows: List[tuple]) -> list:
+    return [Todo.trusted(*r) for r in rows]
+
+
+def best_time(func: Callable[[], object], repeat: int) -> float:
+    """Return the fastest of repeat runs of func, in seconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return min(samples)
+
+
+def memory(build: Callable[[], list]) -> int:
+    """Return the bytes allocated by the objects build() returns."""
+    tracemalloc.start()
+    objects = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--count", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = make_rows(args.count)
+    legacy_todos = legacy(rows)
+    todos = trusted(rows)
+
+    results = {}
+    for name, build in [
+        ("legacy", legacy), ("validated", validated), ("trusted", trusted)
+    ]:
+        results[name] = {
+            "construct_s": round(
+                best_time(lambda: build(rows), args.repeat), 4
+            ),
+            "memory_bytes": memory(lambda: build(rows)),
+        }
+    results["legacy"]["to_dict_s"] = round(best_time(
+        lambda: [asdict(todo) for todo in legacy_todos], args.repeat
+    ), 4)
+    results["trusted"]["to_dict_s"] = round(best_time(
+        lambda: [todo.to_dict() for todo in todos], args.repeat
+    ), 4)
+
+    print(json.dumps({
+        "benchmark": "todo_model",
+        "count": args.count,
+        "repeat": args.repeat,
+        "results": results,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
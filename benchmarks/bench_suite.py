@@ -0,0 +1,259 @@
+"""
+Benchmark suite: model, backends and rendering on synthetic todos.
+
+For each size, Todo construction is timed once, then every backend gets
+the same generated todos through insert_todos() and is timed on a cold
+get_all_todos() (fetch and decode), building the show_todos table,
+show_statistics and a series of reorders. The Google Sheets backend
+runs against the in-process FakeSheetsServer, optionally with injected
+latency, and its results also count the requests each step made.
+
+Usage:
+    python benchmarks/bench_suite.py [--sizes 1000,10000,100000]
+        [--backends memory,sqlite,sheets] [--repeat N] [--moves N]
+        [--latency SECONDS] [--output FILE]
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rich.console import Console  # noqa: E402
+
+import mvp.cli  # noqa: E402
+from mvp.backend import TodoBackend  # noqa: E402
+from mvp.model import Todo  # noqa: E402
+from synthetic import generate_todos  # noqa: E402
+
+DEFAULT_SIZES = "1000,10000,100000"
+DEFAULT_BACKENDS = "memory,sqlite,sheets"
+
+
+def best_time(func: Callable[[], object], repeat: int) -> float:
+    """Return the fastest of repeat runs of func, in seconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return min(samples)
+
+
+def request_count(backend: TodoBackend) -> Optional[int]:
+    """Return the remote requests a backend made so far, if it counts."""
+    if backend.metrics is None:
+        return None
+    return backend.metrics.total().requests
+
+
+def memory_backend(workdir: str) -> Tuple[TodoBackend, Callable]:
+    from mvp.memory_db import TodoMemory
+
+    backend = TodoMemory()
+    return backend, lambda: backend
+
+
+def sqlite_backend(workdir: str) -> Tuple[TodoBackend, Callable]:
+    from mvp.sqlite_db import TodoSQLite
+
+    fd, path = tempfile.mkstemp(suffix=".db", dir=workdir)
+    os.close(fd)
+    return TodoSQLite(path), lambda: TodoSQLite(path)
+
+
+def sheets_backend(
+    workdir: str, latency: float = 0.0
+) -> Tuple[TodoBackend, Callable]:
+    from mvp.fake_sheets import FakeSheetsServer
+    from mvp.google_sheets_db import CHANGES_HEADER, TodoGoogleSheets
+    from mvp.scheduler import RequestScheduler
+
+    server = FakeSheetsServer(latency=latency)
+    server.add_spreadsheet("task_tracker", {
+        "tasks": [CHANGES_HEADER[:-1]],
+        "categories": [["category_id", "category_name"]],
+    })
+
+    def connect() -> TodoBackend:
+        return TodoGoogleSheets(
+            client=server.client(),
+            cache_file="",
+            scheduler=RequestScheduler(requests_per_minute=0),
+        )
+    return connect(), connect
+
+
+BACKENDS = {
+    "memory": memory_backend,
+    "sqlite": sqlite_backend,
+    "sheets": sheets_backend,
+}
+
+
+def make_cli(backend: TodoBackend) -> mvp.cli.TodoCLI:
+    """Return a TodoCLI on a backend, printing to nowhere."""
+    connection: Future = Future()
+    connection.set_result(backend)
+    return mvp.cli.TodoCLI(connection=connection, splash_delay=0)
+
+
+def bench_model(todos: List[Todo], repeat: int) -> Dict[str, float]:
+    """Time building todos through both constructors."""
+    rows = [
+        (t.task_id, t.task, t.category, t.date_added, t.due_date,
+         t.date_completed, t.position, t.modified_at)
+        for t in todos
+    ]
+    return {
+        "construct_validated": best_time(lambda: [
+            Todo(
+                task_id=r[0], task=r[1], category=r[2], date_added=r[3],
+                due_date=r[4], date_completed=r[5], position=r[6],
+            )
+            for r in rows
+        ], repeat),
+        "construct_trusted": best_time(
+            lambda: [Todo.trusted(*r) for r in rows], repeat
+        ),
+    }
+
+
+def bench_backend(
+    name: str,
+    todos: List[Todo],
+    args: argparse.Namespace,
+    workdir: str,
+) -> List[Dict[str, object]]:
+    """
+    Run every backend step on one backend and return the results.
+
+    Args:
+        name (str): A key of BACKENDS.
+        todos (List[Todo]): The todos to insert.
+        args (argparse.Namespace): The command line options.
+        workdir (str): Directory for database files.
+
+    Returns:
+        List[Dict[str, object]]: One result per step.
+    """
+    factory = BACKENDS[name]
+    if name == "sheets":
+        backend, reopen = factory(workdir, args.latency)
+    else:
+        backend, reopen = factory(workdir)
+    results = []
+
+    def record(step, seconds, requests=None, per=1):
+        result = {"step": step, "seconds": round(seconds / per, 6)}
+        if requests is not None:
+            result["requests"] = round(requests / per, 2)
+        results.append(result)
+
+    before = request_count(backend)
+    start = time.perf_counter()
+    backend.insert_todos(todos)
+    backend.close()
+    after = request_count(backend)
+    record(
+        "bulk_insert",
+        time.perf_counter() - start,
+        None if before is None else after - before,
+    )
+
+    samples = []
+    for _ in range(args.repeat):
+        backend = reopen()
+        before = request_count(backend)
+        start = time.perf_counter()
+        backend.get_all_todos()
+        seconds = time.perf_counter() - start
+        after = request_count(backend)
+        samples.append(
+            (seconds, None if before is None else after - before)
+        )
+    record("get_all_todos", *min(samples, key=lambda sample: sample[0]))
+
+    cli = make_cli(backend)
+    try:
+        record("show_todos", best_time(cli.show_todos, args.repeat))
+        record(
+            "show_statistics", best_time(cli.show_statistics, args.repeat)
+        )
+    finally:
+        cli.prefetcher.shutdown()
+
+    moves = min(args.moves, len(todos))
+    task_ids = [todo.task_id for todo in backend.get_all_todos()]
+    before = request_count(backend)
+    start = time.perf_counter()
+    for task_id in task_ids[-moves:]:
+        backend.reorder_todo(task_id, 1)
+    backend.close()
+    after = request_count(backend)
+    record(
+        "reorder",
+        time.perf_counter() - start,
+        None if before is None else after - before,
+        per=moves,
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default=DEFAULT_SIZES)
+    parser.add_argument("--backends", default=DEFAULT_BACKENDS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--moves", type=int, default=20)
+    parser.add_argument(
+        "--latency", type=float, default=0.0,
+        help="Seconds added to each fake Sheets request.",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the JSON here, not stdout.")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    backends = args.backends.split(",")
+    unknown = set(backends) - set(BACKENDS)
+    if unknown:
+        parser.error(f"unknown backends: {', '.join(sorted(unknown))}")
+
+    mvp.cli.console = Console(file=open(os.devnull, "w"), width=120)
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            todos = generate_todos(size, seed=args.seed)
+            for step, seconds in bench_model(todos, args.repeat).items():
+                results.append({
+                    "backend": "model", "size": size, "step": step,
+                    "seconds": round(seconds, 6),
+                })
+            for name in backends:
+                for result in bench_backend(name, todos, args, workdir):
+                    results.append({"backend": name, "size": size, **result})
+
+    report = json.dumps({
+        "benchmark": "suite",
+        "python": platform.python_version(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "latency_s": args.latency,
+        "results": results,
+    }, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Cold start benchmark: time from launching run.py to the first menu.
+
+Each run starts a fresh interpreter that presses Enter on the welcome
+screen and stops as soon as the main menu would be drawn. The memory
+backend is used by default so the numbers measure the application, not
+the network; pass --backend sheets to include the Sheets connection.
+
+Usage:
+    python benchmarks/startup.py [--runs N] [--backend NAME]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DRIVER = """
+import sys, time
+import rich.console
+import simple_term_menu
+
+def first_menu(self, *args, **kwargs):
+    print(time.time())
+    sys.exit(0)
+
+rich.console.Console.input = lambda self, *args, **kwargs: ""
+simple_term_menu.TerminalMenu.__init__ = first_menu
+sys.argv = ["run.py"]
+import runpy
+runpy.run_path("run.py", run_name="__main__")
+"""
+
+
+def measure(backend: str) -> float:
+    """
+    Launch one cold start and return the seconds until the first menu.
+
+    Args:
+        backend (str): The backend passed via TODO_BACKEND.
+
+    Returns:
+        float: Elapsed wall time in seconds.
+    """
+    env = dict(os.environ, TODO_BACKEND=backend, TODO_SPLASH_DELAY="0")
+    start = time.time()
+    result = subprocess.run(
+        [sys.executable, "-c", DRIVER],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1]) - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--backend", default="memory")
+    args = parser.parse_args()
+
+    samples = [measure(args.backend) for _ in range(args.runs)]
+    print(json.dumps({
+        "benchmark": "startup_to_first_menu",
+        "backend": args.backend,
+        "runs": args.runs,
+        "min_s": round(min(samples), 4),
+        "median_s": round(statistics.median(samples), 4),
+        "max_s": round(max(samples), 4),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
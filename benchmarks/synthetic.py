@@ -0,0 +1,91 @@
+"""
+Synthetic todo generator for the benchmarks.
+
+Todos are drawn from fixed distributions that resemble a long-used
+task list: categories are skewed towards work, most todos were added in
+the last half year, about 60% are due within three months of being
+added, and about 40% are completed, a quarter of those with a due date
+after it had passed.
+A seed makes every run produce the same data.
+"""
+import random
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional
+
+from mvp.model import Todo
+
+CATEGORY_WEIGHTS = {
+    "Coding": 35,
+    "CI-Stuff": 20,
+    "Personal": 20,
+    "Study": 15,
+    "Errands": 10,
+}
+
+VERBS = [
+    "Write", "Review", "Fix", "Refactor", "Plan", "Buy", "Call", "Read",
+    "Book", "Clean", "Update", "Test", "Prepare", "Email", "Organize",
+]
+OBJECTS = [
+    "the release notes", "pull request", "flaky test", "groceries",
+    "the dentist", "chapter 4", "train tickets", "the garage",
+    "dependencies", "CI pipeline", "slides", "the landlord", "backlog",
+    "tax return", "the integration suite",
+]
+
+DUE_DATE_SHARE = 0.6
+COMPLETED_SHARE = 0.4
+LATE_SHARE = 0.25
+
+
+def generate_todos(
+    count: int, seed: int = 0, today: Optional[date] = None
+) -> List[Todo]:
+    """
+    Generate synthetic todos with task_ids and dense positions.
+
+    Args:
+        count (int): Number of todos.
+        seed (int): Seed of the random generator.
+        today (Optional[date]):
+        Reference date the dates are spread around. Defaults to today.
+
+    Returns:
+        List[Todo]: The todos, ordered by task_id.
+    """
+    rng = random.Random(seed)
+    today = today or date.today()
+    categories = list(CATEGORY_WEIGHTS)
+    weights = list(CATEGORY_WEIGHTS.values())
+    todos = []
+    for task_id in range(1, count + 1):
+        added = datetime.combine(
+            today - timedelta(days=rng.randint(0, 180)),
+            time(rng.randint(7, 22), rng.randint(0, 59)),
+        )
+        due = None
+        if rng.random() < DUE_DATE_SHARE:
+            due = added.date() + timedelta(days=rng.randint(0, 90))
+        completed = None
+        if rng.random() < COMPLETED_SHARE:
+            if due and rng.random() < LATE_SHARE:
+                done = due + timedelta(days=rng.randint(1, 14))
+            elif due:
+                done = added.date() + timedelta(
+                    days=rng.randint(0, (due - added.date()).days)
+                )
+            else:
+                done = added.date() + timedelta(days=rng.randint(0, 30))
+            completed = max(added, datetime.combine(
+                min(done, today), time(rng.randint(7, 22), rng.randint(0, 59))
+            ))
+        todos.append(Todo.trusted(
+            task_id,
+            f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} #{task_id}",
+            rng.choices(categories, weights)[0],
+            added.isoformat(),
+            due.isoformat() if due else "",
+            completed.isoformat() if completed else "",
+            task_id,
+        ))
+    return todos
@@ -1,3 +1,23 @@
-from .cli import TodoCLI
-from .google_sheets_db import TodoGoogleSheets
-from .model import Todo
\ No newline at end of file
+from importlib import import_module
+
+# Public names are imported on first access so that `import mvp` stays
+# cheap: rich, simple_term_menu and gspread are only loaded when needed.
+_EXPORTS = {
+    "TodoCLI": ".cli",
+    "TodoBackend": ".backend",
+    "create_backend": ".backend",
+    "TodoQuery": ".backend",
+    "TodoGoogleSheets": ".google_sheets_db",
+    "AsyncTodoGoogleSheets": ".async_sheets_db",
+    "TodoSQLite": ".sqlite_db",
+    "TodoMemory": ".memory_db",
+    "Todo": ".model",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'mvp' has no attribute '{name}'")
+    return getattr(import_module(_EXPORTS[name], __name__), name)
@@ -0,0 +1,190 @@
+import asyncio
+import time
+from typing import List, Dict, Any, Optional, Tuple
+from .backend import TodoQuery
+from .google_sheets_db import TodoGoogleSheets
+from .model import Todo
+
+
+class AsyncTodoGoogleSheets:
+    """
+    asyncio variant of the Google Sheets backend.
+
+    Wraps a TodoGoogleSheets instance and runs its blocking gspread calls
+    in worker threads, so independent requests run concurrently: the
+    tasks and categories worksheets are fetched at the same time, and a
+    caller can prefetch the next screen's data while it is busy with
+    the current one. Writes go through the wrapped backend, keeping its
+    snapshot, indexes and caches consistent.
+
+    Attributes:
+        sheets (TodoGoogleSheets): The wrapped synchronous backend.
+    """
+
+    display_name = "Google Sheets (async)"
+
+    def __init__(self, sheets: TodoGoogleSheets):
+        """
+        Initialize the AsyncTodoGoogleSheets class.
+
+        Args:
+            sheets (TodoGoogleSheets): The backend to wrap.
+        """
+        self.sheets = sheets
+        self._loading: Optional[asyncio.Task] = None
+
+    @classmethod
+    async def connect(cls, **kwargs) -> "AsyncTodoGoogleSheets":
+        """
+        Authorize and open the spreadsheet without blocking the loop.
+
+        Args:
+            **kwargs: Passed on to TodoGoogleSheets.
+
+        Returns:
+            AsyncTodoGoogleSheets: The connected backend.
+        """
+        return cls(await asyncio.to_thread(TodoGoogleSheets, **kwargs))
+
+    def _is_fresh(self) -> bool:
+        """Return True if the wrapped snapshot can be used as is."""
+        age = time.monotonic() - self.sheets._loaded_at
+        return self.sheets._todos is not None and age <= self.sheets.cache_ttl
+
+    async def load(self) -> None:
+        """
+        Fetch the snapshot, reading both worksheets concurrently.
+
+        The on-disk cache is still honoured: if the spreadsheet revision
+        is unchanged no worksheet is read at all. The change feed token
+        is only fetched on a cache miss, as the cache file stores its
+        own.
+        """
+        sheets = self.sheets
+        if sheets._buffer:
+            await asyncio.to_thread(sheets.commit)
+        revision = await asyncio.to_thread(sheets._remote_revision)
+        if revision is not None and sheets._read_cache_file(revision):
+            sheets._loaded_at = time.monotonic()
+            return
+
+        (change_token, records), categories = await asyncio.gather(
+            self._read_tasks(),
+            asyncio.to_thread(sheets.categories_worksheet.get_all_records),
+        )
+        sheets._install_categories(categories)
+        sheets._install_snapshot(records, revision, change_token)
+
+    async def _read_tasks(self) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+        """
+        Read the change feed token and then the tasks worksheet.
+
+        The token must be read before the records, so no change can
+        fall between the two.
+
+        Returns:
+            Tuple[Optional[str], List[Dict[str, Any]]]:
+            The change token and the task records.
+        """
+        sheets = self.sheets
+        change_token = await asyncio.to_thread(sheets._current_change_token)
+        records = await asyncio.to_thread(
+            sheets.tasks_worksheet.get_all_records
+        )
+        return change_token, records
+
+    async def _ensure_loaded(self) -> None:
+        """Load the snapshot unless it is fresh, sharing in-flight loads."""
+        if self._is_fresh():
+            return
+        if self._loading is None or self._loading.done():
+            if self.sheets._todos is None:
+                loader = self.load()
+            else:
+                # Expired: catch up from the change feed if possible.
+                loader = asyncio.to_thread(self.sheets._snapshot)
+            self._loading = asyncio.ensure_future(loader)
+        await asyncio.shield(self._loading)
+
+    def prefetch(self) -> asyncio.Task:
+        """
+        Start loading the snapshot in the background.
+
+        Returns:
+            asyncio.Task: The load task; later reads wait for it.
+        """
+        return asyncio.ensure_future(self._ensure_loaded())
+
+    async def get_all_todos(self) -> List[Todo]:
+        """Retrieve all todos, loading the snapshot if needed."""
+        await self._ensure_loaded()
+        return self.sheets.get_all_todos()
+
+    async def get_all_categories(self) -> List[Dict[str, Any]]:
+        """Get all categories, loading the snapshot if needed."""
+        await self._ensure_loaded()
+        return self.sheets.get_all_categories()
+
+    async def get_todos_by_category(self, category: str) -> List[Todo]:
+        """Get all todos for a specific category."""
+        await self._ensure_loaded()
+        return self.sheets.get_todos_by_category(category)
+
+    async def get_overdue_todos(self) -> List[Todo]:
+        """Get all overdue todos."""
+        await self._ensure_loaded()
+        return self.sheets.get_overdue_todos()
+
+    async def find_todos(self, query: TodoQuery) -> List[Todo]:
+        """Return the todos matching a query."""
+        await self._ensure_loaded()
+        return self.sheets.find_todos(query)
+
+    async def insert_todo(self, todo: Todo) -> int:
+        """
+        Insert a new todo.
+
+        The id, category and position lookups that used to be three
+        sequential reads are all served by the concurrently loaded
+        snapshot, leaving only the append request.
+        """
+        await self._ensure_loaded()
+        return await asyncio.to_thread(self.sheets.insert_todo, todo)
+
+    async def update_todo(
+        self,
+        task_id: int,
+        task: Optional[str] = None,
+        category: Optional[str] = None,
+        due_date: Optional[str] = None,
+    ) -> None:
+        """Update a todo's task, category, and/or due date."""
+        await self._ensure_loaded()
+        await asyncio.to_thread(
+            self.sheets.update_todo, task_id, task, category, due_date
+        )
+
+    async def complete_todo(
+        self, task_id: int, date_completed: Optional[str] = None
+    ) -> None:
+        """Mark a todo as completed, by default as of now."""
+        await self._ensure_loaded()
+        await asyncio.to_thread(
+            self.sheets.complete_todo, task_id, date_completed
+        )
+
+    async def delete_todo(self, task_id: int) -> None:
+        """Delete a todo."""
+        await self._ensure_loaded()
+        await asyncio.to_thread(self.sheets.delete_todo, task_id)
+
+    async def reorder_todo(self, task_id: int, new_position: int) -> None:
+        """Change the position of a todo."""
+        await self._ensure_loaded()
+        await asyncio.to_thread(
+            self.sheets.reorder_todo, task_id, new_position
+        )
+
+    async def close(self) -> None:
+        """Persist the snapshot via the wrapped backend."""
+        await asyncio.to_thread(self.sheets.close)
@@ -0,0 +1,372 @@
+import os
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from concurrent.futures import Future
+from importlib import import_module
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+from datetime import date, datetime
+from .model import Todo
+from .tracing import traced
+
+DEFAULT_CATEGORIES = ["Coding", "CI-Stuff", "Personal", "Study", "Errands"]
+
+BACKENDS = {
+    "sheets": "mvp.google_sheets_db:TodoGoogleSheets",
+    "sqlite": "mvp.sqlite_db:TodoSQLite",
+    "memory": "mvp.memory_db:TodoMemory",
+    "replica": "mvp.replica:TodoReplica",
+}
+
+# Backend methods whose calls are logged as spans, see TodoBackend.
+TRACED_METHODS = (
+    "get_all_todos",
+    "get_all_categories",
+    "get_todos_by_category",
+    "get_overdue_todos",
+    "find_todos",
+    "get_changes_since",
+    "insert_todo",
+    "insert_todos",
+    "update_todo",
+    "delete_todo",
+    "complete_todo",
+    "reorder_todo",
+    "add_category",
+    "close",
+)
+
+
+@dataclass
+class ChangeSet:
+    """
+    Todos changed since a change token, see get_changes_since().
+
+    Attributes:
+        todos (List[Todo]):
+        Added or modified todos, in their latest state.
+        deleted (List[int]):
+        The task_ids of deleted todos.
+        token (Optional[str]):
+        Token to pass to the next get_changes_since() call.
+        full (bool):
+        True if todos holds every todo rather than only the changed
+        ones, e.g. because the old token was unknown or expired; todos
+        missing from it have been deleted.
+    """
+
+    todos: List[Todo]
+    deleted: List[int] = field(default_factory=list)
+    token: Optional[str] = None
+    full: bool = False
+
+
+@dataclass(frozen=True)
+class TodoQuery:
+    """
+    Filter for find_todos(); fields left as None do not filter.
+
+    Attributes:
+        category (Optional[str]):
+        Only todos in this category.
+        status (Optional[str]):
+        Only "open" or "completed" todos.
+        due_after (Optional[date]):
+        Only todos due on or after this date.
+        due_before (Optional[date]):
+        Only todos due before this date. Todos without a due date never
+        match a due date bound.
+        text (Optional[str]):
+        Only todos whose task contains this text, ignoring case.
+    """
+
+    category: Optional[str] = None
+    status: Optional[str] = None
+    due_after: Optional[date] = None
+    due_before: Optional[date] = None
+    text: Optional[str] = None
+
+    def __post_init__(self):
+        if self.status not in (None, "open", "completed"):
+            raise ValueError(
+                f"status must be 'open' or 'completed', not {self.status!r}"
+            )
+
+    @classmethod
+    def overdue(cls, today: Optional[date] = None) -> "TodoQuery":
+        """
+        Return the query for open todos that were due before a date.
+
+        Args:
+            today (Optional[date]):
+            The reference date. Defaults to the current date.
+
+        Returns:
+            TodoQuery: The query.
+        """
+        return cls(
+            status="open", due_before=today or datetime.now().date()
+        )
+
+    def matches(self, todo: Todo) -> bool:
+        """
+        Check whether a todo passes the filter.
+
+        Args:
+            todo (Todo): The todo to check.
+
+        Returns:
+            bool: True if the todo matches every given field.
+        """
+        if self.category is not None and todo.category != self.category:
+            return False
+        if self.status is not None:
+            if bool(todo.date_completed) != (self.status == "completed"):
+                return False
+        if self.due_after is not None or self.due_before is not None:
+            due = todo.due
+            if due is None:
+                return False
+            if self.due_after is not None and due < self.due_after:
+                return False
+            if self.due_before is not None and due >= self.due_before:
+                return False
+        if self.text is not None:
+            return self.text.lower() in todo.task.lower()
+        return True
+
+
+class TodoBackend(ABC):
+    """
+    Abstract base class for Todo storage backends.
+
+    TodoCLI only talks to its backend through these methods, so new
+    storage engines can be added to BACKENDS without touching the CLI.
+    The TRACED_METHODS a subclass defines are wrapped so that their
+    timings go to the span tracer log.
+
+    Attributes:
+        display_name (str):
+        Human readable backend name shown when the CLI connects.
+        metrics (Optional[RequestMetrics]):
+        Remote request counters of backends that talk to a remote
+        service, None for local ones.
+    """
+
+    display_name = "storage backend"
+    metrics = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in TRACED_METHODS:
+            if name in cls.__dict__:
+                setattr(cls, name, traced(f"{cls.__name__}.{name}")(
+                    cls.__dict__[name]
+                ))
+
+    @abstractmethod
+    def get_all_todos(self) -> List[Todo]:
+        """Retrieve all todos."""
+
+    @abstractmethod
+    def insert_todo(self, todo: Todo) -> int:
+        """Insert a new todo and return its task_id."""
+
+    @abstractmethod
+    def update_todo(
+        self,
+        task_id: int,
+        task: Optional[str] = None,
+        category: Optional[str] = None,
+        due_date: Optional[str] = None,
+    ) -> None:
+        """Update a todo's task, category, and/or due date."""
+
+    @abstractmethod
+    def delete_todo(self, task_id: int) -> None:
+        """Delete a todo."""
+
+    @abstractmethod
+    def complete_todo(
+        self, task_id: int, date_completed: Optional[str] = None
+    ) -> None:
+        """
+        Mark a todo as completed.
+
+        Args:
+            task_id (int): The id of the todo.
+            date_completed (Optional[str]):
+            When it was completed, e.g. when a replica replays an offline
+            completion. Defaults to now.
+        """
+
+    @abstractmethod
+    def reorder_todo(self, task_id: int, new_position: int) -> None:
+        """Change the position of a todo."""
+
+    @abstractmethod
+    def get_category_id(self, category_name: str) -> int:
+        """Get the category_id for a given category name."""
+
+    @abstractmethod
+    def add_category(self, category_name: str) -> None:
+        """Add a new category."""
+
+    @abstractmethod
+    def get_all_categories(self) -> List[Dict[str, Any]]:
+        """Get all categories."""
+
+    def iter_todos(self) -> Iterator[Todo]:
+        """
+        Stream all todos.
+
+        Backends override this when they can page through their storage
+        instead of loading every todo at once.
+
+        Yields:
+            Todo: The todos in storage order.
+        """
+        yield from self.get_all_todos()
+
+    def insert_todos(self, todos: Iterable[Todo]) -> int:
+        """
+        Bulk insert todos, creating missing categories on the way.
+
+        Backends override this when they can write in fewer requests.
+
+        Args:
+            todos (Iterable[Todo]): The todos to insert.
+
+        Returns:
+            int: The number of inserted todos.
+        """
+        known = {
+            category["category_name"]
+            for category in self.get_all_categories()
+        }
+        count = 0
+        for todo in todos:
+            if todo.category not in known:
+                self.add_category(todo.category)
+                known.add(todo.category)
+            self.insert_todo(todo)
+            count += 1
+        return count
+
+    def close(self) -> None:
+        """Release resources and flush pending work. No-op by default."""
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Group several writes into one unit of work.
+
+        Backends that can defer and merge writes override this; by
+        default every write is sent immediately.
+
+        Yields:
+            None
+        """
+        yield
+
+    def get_changes_since(self, token: Optional[str] = None) -> ChangeSet:
+        """
+        Return the todos changed since a previous call.
+
+        Backends that track changes override this to transfer only what
+        changed; by default every call returns the full state.
+
+        Args:
+            token (Optional[str]):
+            The token of the previous ChangeSet, or None for everything.
+
+        Returns:
+            ChangeSet: The changes and the token for the next call.
+        """
+        return ChangeSet(todos=self.get_all_todos(), full=True)
+
+    def find_todos(self, query: TodoQuery) -> List[Todo]:
+        """
+        Return the todos matching a query.
+
+        Backends override this to evaluate the query where the todos
+        are stored, e.g. in SQL, so that only matching todos are read
+        and decoded; by default all todos are filtered in Python.
+
+        Args:
+            query (TodoQuery): The filter.
+
+        Returns:
+            List[Todo]: The matching todos ordered by task_id.
+        """
+        return sorted(
+            (todo for todo in self.get_all_todos() if query.matches(todo)),
+            key=lambda todo: todo.task_id,
+        )
+
+    def get_todos_by_category(self, category: str) -> List[Todo]:
+        """Get all todos for a specific category."""
+        return self.find_todos(TodoQuery(category=category))
+
+    def get_overdue_todos(self) -> List[Todo]:
+        """Get all overdue todos."""
+        return self.find_todos(TodoQuery.overdue())
+
+
+def create_backend(name: Optional[str] = None, **kwargs) -> TodoBackend:
+    """
+    Create a storage backend by name.
+
+    Backend modules are imported on demand, so unused backends and
+    their dependencies are never loaded.
+
+    Args:
+        name (Optional[str]):
+        A key of BACKENDS. Defaults to the TODO_BACKEND environment
+        variable or "sheets".
+        **kwargs: Passed on to the backend constructor.
+
+    Returns:
+        TodoBackend: The new backend instance.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    if name is None:
+        name = os.environ.get("TODO_BACKEND", "sheets")
+    try:
+        module_name, class_name = BACKENDS[name].split(":")
+    except KeyError:
+        raise ValueError(
+            f"Unknown backend '{name}'. "
+            f"Choose one of: {', '.join(BACKENDS)}"
+        )
+    backend_class = getattr(import_module(module_name), class_name)
+    return backend_class(**kwargs)
+
+
+def connect_in_background(name: Optional[str] = None, **kwargs) -> Future:
+    """
+    Create a backend on a daemon thread.
+
+    This lets slow connections, such as Google Sheets authorization,
+    run while the welcome screen is shown.
+
+    Args:
+        name (Optional[str]): Passed on to create_backend().
+        **kwargs: Passed on to create_backend().
+
+    Returns:
+        Future: Resolves to the backend, or raises its creation error.
+    """
+    future: Future = Future()
+
+    def connect():
+        try:
+            future.set_result(create_backend(name, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=connect, name="todo-connect", daemon=True).start()
+    return future
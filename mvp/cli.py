@@ -1,24 +1,52 @@
-from typing import List, Optional
+from concurrent.futures import Future
+from typing import Callable, List, Optional
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from simple_term_menu import TerminalMenu
 from .model import Todo
-from .google_sheets_db import TodoGoogleSheets
+from .backend import TodoQuery, create_backend
+from .prefetch import Prefetcher
+from .profiling import ActionProfiler
+from .stats import compute_statistics
+from .tracing import get_tracer
 from datetime import datetime, date
+import os
 import sys
 import time
-from gspread.exceptions import SpreadsheetNotFound
 
 console = Console()
 
 MAX_INPUT_LENGTH = 50
 
+# Menu actions that write to the backend; prefetched data is dropped
+# after them.
+MUTATING_ACTIONS = {"add_todo", "update_todo", "complete_todo", "delete_todo"}
+
+
+def is_spreadsheet_not_found(error: Exception) -> bool:
+    """
+    Check whether an error is gspread's SpreadsheetNotFound.
+
+    gspread is only imported by the Google Sheets backend, so if it has
+    not been loaded the error cannot be one of its exceptions.
+
+    Args:
+        error (Exception): The error to check.
+
+    Returns:
+        bool: True if the error is a SpreadsheetNotFound.
+    """
+    exceptions = sys.modules.get("gspread.exceptions")
+    return exceptions is not None and isinstance(
+        error, exceptions.SpreadsheetNotFound
+    )
+
 
 class TodoCLI:
     """
     A command-line interface for managing todos
-    using Google Sheets as a backend.
+    using Google Sheets or another storage backend.
 
     This class provides methods for adding, viewing, updating, completing,
     and deleting todos, as well as displaying statistics. It uses Rich for
@@ -28,8 +56,14 @@ class TodoCLI:
         menu_items (dict):
         A dictionary containing menu options for different actions.
 
-        gs (TodoGoogleSheets):
-        An instance of TodoGoogleSheets for database operations.
+        gs (TodoBackend):
+        The storage backend used for database operations.
+
+        prefetcher (Prefetcher):
+        Loads todos and categories while the main menu is shown.
+
+        profiler (Optional[ActionProfiler]):
+        Profiles each menu action, if profiling is enabled.
 
     Raises:
         SpreadsheetNotFound:
@@ -37,13 +71,33 @@ class TodoCLI:
 
         Exception: For other unexpected errors during initialization.
     """
-    def __init__(self):
+    def __init__(
+        self,
+        backend: Optional[str] = None,
+        connection: Optional[Future] = None,
+        splash_delay: Optional[float] = None,
+        profiler: Optional[ActionProfiler] = None,
+    ):
         """
-        Initialize the TodoCLI with menu items and Google Sheets integration.
+        Initialize the TodoCLI with menu items and a storage backend.
 
         This method sets up the menu structure and establishes a connection
-        to Google Sheets. It handles potential errors during initialization
-        and provides appropriate feedback to the user.
+        to the configured backend. It handles potential errors during
+        initialization and provides appropriate feedback to the user.
+
+        Args:
+            backend (Optional[str]):
+            Name of the storage backend, e.g. "sheets", "sqlite" or
+            "memory". Defaults to the TODO_BACKEND environment variable
+            or "sheets".
+            connection (Optional[Future]):
+            A backend already being created in the background, see
+            connect_in_background(). Takes precedence over backend.
+            splash_delay (Optional[float]):
+            Seconds to show the connection message for. Defaults to the
+            TODO_SPLASH_DELAY environment variable or 0.
+            profiler (Optional[ActionProfiler]):
+            Profiles every menu action when given, see --profile.
 
         Raises:
             SpreadsheetNotFound:
@@ -64,9 +118,18 @@ class TodoCLI:
             ],
             "confirm": ["Yes", "No"],
         }
+        self.prefetcher = Prefetcher()
+        self.profiler = profiler
+        if splash_delay is None:
+            splash_delay = float(os.environ.get("TODO_SPLASH_DELAY", 0))
         try:
-            self.gs = TodoGoogleSheets()
-        except SpreadsheetNotFound as e:
+            if connection is not None:
+                self.gs = connection.result()
+            else:
+                self.gs = create_backend(backend)
+        except Exception as e:
+            if not is_spreadsheet_not_found(e):
+                self._exit_with_error(e)
             console.print(
                 Panel.fit(
                     f"[bold red]Error:[/bold red] {str(e)}\n\n"
@@ -85,34 +148,44 @@ class TodoCLI:
                 )
             )
             sys.exit(1)
-        except Exception as e:
-            console.print(
-                Panel.fit(
-                    f"[bold red]An unexpected error"
-                    f"occurred:[/bold red]\n{str(e)}\n\n"
-                    "This could be due to:\n"
-                    "1. Network connectivity issues\n"
-                    "2. Invalid or expired Google API credentials\n"
-                    "3. Insufficient permissions\n\n"
-                    "Please check your internet connection"
-                    "and configuration.\n"
-                    "If the problem persists, please contact"
-                    "the system administrator.",
-                    title="Initialization Error",
-                    border_style="red",
-                )
-            )
-            sys.exit(1)
 
         console.print(
             Panel.fit(
-                "[green]Successfully connected to Google Sheets![/green]\n"
+                f"[green]Successfully connected to {self.gs.display_name}!"
+                "[/green]\n"
                 "You can now start managing your tasks.",
                 title="Initialization Complete",
                 border_style="green",
             )
         )
-        time.sleep(3)
+        if splash_delay > 0:
+            time.sleep(splash_delay)
+
+    @staticmethod
+    def _exit_with_error(e: Exception) -> None:
+        """
+        Report an unexpected initialization error and exit.
+
+        Args:
+            e (Exception): The error raised while connecting.
+        """
+        console.print(
+            Panel.fit(
+                f"[bold red]An unexpected error"
+                f"occurred:[/bold red]\n{str(e)}\n\n"
+                "This could be due to:\n"
+                "1. Network connectivity issues\n"
+                "2. Invalid or expired Google API credentials\n"
+                "3. Insufficient permissions\n\n"
+                "Please check your internet connection"
+                "and configuration.\n"
+                "If the problem persists, please contact"
+                "the system administrator.",
+                title="Initialization Error",
+                border_style="red",
+            )
+        )
+        sys.exit(1)
 
     def display_menu(self, menu_type: str, title: str) -> int:
         """
@@ -202,7 +275,9 @@ class TodoCLI:
             Optional[str]:
             The selected category name or None if no selection was made.
         """
-        categories = self.gs.get_all_categories()
+        categories = self.prefetcher.get(
+            "categories", self.gs.get_all_categories
+        )
         options = [category["category_name"] for category in categories]
         menu = TerminalMenu(
             options,
@@ -284,7 +359,7 @@ class TodoCLI:
             For any unexpected errors during the retrieval or display process.
         """
         try:
-            tasks = self.gs.get_all_todos()
+            tasks = self.prefetcher.get("todos", self.gs.get_all_todos)
             if not tasks:
                 console.print("\n[bold yellow]No To-Do's found.[/bold yellow]")
                 return
@@ -297,26 +372,20 @@ class TodoCLI:
             table.add_column("Due Date", min_width=10, justify="center")
             table.add_column("Completed", min_width=10, justify="center")
 
+            today = date.today()
             for task in tasks:
                 c = self.get_category_color(task.category)
-                due_date = (
-                    datetime.fromisoformat(task.due_date).date()
-                    if task.due_date
-                    else None
-                )
+                due_date = task.due
                 due_date_str = due_date.isoformat() if due_date else "-"
 
                 # Determine the status and color for the 'Completed' column
                 if task.date_completed:
-                    completion_date = (
-                        datetime.fromisoformat(task.date_completed).date()
-                    )
-                    status = completion_date.isoformat()
-                    if due_date and completion_date > due_date:
+                    status = task.completed_on.isoformat()
+                    if task.completed_late:
                         status_color = "red"  # Completed late
                     else:
                         status_color = "green"  # Completed on time or early
-                elif due_date and due_date < datetime.now().date():
+                elif task.is_overdue(today):
                     status = "OVERDUE"
                     status_color = "red"
                 else:
@@ -362,7 +431,7 @@ class TodoCLI:
             Exception: For any unexpected errors during the update process.
         """
         try:
-            todos = self.gs.get_all_todos()
+            todos = self.prefetcher.get("todos", self.gs.get_all_todos)
             if not todos:
                 console.print("\n[bold yellow]No todos found.[/bold yellow]")
                 return
@@ -412,10 +481,7 @@ class TodoCLI:
             For any unexpected errors during the completion process.
         """
         try:
-            todos = [
-                todo for todo in self.gs.get_all_todos()
-                if not todo.date_completed
-            ]
+            todos = self.gs.find_todos(TodoQuery(status="open"))
             if not todos:
                 console.print(
                     "\n[bold yellow]No incomplete todos found.[/bold yellow]"
@@ -461,7 +527,7 @@ class TodoCLI:
             For any unexpected errors during the deletion process.
         """
         try:
-            todos = self.gs.get_all_todos()
+            todos = self.prefetcher.get("todos", self.gs.get_all_todos)
             if not todos:
                 console.print("\n[bold yellow]No todos found.[/bold yellow]")
                 return
@@ -506,31 +572,18 @@ class TodoCLI:
             statistics calculation or display process.
         """
         try:
-            todos = self.gs.get_all_todos()
-            total_todos = len(todos)
-            completed_todos = sum(1 for todo in todos if todo.date_completed)
-            overdue_todos = sum(
-                1 for todo in todos
-                if not todo.date_completed
-                and todo.due_date
-                and datetime.fromisoformat(todo.due_date).date()
-                < datetime.now().date()
+            stats = compute_statistics(
+                self.prefetcher.get("todos", self.gs.get_all_todos)
             )
 
-            categories = set(todo.category for todo in todos)
-            category_stats = {
-                category: sum(1 for todo in todos if todo.category == category)
-                for category in categories
-            }
-
             console.print(Panel.fit(
                 "\n[bold]Todo Statistics[/bold]", style="cyan")
             )
-            console.print(f"Total Todos: {total_todos}")
-            console.print(f"Completed Todos: {completed_todos}")
-            console.print(f"Overdue Todos: {overdue_todos}")
+            console.print(f"Total Todos: {stats['total']}")
+            console.print(f"Completed Todos: {stats['completed']}")
+            console.print(f"Overdue Todos: {stats['overdue']}")
             console.print("\nTodos by Category:")
-            for category, count in category_stats.items():
+            for category, count in stats["by_category"].items():
                 console.print(f"  {category}: {count}")
 
         except Exception as e:
@@ -678,6 +731,38 @@ class TodoCLI:
         }
         return colors.get(category, "white")
 
+    def prefetch_menu_data(self) -> None:
+        """
+        Start loading the todos and categories the next action needs.
+
+        Called whenever the main menu is drawn, so the backend reads
+        overlap with the user choosing an action.
+        """
+        self.prefetcher.prefetch("todos", self.gs.get_all_todos)
+        self.prefetcher.prefetch("categories", self.gs.get_all_categories)
+
+    def run_action(self, action: Callable[[], None]) -> None:
+        """
+        Run a menu action as a traced span, profiling it if enabled.
+
+        Prefetched values left over from a mutating action are
+        discarded, as they were loaded before its write.
+
+        Args:
+            action (Callable[[], None]): The action, e.g. self.add_todo.
+        """
+        name = action.__name__
+        try:
+            with get_tracer().span(f"cli.{name}"):
+                if self.profiler is None:
+                    action()
+                else:
+                    with self.profiler.profile(name):
+                        action()
+        finally:
+            if name in MUTATING_ACTIONS:
+                self.prefetcher.discard()
+
     def run(self):
         """
         Run the main CLI loop.
@@ -691,27 +776,28 @@ class TodoCLI:
         and deleting todos, as well as showing statistics.
         """
         while True:
+            self.prefetch_menu_data()
             choice = self.display_menu(
                 "main", "\nUse arrow keys to navigate, Enter to select"
             )
-            if choice == 0:
-                self.add_todo()
-            elif choice == 1:
-                self.show_todos()
-            elif choice == 2:
-                self.update_todo()
-            elif choice == 3:
-                self.complete_todo()
-            elif choice == 4:
-                self.delete_todo()
-            elif choice == 5:
-                self.show_statistics()
+            actions = [
+                self.add_todo,
+                self.show_todos,
+                self.update_todo,
+                self.complete_todo,
+                self.delete_todo,
+                self.show_statistics,
+            ]
+            if choice is not None and choice < len(actions):
+                self.run_action(actions[choice])
             elif choice == 7 or choice is None:
                 if self.confirm_action("\nAre you sure you want to exit?"):
                     console.print(
                         "\n[bold green]Thank you for using Task Tracker CLI. "
                         "Goodbye![/bold green]"
                     )
+                    self.prefetcher.shutdown()
+                    self.gs.close()
                     break
 
             console.input("\nPress Enter to continue...")
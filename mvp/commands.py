@@ -0,0 +1,335 @@
+import json
+import os
+from datetime import datetime
+from typing import Any, Callable, Optional
+import click
+from .backend import BACKENDS, TodoBackend, TodoQuery, create_backend
+from .model import Todo
+from .stats import compute_statistics
+from .tracing import get_tracer
+from .transfer import (
+    EXPORT_EXTENSIONS,
+    EXPORT_FORMATS,
+    export_record,
+    read_todos,
+    write_todos,
+)
+
+json_option = click.option(
+    "--json", "as_json", is_flag=True, help="Print machine-readable JSON."
+)
+
+due_date_option = click.option(
+    "--due",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    help="Due date as YYYY-MM-DD.",
+)
+
+
+def get_backend(ctx: click.Context) -> TodoBackend:
+    """
+    Create the selected backend once per invocation and close it on exit.
+
+    Args:
+        ctx (click.Context): The current click context.
+
+    Returns:
+        TodoBackend: The backend for this invocation.
+    """
+    root = ctx.find_root()
+    if "gs" not in root.obj:
+        backend = create_backend(root.obj["backend"])
+        root.obj["gs"] = backend
+        if root.obj.get("stats"):
+            # Registered first so it runs after close(), whose final
+            # commit is part of the cost.
+            root.call_on_close(lambda: echo_metrics(backend))
+        root.call_on_close(backend.close)
+    return root.obj["gs"]
+
+
+def echo_metrics(backend: TodoBackend) -> None:
+    """
+    Print a backend's remote request metrics to stderr.
+
+    Args:
+        backend (TodoBackend): The backend whose requests to report.
+    """
+    if backend.metrics is None:
+        click.echo("No remote requests were made.", err=True)
+    else:
+        click.echo(backend.metrics.report(), err=True)
+
+
+def run_action(action: Callable[[], Any]) -> Any:
+    """
+    Run a backend action, turning ValueError into a CLI error.
+
+    Args:
+        action (Callable[[], Any]): The action to run.
+
+    Returns:
+        Any: The action's result.
+    """
+    try:
+        return action()
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+
+def echo_result(as_json: bool, data: Any, message: str) -> None:
+    """
+    Print a command result as JSON or as a human readable message.
+
+    Args:
+        as_json (bool): Whether to print JSON.
+        data (Any): The JSON-serializable result.
+        message (str): The message printed without --json.
+    """
+    if as_json:
+        click.echo(json.dumps(data))
+    else:
+        click.echo(message)
+
+
+@click.group(invoke_without_command=True)
+@click.option(
+    "--backend",
+    type=click.Choice(sorted(BACKENDS)),
+    help="Storage backend (default: $TODO_BACKEND or sheets).",
+)
+@click.option(
+    "--stats",
+    is_flag=True,
+    help="Print remote requests, bytes and time per operation on exit.",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Write cProfile and collapsed-stack reports for each action to "
+    "$TODO_PROFILE_DIR (default: ~/.cache/task_tracker/profiles).",
+)
+@click.pass_context
+def cli(ctx: click.Context, backend: str, stats: bool, profile: bool) -> None:
+    """
+    Task Tracker CLI.
+
+    Run without a command to start the interactive menu.
+    """
+    ctx.ensure_object(dict)
+    ctx.obj["backend"] = backend
+    ctx.obj["stats"] = stats
+    if ctx.invoked_subcommand is None:
+        interactive = ctx.obj.get("interactive")
+        if interactive is None:
+            click.echo(ctx.get_help())
+        else:
+            interactive(backend, show_stats=stats, profile=profile)
+        return
+    # Entered before the backend exists, so both also cover close().
+    ctx.with_resource(get_tracer().span(f"cli.{ctx.invoked_subcommand}"))
+    if profile:
+        from .profiling import ActionProfiler
+
+        ctx.with_resource(
+            ActionProfiler().profile(ctx.invoked_subcommand)
+        )
+
+
+@cli.command("import")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@json_option
+@click.pass_context
+def import_todos(ctx: click.Context, path: str, as_json: bool) -> None:
+    """Bulk import todos from a .csv, .json or .jsonl file."""
+    backend = get_backend(ctx)
+    count = run_action(lambda: backend.insert_todos(read_todos(path)))
+    echo_result(as_json, {"imported": count}, f"Imported {count} todos.")
+
+
+@cli.command("export")
+@click.argument("path", type=click.Path(dir_okay=False, allow_dash=True))
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(EXPORT_FORMATS),
+    help="Output format (default: from the file extension, or jsonl).",
+)
+@click.pass_context
+def export_todos(ctx: click.Context, path: str, fmt: str) -> None:
+    """Stream all todos to a file, or to stdout with PATH '-'."""
+    if fmt is None:
+        extension = os.path.splitext(path)[1]
+        fmt = EXPORT_EXTENSIONS.get(extension, "jsonl")
+    backend = get_backend(ctx)
+    with click.open_file(path, "w", encoding="utf-8") as f:
+        count = write_todos(backend.iter_todos(), f, fmt)
+    click.echo(f"Exported {count} todos.", err=True)
+
+
+@cli.command("add")
+@click.argument("task")
+@click.option("--category", "-c", required=True, help="Category name.")
+@due_date_option
+@json_option
+@click.pass_context
+def add_todo(
+    ctx: click.Context,
+    task: str,
+    category: str,
+    due: Optional[datetime],
+    as_json: bool,
+) -> None:
+    """Add a new todo."""
+    todo = Todo(
+        task=task,
+        category=category,
+        due_date=due.date().isoformat() if due else None,
+    )
+    task_id = run_action(lambda: get_backend(ctx).insert_todo(todo))
+    echo_result(as_json, {"task_id": task_id}, f"Added todo {task_id}.")
+
+
+@cli.command("list")
+@click.option("--category", "-c", help="Only todos in this category.")
+@click.option(
+    "--status",
+    type=click.Choice(["open", "completed"]),
+    help="Only open or completed todos.",
+)
+@click.option("--overdue", is_flag=True, help="Only overdue todos.")
+@json_option
+@click.pass_context
+def list_todos(
+    ctx: click.Context,
+    category: Optional[str],
+    status: Optional[str],
+    overdue: bool,
+    as_json: bool,
+) -> None:
+    """List todos."""
+    if overdue:
+        if status == "completed":
+            raise click.UsageError("--overdue only lists open todos.")
+        status = "open"
+    backend = get_backend(ctx)
+    todos = backend.find_todos(TodoQuery(
+        category=category,
+        status=status,
+        due_before=datetime.now().date() if overdue else None,
+    ))
+    if as_json:
+        click.echo(json.dumps([export_record(todo) for todo in todos]))
+        return
+    for todo in todos:
+        due = f", due {todo.due_date[:10]}" if todo.due_date else ""
+        click.echo(
+            f"{todo.task_id:>4}  [{todo.status:<9}] {todo.task} "
+            f"({todo.category}{due})"
+        )
+
+
+@cli.command("update")
+@click.argument("task_id", type=int)
+@click.option("--task", "-t", help="New task description.")
+@click.option("--category", "-c", help="New category name.")
+@due_date_option
+@json_option
+@click.pass_context
+def update_todo(
+    ctx: click.Context,
+    task_id: int,
+    task: Optional[str],
+    category: Optional[str],
+    due: Optional[datetime],
+    as_json: bool,
+) -> None:
+    """Update a todo's task, category and/or due date."""
+    due_date = due.date().isoformat() if due else None
+    run_action(
+        lambda: get_backend(ctx).update_todo(
+            task_id, task, category, due_date
+        )
+    )
+    echo_result(as_json, {"task_id": task_id}, f"Updated todo {task_id}.")
+
+
+@cli.command("complete")
+@click.argument("task_id", type=int)
+@json_option
+@click.pass_context
+def complete_todo(ctx: click.Context, task_id: int, as_json: bool) -> None:
+    """Mark a todo as completed."""
+    run_action(lambda: get_backend(ctx).complete_todo(task_id))
+    echo_result(
+        as_json, {"task_id": task_id}, f"Completed todo {task_id}."
+    )
+
+
+@cli.command("delete")
+@click.argument("task_id", type=int)
+@json_option
+@click.pass_context
+def delete_todo(ctx: click.Context, task_id: int, as_json: bool) -> None:
+    """Delete a todo."""
+    run_action(lambda: get_backend(ctx).delete_todo(task_id))
+    echo_result(as_json, {"task_id": task_id}, f"Deleted todo {task_id}.")
+
+
+@cli.command("reorder")
+@click.argument("task_id", type=int)
+@click.argument("position", type=int)
+@json_option
+@click.pass_context
+def reorder_todo(
+    ctx: click.Context, task_id: int, position: int, as_json: bool
+) -> None:
+    """Move a todo to a new position."""
+    run_action(lambda: get_backend(ctx).reorder_todo(task_id, position))
+    echo_result(
+        as_json,
+        {"task_id": task_id, "position": position},
+        f"Moved todo {task_id} to position {position}.",
+    )
+
+
+@cli.command("migrate-positions")
+@click.option(
+    "--gap",
+    type=click.IntRange(min=1),
+    help="Spacing between positions (default: 1024); 1 makes them dense.",
+)
+@json_option
+@click.pass_context
+def migrate_positions(
+    ctx: click.Context, gap: Optional[int], as_json: bool
+) -> None:
+    """Respace positions so that moves and deletes write a single row."""
+    backend = get_backend(ctx)
+    if not hasattr(backend, "migrate_positions"):
+        raise click.ClickException(
+            f"Positions in {backend.display_name} are always dense."
+        )
+    kwargs = {} if gap is None else {"position_gap": gap}
+    run_action(lambda: backend.migrate_positions(**kwargs))
+    gap = backend.position_gap
+    echo_result(
+        as_json, {"position_gap": gap}, f"Positions respaced by {gap}."
+    )
+
+
+@cli.command("stats")
+@json_option
+@click.pass_context
+def show_statistics(ctx: click.Context, as_json: bool) -> None:
+    """Show todo statistics."""
+    stats = compute_statistics(get_backend(ctx).get_all_todos())
+    if as_json:
+        click.echo(json.dumps(stats))
+        return
+    click.echo(f"Total Todos: {stats['total']}")
+    click.echo(f"Completed Todos: {stats['completed']}")
+    click.echo(f"Overdue Todos: {stats['overdue']}")
+    click.echo("Todos by Category:")
+    for category, count in stats["by_category"].items():
+        click.echo(f"  {category}: {count}")
@@ -0,0 +1,687 @@
+import json
+import re
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlencode, urlsplit
+import gspread
+import requests
+from gspread.utils import a1_to_rowcol, rowcol_to_a1
+from requests.structures import CaseInsensitiveDict
+
+SHEETS_PREFIX = "/v4/spreadsheets"
+DRIVE_PREFIX = "/drive/v3/files"
+DEFAULT_ROWS = 1000
+DEFAULT_COLS = 26
+
+_RANGE = re.compile(r"^(?:'((?:[^']|'')+)'|([^!']+))(?:!(.+))?$")
+_CELLS = re.compile(r"^([A-Z]*)(\d*)(?::([A-Z]*)(\d*))?$")
+_TITLE_QUERY = re.compile(r'name = "((?:[^"\\]|\\.)*)"')
+
+
+class FakeSheetsError(Exception):
+    """An error response of the fake server."""
+
+    def __init__(self, code: int, message: str, status: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.status = status
+
+
+@dataclass
+class FakeRequest:
+    """
+    A request served by FakeSheetsServer.
+
+    Attributes:
+        method (str): The HTTP method, e.g. "GET".
+        operation (str): The API method called, e.g. "values.get".
+        status (int): The HTTP status of the response.
+        request_bytes (int): Size of the URL, query and JSON body.
+        response_bytes (int): Size of the JSON response body.
+    """
+
+    method: str
+    operation: str
+    status: int
+    request_bytes: int
+    response_bytes: int
+
+
+class _Grid:
+    """A worksheet of the fake server: its properties and cell values."""
+
+    def __init__(self, sheet_id: int, title: str, rows: int, cols: int):
+        self.sheet_id = sheet_id
+        self.title = title
+        self.row_count = rows
+        self.col_count = cols
+        self.values: List[List[str]] = []
+
+    def properties(self, index: int) -> Dict[str, Any]:
+        return {
+            "sheetId": self.sheet_id,
+            "title": self.title,
+            "index": index,
+            "sheetType": "GRID",
+            "gridProperties": {
+                "rowCount": self.row_count,
+                "columnCount": self.col_count,
+            },
+        }
+
+    def last_row(self) -> int:
+        """Return the number of the last row holding a value."""
+        for number in range(len(self.values), 0, -1):
+            if any(self.values[number - 1]):
+                return number
+        return 0
+
+    def read(self, top: int, left: int, bottom: int, right: int):
+        """Return the values of a range, trimmed like the real API."""
+        rows = []
+        for row in self.values[top - 1:min(bottom, len(self.values))]:
+            cells = row[left - 1:right]
+            while cells and cells[-1] == "":
+                cells.pop()
+            rows.append(cells)
+        while rows and not rows[-1]:
+            rows.pop()
+        return rows
+
+    def write(self, top: int, left: int, values: List[List[Any]]) -> int:
+        """Write a block of values; None leaves a cell unchanged."""
+        bottom = top + len(values) - 1
+        right = left + max((len(row) for row in values), default=1) - 1
+        if bottom > self.row_count or right > self.col_count:
+            raise FakeSheetsError(
+                400,
+                f"Range ({self.title}!{rowcol_to_a1(bottom, right)}) "
+                f"exceeds grid limits. Max rows: {self.row_count}, "
+                f"max columns: {self.col_count}",
+                "INVALID_ARGUMENT",
+            )
+        while len(self.values) < bottom:
+            self.values.append([])
+        updated = 0
+        for offset, row in enumerate(values):
+            cells = self.values[top - 1 + offset]
+            for col, value in enumerate(row, start=left):
+                if value is None:
+                    continue
+                if len(cells) < col:
+                    cells.extend([""] * (col - len(cells)))
+                cells[col - 1] = _format(value)
+                updated += 1
+        return updated
+
+
+def _format(value: Any) -> str:
+    """Return a cell value as the API's FORMATTED_VALUE renders it."""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _unformat(value: str) -> Any:
+    """Return a cell value as the API's UNFORMATTED_VALUE renders it."""
+    for convert in (int, float):
+        try:
+            return convert(value)
+        except ValueError:
+            pass
+    return value
+
+
+class _Spreadsheet:
+    """A spreadsheet of the fake server."""
+
+    def __init__(self, spreadsheet_id: str, title: str):
+        self.id = spreadsheet_id
+        self.title = title
+        self.sheets: List[_Grid] = []
+        self.created = datetime.now(timezone.utc)
+        self.modified = self.created
+
+    def touch(self) -> None:
+        """Advance the modified time, strictly, like any edit does."""
+        now = datetime.now(timezone.utc)
+        self.modified = max(now, self.modified + timedelta(milliseconds=1))
+
+    def drive_file(self) -> Dict[str, str]:
+        return {
+            "id": self.id,
+            "name": self.title,
+            "createdTime": _timestamp(self.created),
+            "modifiedTime": _timestamp(self.modified),
+        }
+
+    def grid(self, title: str) -> _Grid:
+        for grid in self.sheets:
+            if grid.title == title:
+                return grid
+        raise FakeSheetsError(
+            400, f"Unable to parse range: {title}", "INVALID_ARGUMENT"
+        )
+
+    def resolve(self, range_name: str) -> Tuple[_Grid, int, int, int, int]:
+        """
+        Resolve an A1 range to its worksheet and bounds.
+
+        Returns:
+            Tuple[_Grid, int, int, int, int]:
+            The worksheet and the 1-based top, left, bottom and right.
+        """
+        match = _RANGE.match(range_name)
+        cells = _CELLS.match(match.group(3) or "") if match else None
+        if cells is None:
+            raise FakeSheetsError(
+                400, f"Unable to parse range: {range_name}",
+                "INVALID_ARGUMENT",
+            )
+        quoted, bare, _ = match.groups()
+        grid = self.grid(quoted.replace("''", "'") if quoted else bare)
+        start_col, start_row, end_col, end_row = cells.groups()
+        if end_col is None and end_row is None:
+            end_col, end_row = start_col, start_row
+        return (
+            grid,
+            int(start_row or 1),
+            _column(start_col) or 1,
+            int(end_row or grid.row_count),
+            _column(end_col) or grid.col_count,
+        )
+
+
+def _column(letters: str) -> int:
+    if not letters:
+        return 0
+    return a1_to_rowcol(f"{letters}1")[1]
+
+
+def _timestamp(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.") + (
+        f"{moment.microsecond // 1000:03d}Z"
+    )
+
+
+def _a1(grid: _Grid, top: int, left: int, bottom: int, right: int) -> str:
+    title = grid.title.replace("'", "''")
+    return (
+        f"'{title}'!{rowcol_to_a1(top, left)}:{rowcol_to_a1(bottom, right)}"
+    )
+
+
+class FakeSheetsServer:
+    """
+    In-process stand-in for the Google Sheets v4 and Drive v3 APIs.
+
+    Implements the subset of the REST API gspread uses for this app:
+    opening a spreadsheet by title, worksheet metadata, values get,
+    batchGet, update, append and batchUpdate, and the addSheet,
+    deleteSheet, deleteDimension and updateSheetProperties (resizing)
+    batch requests. The server acts as
+    the requests session of a real gspread Client, so everything above
+    the HTTP layer, including TodoGoogleSheets and its scheduler, runs
+    unchanged.
+
+    Each request can be delayed by a fixed latency plus a transfer time
+    derived from its payload, rejected with 429 once more than quota
+    requests were made within a minute, or failed on purpose with
+    fail_next(). Every request is logged in requests, so tests and
+    benchmarks can count round trips and bytes per operation.
+
+    Attributes:
+        latency (float): Seconds added to every request.
+        bandwidth (float): Bytes per second; 0 means unlimited.
+        quota (float): Requests per minute; 0 disables the quota.
+        requests (List[FakeRequest]): Every request served so far.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        bandwidth: float = 0.0,
+        quota: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize the FakeSheetsServer without any spreadsheet.
+
+        Args:
+            latency (float): Seconds added to every request.
+            bandwidth (float):
+            Transfer rate in bytes per second used to delay requests by
+            their size. 0 means unlimited.
+            quota (float):
+            Requests per minute before requests fail with 429, like the
+            real per-user quota. 0 disables the quota.
+            clock (Callable[[], float]): Monotonic clock in seconds.
+            sleep (Callable[[float], None]): Function used to wait.
+        """
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.quota = quota
+        self.requests: List[FakeRequest] = []
+        self.headers: Dict[str, str] = {}
+        self._clock = clock
+        self._sleep = sleep
+        self._spreadsheets: Dict[str, _Spreadsheet] = {}
+        self._recent: Deque[float] = deque()
+        self._failures: Deque[Tuple[int, Optional[float]]] = deque()
+        self._lock = threading.Lock()
+
+    def add_spreadsheet(
+        self, title: str, worksheets: Dict[str, List[List[Any]]]
+    ) -> str:
+        """
+        Create a spreadsheet.
+
+        Args:
+            title (str): The spreadsheet title, as passed to open().
+            worksheets (Dict[str, List[List[Any]]]):
+            Initial rows of each worksheet by title, header included.
+
+        Returns:
+            str: The new spreadsheet's id.
+        """
+        spreadsheet = _Spreadsheet(uuid.uuid4().hex, title)
+        for sheet_id, (name, rows) in enumerate(worksheets.items()):
+            grid = _Grid(
+                sheet_id,
+                name,
+                max(DEFAULT_ROWS, len(rows)),
+                max([DEFAULT_COLS] + [len(row) for row in rows]),
+            )
+            grid.write(1, 1, rows)
+            spreadsheet.sheets.append(grid)
+        with self._lock:
+            self._spreadsheets[spreadsheet.id] = spreadsheet
+        return spreadsheet.id
+
+    def get_values(self, title: str, worksheet: str) -> List[List[str]]:
+        """
+        Return a worksheet's values, e.g. to check a test's outcome.
+
+        Args:
+            title (str): The spreadsheet title.
+            worksheet (str): The worksheet title.
+
+        Returns:
+            List[List[str]]: The rows, trimmed like the API returns them.
+        """
+        with self._lock:
+            for spreadsheet in self._spreadsheets.values():
+                if spreadsheet.title == title:
+                    grid = spreadsheet.grid(worksheet)
+                    return grid.read(1, 1, grid.row_count, grid.col_count)
+        raise KeyError(title)
+
+    def fail_next(
+        self,
+        status: int = 429,
+        count: int = 1,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """
+        Make the next requests fail with an error status.
+
+        Args:
+            status (int): The HTTP status, e.g. 429 or 503.
+            count (int): The number of requests to fail.
+            retry_after (Optional[float]):
+            Value of the Retry-After header, if any.
+        """
+        with self._lock:
+            self._failures.extend([(status, retry_after)] * count)
+
+    def client(self) -> gspread.Client:
+        """Return a gspread Client talking to this server."""
+        return gspread.Client(None, session=self)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Serve a request, with the signature of requests.Session.request.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The Google API URL.
+            params (Optional[Dict[str, Any]]): The query parameters.
+            json (Optional[Any]): The JSON body.
+            **kwargs: Other request options; ignored.
+
+        Returns:
+            requests.Response: The response, an error status included.
+        """
+        method = method.upper()
+        params = {
+            key: value for key, value in (params or {}).items()
+            if value is not None
+        }
+        body = _dumps(json) if json is not None else ""
+        request_bytes = len(url) + len(urlencode(params, True)) + len(body)
+        headers = {}
+        with self._lock:
+            operation, handler, args = self._route(method, url)
+            try:
+                self._admit(headers)
+                payload = handler(*args, params, json or {})
+                status = 200
+            except FakeSheetsError as e:
+                status = e.code
+                payload = {"error": {
+                    "code": e.code, "message": e.message, "status": e.status,
+                }}
+            content = _dumps(payload).encode()
+            self.requests.append(FakeRequest(
+                method, operation, status, request_bytes, len(content)
+            ))
+        delay = self.latency
+        if self.bandwidth:
+            delay += (request_bytes + len(content)) / self.bandwidth
+        if delay:
+            self._sleep(delay)
+        return _response(url, status, content, headers)
+
+    def _admit(self, headers: Dict[str, str]) -> None:
+        """Apply injected failures and the per-minute quota."""
+        if self._failures:
+            status, retry_after = self._failures.popleft()
+            if retry_after is not None:
+                headers["Retry-After"] = str(retry_after)
+            raise FakeSheetsError(status, "Injected failure", "UNAVAILABLE")
+        if not self.quota:
+            return
+        now = self._clock()
+        while self._recent and self._recent[0] <= now - 60:
+            self._recent.popleft()
+        if len(self._recent) >= self.quota:
+            raise FakeSheetsError(
+                429,
+                "Quota exceeded for quota metric 'Read requests' and "
+                "limit 'Read requests per minute per user'",
+                "RESOURCE_EXHAUSTED",
+            )
+        self._recent.append(now)
+
+    def _route(self, method: str, url: str):
+        """Return the operation name, handler and arguments for a URL."""
+        path = urlsplit(url).path
+        if path.startswith(DRIVE_PREFIX):
+            file_id = path[len(DRIVE_PREFIX) + 1:]
+            if method == "GET" and file_id:
+                return "drive.files.get", self._drive_get, (file_id,)
+            if method == "GET":
+                return "drive.files.list", self._drive_list, ()
+        elif path.startswith(SHEETS_PREFIX + "/"):
+            rest = path[len(SHEETS_PREFIX) + 1:]
+            spreadsheet_id, _, resource = rest.partition("/values")
+            spreadsheet_id, _, action = spreadsheet_id.partition(":")
+            routes = {
+                ("GET", "", False): ("spreadsheets.get", self._metadata),
+                ("POST", "batchUpdate", False):
+                    ("spreadsheets.batchUpdate", self._batch_update),
+                ("GET", ":batchGet", True):
+                    ("values.batchGet", self._values_batch_get),
+                ("POST", ":batchUpdate", True):
+                    ("values.batchUpdate", self._values_batch_update),
+            }
+            values = "/values" in rest
+            key = (method, resource if values else action, values)
+            if key in routes:
+                operation, handler = routes[key]
+                return operation, handler, (spreadsheet_id,)
+            if values and resource.startswith("/"):
+                range_name = unquote(resource[1:])
+                if method == "GET":
+                    return "values.get", self._values_get, (
+                        spreadsheet_id, range_name
+                    )
+                if method == "PUT":
+                    return "values.update", self._values_update, (
+                        spreadsheet_id, range_name
+                    )
+                if method == "POST" and range_name.endswith(":append"):
+                    return "values.append", self._values_append, (
+                        spreadsheet_id, range_name[:-len(":append")]
+                    )
+        return "unsupported", self._unsupported, (method, path)
+
+    def _unsupported(self, method, path, params, body):
+        raise FakeSheetsError(
+            404, f"{method} {path} is not implemented", "NOT_FOUND"
+        )
+
+    def _spreadsheet(self, spreadsheet_id: str) -> _Spreadsheet:
+        try:
+            return self._spreadsheets[spreadsheet_id]
+        except KeyError:
+            raise FakeSheetsError(
+                404, "Requested entity was not found.", "NOT_FOUND"
+            )
+
+    def _drive_list(self, params, body):
+        match = _TITLE_QUERY.search(params.get("q", ""))
+        return {"kind": "drive#fileList", "files": [
+            spreadsheet.drive_file()
+            for spreadsheet in self._spreadsheets.values()
+            if match is None or spreadsheet.title == match.group(1)
+        ]}
+
+    def _drive_get(self, file_id, params, body):
+        return self._spreadsheet(file_id).drive_file()
+
+    def _metadata(self, spreadsheet_id, params, body):
+        spreadsheet = self._spreadsheet(spreadsheet_id)
+        return {
+            "spreadsheetId": spreadsheet.id,
+            "properties": {
+                "title": spreadsheet.title,
+                "locale": "en_US",
+                "timeZone": "Etc/GMT",
+            },
+            "sheets": [
+                {"properties": grid.properties(index)}
+                for index, grid in enumerate(spreadsheet.sheets)
+            ],
+        }
+
+    def _batch_update(self, spreadsheet_id, params, body):
+        spreadsheet = self._spreadsheet(spreadsheet_id)
+        replies = []
+        for request in body.get("requests", []):
+            (kind, spec), = request.items()
+            if kind == "addSheet":
+                replies.append({"addSheet": {
+                    "properties": self._add_sheet(spreadsheet, spec)
+                }})
+            elif kind == "deleteSheet":
+                spreadsheet.sheets.remove(
+                    self._sheet_by_id(spreadsheet, spec["sheetId"])
+                )
+                replies.append({})
+            elif kind == "deleteDimension":
+                self._delete_dimension(spreadsheet, spec["range"])
+                replies.append({})
+            elif kind == "updateSheetProperties":
+                self._resize(spreadsheet, spec["properties"])
+                replies.append({})
+            else:
+                raise FakeSheetsError(
+                    400, f"Unsupported request: {kind}", "INVALID_ARGUMENT"
+                )
+        spreadsheet.touch()
+        return {"spreadsheetId": spreadsheet.id, "replies": replies}
+
+    def _add_sheet(self, spreadsheet, spec):
+        properties = spec["properties"]
+        title = properties["title"]
+        if any(grid.title == title for grid in spreadsheet.sheets):
+            raise FakeSheetsError(
+                400,
+                f'A sheet with the name "{title}" already exists.',
+                "INVALID_ARGUMENT",
+            )
+        size = properties.get("gridProperties", {})
+        grid = _Grid(
+            max([grid.sheet_id for grid in spreadsheet.sheets] + [0]) + 1,
+            title,
+            size.get("rowCount", DEFAULT_ROWS),
+            size.get("columnCount", DEFAULT_COLS),
+        )
+        spreadsheet.sheets.append(grid)
+        return grid.properties(len(spreadsheet.sheets) - 1)
+
+    def _sheet_by_id(self, spreadsheet, sheet_id):
+        for grid in spreadsheet.sheets:
+            if grid.sheet_id == sheet_id:
+                return grid
+        raise FakeSheetsError(
+            400, f"No grid with id: {sheet_id}", "INVALID_ARGUMENT"
+        )
+
+    def _resize(self, spreadsheet, properties):
+        grid = self._sheet_by_id(spreadsheet, properties["sheetId"])
+        size = properties.get("gridProperties", {})
+        grid.row_count = size.get("rowCount", grid.row_count)
+        grid.col_count = size.get("columnCount", grid.col_count)
+        del grid.values[grid.row_count:]
+        for row in grid.values:
+            del row[grid.col_count:]
+
+    def _delete_dimension(self, spreadsheet, grid_range):
+        grid = self._sheet_by_id(spreadsheet, grid_range["sheetId"])
+        start, end = grid_range["startIndex"], grid_range["endIndex"]
+        if grid_range["dimension"] == "ROWS":
+            del grid.values[start:end]
+            grid.row_count -= end - start
+        else:
+            for row in grid.values:
+                del row[start:end]
+            grid.col_count -= end - start
+
+    def _value_range(self, spreadsheet, range_name, params):
+        grid, top, left, bottom, right = spreadsheet.resolve(range_name)
+        values = grid.read(top, left, bottom, right)
+        if params.get("valueRenderOption") == "UNFORMATTED_VALUE":
+            values = [[_unformat(value) for value in row] for row in values]
+        dimension = params.get("majorDimension", "ROWS")
+        if dimension == "COLUMNS" and values:
+            width = max(len(row) for row in values)
+            values = [
+                [row[col] if col < len(row) else "" for row in values]
+                for col in range(width)
+            ]
+            for column in values:
+                while column and column[-1] == "":
+                    column.pop()
+        result = {
+            "range": _a1(
+                grid, top, left, min(bottom, grid.row_count),
+                min(right, grid.col_count),
+            ),
+            "majorDimension": dimension,
+        }
+        if values:
+            result["values"] = values
+        return result
+
+    def _values_get(self, spreadsheet_id, range_name, params, body):
+        return self._value_range(
+            self._spreadsheet(spreadsheet_id), range_name, params
+        )
+
+    def _values_batch_get(self, spreadsheet_id, params, body):
+        spreadsheet = self._spreadsheet(spreadsheet_id)
+        ranges = params.get("ranges", [])
+        if isinstance(ranges, str):
+            ranges = [ranges]
+        return {"spreadsheetId": spreadsheet.id, "valueRanges": [
+            self._value_range(spreadsheet, range_name, params)
+            for range_name in ranges
+        ]}
+
+    def _update(self, spreadsheet, range_name, values):
+        grid, top, left, _, _ = spreadsheet.resolve(range_name)
+        cells = grid.write(top, left, values)
+        bottom = top + max(len(values), 1) - 1
+        right = left + max((len(row) for row in values), default=1) - 1
+        return {
+            "spreadsheetId": spreadsheet.id,
+            "updatedRange": _a1(grid, top, left, bottom, right),
+            "updatedRows": len(values),
+            "updatedColumns": right - left + 1,
+            "updatedCells": cells,
+        }
+
+    def _values_update(self, spreadsheet_id, range_name, params, body):
+        spreadsheet = self._spreadsheet(spreadsheet_id)
+        result = self._update(spreadsheet, range_name, body.get("values", []))
+        spreadsheet.touch()
+        return result
+
+    def _values_batch_update(self, spreadsheet_id, params, body):
+        spreadsheet = self._spreadsheet(spreadsheet_id)
+        responses = [
+            self._update(spreadsheet, data["range"], data["values"])
+            for data in body.get("data", [])
+        ]
+        spreadsheet.touch()
+        return {
+            "spreadsheetId": spreadsheet.id,
+            "totalUpdatedCells": sum(
+                response["updatedCells"] for response in responses
+            ),
+            "responses": responses,
+        }
+
+    def _values_append(self, spreadsheet_id, range_name, params, body):
+        spreadsheet = self._spreadsheet(spreadsheet_id)
+        grid, _, left, _, _ = spreadsheet.resolve(range_name)
+        values = body.get("values", [])
+        top = grid.last_row() + 1
+        grid.row_count = max(grid.row_count, top + len(values) - 1)
+        width = max((len(row) for row in values), default=1)
+        grid.col_count = max(grid.col_count, left + width - 1)
+        updates = self._update(
+            spreadsheet, _a1(grid, top, left, top, left), values
+        )
+        spreadsheet.touch()
+        return {
+            "spreadsheetId": spreadsheet.id,
+            "tableRange": _a1(grid, 1, 1, max(top - 1, 1), grid.col_count),
+            "updates": updates,
+        }
+
+
+def _dumps(payload: Any) -> str:
+    return json.dumps(payload, separators=(",", ":"))
+
+
+def _response(
+    url: str, status: int, content: bytes, headers: Dict[str, str]
+) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response.url = url
+    response.encoding = "utf-8"
+    response._content = content
+    response.headers = CaseInsensitiveDict(
+        {"Content-Type": "application/json; charset=UTF-8", **headers}
+    )
+    return response
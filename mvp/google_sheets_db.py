@@ -1,29 +1,142 @@
+import json
 import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
 import gspread
-from gspread.exceptions import SpreadsheetNotFound
+from gspread.exceptions import SpreadsheetNotFound, WorksheetNotFound
+from gspread.utils import a1_to_rowcol
 from google.oauth2.service_account import Credentials
 from google.auth.exceptions import GoogleAuthError
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from datetime import datetime, date
+from .backend import ChangeSet, TodoBackend
+from .metrics import RequestMetrics, measured
 from .model import Todo
+from .scheduler import (
+    DEFAULT_REQUESTS_PER_MINUTE,
+    RequestScheduler,
+    ScheduledWorksheet,
+)
 
+DEFAULT_CACHE_TTL = 300.0
+DEFAULT_POSITION_GAP = 1024
+DEFAULT_CHUNK_SIZE = 500
+DEFAULT_FLUSH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL = 5.0
+DEFAULT_TRIM_THRESHOLD = 1000
+DEFAULT_CACHE_DIR = os.path.join("~", ".cache", "task_tracker")
 
-class TodoGoogleSheets:
+# Layout of the changes worksheet: the task columns A-H, then the op.
+# Cell J1 holds the log's generation id and K1 a token for a row the
+# feed has reached, so its end is found without reading column A. K1
+# may lag behind; readers then re-read a few entries, which is harmless
+# as every entry holds a todo's full state. L1 holds the position gap
+# set by migrate_positions(), if any.
+CHANGES_HEADER = [
+    "task_id", "task", "category_id", "date_added", "due_date",
+    "date_completed", "position", "modified_at", "op",
+]
+CHANGES_COLUMNS = len(CHANGES_HEADER) + 3
+
+# Tasks worksheet column of each Todo field that edits write.
+COLUMNS = {
+    "task": "B",
+    "category": "C",
+    "due_date": "E",
+    "date_completed": "F",
+    "position": "G",
+    "modified_at": "H",
+}
+
+Edits = Dict[int, Dict[str, Any]]
+
+
+def _first_row(response: Any) -> Optional[int]:
+    """
+    Return the first row written by an append request.
+
+    Args:
+        response (Any): The values.append response.
+
+    Returns:
+        Optional[int]: The row number, or None if it is not reported.
+    """
+    try:
+        updated_range = response["updates"]["updatedRange"]
+    except (KeyError, TypeError):
+        return None
+    cell = updated_range.rpartition("!")[2].partition(":")[0]
+    return a1_to_rowcol(cell)[0]
+
+
+class TodoGoogleSheets(TodoBackend):
     """Class for managing Todo List operations with Google Sheets."""
 
+    display_name = "Google Sheets"
+
     SCOPE = [
         "https://www.googleapis.com/auth/spreadsheets",
         "https://www.googleapis.com/auth/drive.file",
         "https://www.googleapis.com/auth/drive",
     ]
 
-    def __init__(self, spreadsheet_name="task_tracker"):
+    def __init__(
+        self,
+        spreadsheet_name: str = "task_tracker",
+        cache_ttl: Optional[float] = None,
+        position_gap: Optional[int] = None,
+        cache_file: Optional[str] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        flush_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        client: Optional[gspread.Client] = None,
+        trim_threshold: Optional[int] = None,
+    ):
         """
         Initialize the TodoGoogleSheets class.
 
         Args:
             spreadsheet_name (str):
             Name of the Google Sheets spreadsheet to use.
+            cache_ttl (Optional[float]):
+            Seconds before the local snapshot is re-fetched. Defaults to
+            the TODO_CACHE_TTL environment variable or DEFAULT_CACHE_TTL.
+            position_gap (Optional[int]):
+            Spacing between consecutive positions. 1 keeps positions
+            dense; larger values enable the gapped ordering mode in
+            which deletes and moves touch a single row. Defaults to the
+            TODO_POSITION_GAP environment variable or 1. A gap stored
+            in the sheet by migrate_positions() takes precedence, see
+            get_position_gap().
+            cache_file (Optional[str]):
+            File the snapshot is persisted to between runs, together
+            with the spreadsheet's last modified time. Defaults to the
+            TODO_CACHE_FILE environment variable or a file named after
+            the spreadsheet in DEFAULT_CACHE_DIR. An empty string
+            disables the on-disk cache.
+            scheduler (Optional[RequestScheduler]):
+            Scheduler all Sheets requests are sent through. Defaults to
+            one limited to the TODO_SHEETS_QUOTA environment variable
+            or DEFAULT_REQUESTS_PER_MINUTE requests per minute; 0
+            disables rate limiting.
+            flush_size (Optional[int]):
+            Number of buffered cells that triggers a commit() inside
+            batch(). Defaults to the TODO_FLUSH_SIZE environment
+            variable or DEFAULT_FLUSH_SIZE.
+            flush_interval (Optional[float]):
+            Seconds after which buffered cells are committed by the next
+            write inside batch(). Defaults to the TODO_FLUSH_INTERVAL
+            environment variable or DEFAULT_FLUSH_INTERVAL.
+            client (Optional[gspread.Client]):
+            Authorized gspread client, e.g. one talking to a
+            FakeSheetsServer. Defaults to a client authorized with the
+            service account file named by GOOGLE_CREDENTIALS_FILE.
+            trim_threshold (Optional[int]):
+            Number of change feed entries past which close() trims the
+            feed. Defaults to the TODO_TRIM_THRESHOLD environment
+            variable or DEFAULT_TRIM_THRESHOLD; 0 never trims.
 
         Raises:
             FileNotFoundError:
@@ -33,25 +146,74 @@ class TodoGoogleSheets:
             SpreadsheetNotFound:
             If the specified spreadsheet cannot be found or accessed.
         """
-        try:
-            creds_file = os.environ.get(
-                "GOOGLE_CREDENTIALS_FILE", "creds.json"
+        if cache_ttl is None:
+            cache_ttl = float(
+                os.environ.get("TODO_CACHE_TTL", DEFAULT_CACHE_TTL)
+            )
+        self.cache_ttl = cache_ttl
+        if position_gap is None:
+            position_gap = int(os.environ.get("TODO_POSITION_GAP", 1))
+        self.position_gap = position_gap
+        self._stored_gap: Optional[int] = None
+        if cache_file is None:
+            cache_file = os.environ.get(
+                "TODO_CACHE_FILE",
+                os.path.join(DEFAULT_CACHE_DIR, f"{spreadsheet_name}.json"),
             )
-            self.creds = Credentials.from_service_account_file(creds_file)
-            self.scoped_creds = self.creds.with_scopes(self.SCOPE)
-            self.client = gspread.authorize(self.scoped_creds)
+        self.cache_file = os.path.expanduser(cache_file)
+        self._todos: Optional[List[Todo]] = None
+        self._rows: Dict[int, int] = {}
+        self._categories: Dict[int, str] = {}
+        self._category_ids: Optional[Dict[str, int]] = None
+        self._loaded_at = 0.0
+        self._lock = threading.RLock()
+        if scheduler is None:
+            scheduler = RequestScheduler(
+                requests_per_minute=float(
+                    os.environ.get(
+                        "TODO_SHEETS_QUOTA", DEFAULT_REQUESTS_PER_MINUTE
+                    )
+                )
+            )
+        self.scheduler = scheduler
+        if flush_size is None:
+            flush_size = int(
+                os.environ.get("TODO_FLUSH_SIZE", DEFAULT_FLUSH_SIZE)
+            )
+        self.flush_size = flush_size
+        if flush_interval is None:
+            flush_interval = float(
+                os.environ.get("TODO_FLUSH_INTERVAL", DEFAULT_FLUSH_INTERVAL)
+            )
+        self.flush_interval = flush_interval
+        if trim_threshold is None:
+            trim_threshold = int(
+                os.environ.get("TODO_TRIM_THRESHOLD", DEFAULT_TRIM_THRESHOLD)
+            )
+        self.trim_threshold = trim_threshold
+        self._buffer: Edits = {}
+        self._buffered_at = 0.0
+        self._batch_depth = 0
+        self._changes_worksheet: Optional[ScheduledWorksheet] = None
+        self._change_token: Optional[str] = None
+        self._changed: Dict[int, None] = {}
+        self._feed_grown = False
+        self.metrics = RequestMetrics()
 
-            try:
-                self.sheet = self.client.open(spreadsheet_name)
-            except SpreadsheetNotFound:
-                raise SpreadsheetNotFound(
-                    f"Spreadsheet '{spreadsheet_name}'"
-                    f"not found or not accessible. "
-                    f"Please check the spreadsheet name and your permissions."
+        try:
+            if client is None:
+                creds_file = os.environ.get(
+                    "GOOGLE_CREDENTIALS_FILE", "creds.json"
+                )
+                self.creds = Credentials.from_service_account_file(
+                    creds_file
                 )
+                self.scoped_creds = self.creds.with_scopes(self.SCOPE)
+                client = gspread.authorize(self.scoped_creds)
+            self.client = self.metrics.instrument(client)
 
-            self.tasks_worksheet = self.sheet.worksheet("tasks")
-            self.categories_worksheet = self.sheet.worksheet("categories")
+            with self.metrics.operation("connect"):
+                self._open(spreadsheet_name)
 
         except FileNotFoundError:
             raise FileNotFoundError(
@@ -63,9 +225,717 @@ class TodoGoogleSheets:
                 f"Failed to authenticate with Google: {str(e)}"
             )
 
+    def _open(self, spreadsheet_name: str) -> None:
+        """Open the spreadsheet and its tasks and categories worksheets."""
+        try:
+            self.sheet = self.scheduler.call(
+                self.client.open, spreadsheet_name
+            )
+        except SpreadsheetNotFound:
+            raise SpreadsheetNotFound(
+                f"Spreadsheet '{spreadsheet_name}'"
+                f"not found or not accessible. "
+                f"Please check the spreadsheet name and your permissions."
+            )
+
+        self.tasks_worksheet = ScheduledWorksheet(
+            self.scheduler.call(self.sheet.worksheet, "tasks"),
+            self.scheduler,
+        )
+        self.categories_worksheet = ScheduledWorksheet(
+            self.scheduler.call(self.sheet.worksheet, "categories"),
+            self.scheduler,
+        )
+
+    def invalidate_cache(self) -> None:
+        """Drop the local snapshot so the next read re-fetches the sheet."""
+        self.commit()
+        self._drop_snapshot()
+
+    def _drop_snapshot(self) -> None:
+        """Forget the snapshot and category index without committing."""
+        self._changed = {}
+        self._todos = None
+        self._rows = {}
+        self._categories = {}
+        self._category_ids = None
+        self._loaded_at = 0.0
+        self._change_token = None
+
+    def _snapshot(self) -> List[Todo]:
+        """
+        Return the cached todos, re-fetching them if missing or expired.
+
+        Loading is serialized, so concurrent readers such as the CLI's
+        prefetcher share a single fetch. An expired snapshot is brought
+        up to date from the change feed when possible, which only reads
+        the changes made since it was loaded. Edits made directly in the
+        spreadsheet bypass the feed; invalidate_cache() picks them up.
+
+        Returns:
+            List[Todo]: The cached todos in sheet row order.
+        """
+        with self._lock:
+            age = time.monotonic() - self._loaded_at
+            if self._todos is not None and age > self.cache_ttl:
+                if self._apply_changes() is None:
+                    self.invalidate_cache()
+            if self._todos is None:
+                self._load_snapshot()
+            return self._todos
+
+    def _load_snapshot(self) -> None:
+        """
+        Fill the snapshot from the on-disk cache or the worksheets.
+
+        The cache file is only used if the spreadsheet's last modified
+        time still matches the one stored with it; this costs a single
+        metadata request instead of two full worksheet reads.
+        """
+        revision = self._remote_revision()
+        if revision is not None and self._read_cache_file(revision):
+            self._loaded_at = time.monotonic()
+            return
+
+        self._reload_snapshot(revision)
+
+    def _reload_snapshot(self, revision: Optional[str] = None) -> None:
+        """
+        Fill the snapshot from the worksheets, bypassing the cache file.
+
+        Buffered edits are applied to the fresh snapshot again, as they
+        are not in the sheet yet.
+
+        Args:
+            revision (Optional[str]):
+            The spreadsheet revision, if the snapshot should also be
+            written to the cache file.
+        """
+        change_token = self._current_change_token()
+        data = self.tasks_worksheet.get_all_records()
+        self._category_index()
+        self._install_snapshot(data, revision, change_token)
+        self._reapply(self._buffer)
+
+    def _install_snapshot(
+        self,
+        records: List[Dict[str, Any]],
+        revision: Optional[str] = None,
+        change_token: Optional[str] = None,
+    ) -> None:
+        """
+        Decode task records into the snapshot and rebuild the row index.
+
+        The category index must already be loaded. It is refreshed if a
+        record refers to a category it does not know yet, e.g. one
+        added by another client.
+
+        Args:
+            records (List[Dict[str, Any]]):
+            Records of the tasks worksheet, as from get_all_records().
+            revision (Optional[str]):
+            The spreadsheet revision the records belong to. If given,
+            the snapshot is also written to the cache file.
+            change_token (Optional[str]):
+            Change feed token read just before the records.
+        """
+        if any(item["category_id"] not in self._categories
+               for item in records):
+            self.refresh_categories()
+        names = self._categories
+        self._todos = [
+            Todo.trusted(
+                item["task_id"],
+                item["task"],
+                names[item["category_id"]],
+                item["date_added"],
+                item["due_date"],
+                item["date_completed"],
+                item["position"],
+                item.get("modified_at") or None,
+            )
+            for item in records
+        ]
+        self._rows = {
+            todo.task_id: row
+            for row, todo in enumerate(self._todos, start=2)
+        }
+        self._loaded_at = time.monotonic()
+        self._change_token = change_token
+        if revision is not None:
+            self._write_cache_file(revision)
+
+    def _remote_revision(self) -> Optional[str]:
+        """
+        Return the spreadsheet's last modified time, if caching is on.
+
+        Returns:
+            Optional[str]:
+            The modified time, or None if the on-disk cache is disabled
+            or the metadata could not be fetched.
+        """
+        if not self.cache_file:
+            return None
+        try:
+            return self.scheduler.call(self.sheet.get_lastUpdateTime)
+        except gspread.exceptions.APIError:
+            return None
+
+    def _read_cache_file(self, revision: str) -> bool:
+        """
+        Restore the snapshot from the cache file if it is current.
+
+        Args:
+            revision (str): The spreadsheet's current modified time.
+
+        Returns:
+            bool: True if the snapshot was restored.
+        """
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if cached.get("revision") != revision:
+            return False
+
+        self._categories = {
+            category_id: name for category_id, name in cached["categories"]
+        }
+        self._category_ids = {
+            name: category_id for category_id, name in cached["categories"]
+        }
+        self._todos = [Todo.trusted(**item) for item in cached["todos"]]
+        self._change_token = cached.get("change_token")
+        self._stored_gap = cached.get("position_gap")
+        self._rows = {
+            todo.task_id: row
+            for row, todo in enumerate(self._todos, start=2)
+        }
+        return True
+
+    def _write_cache_file(self, revision: str) -> None:
+        """
+        Persist the snapshot together with the spreadsheet revision.
+
+        Failing to write the cache is not an error; the next run simply
+        fetches the worksheets again.
+
+        Args:
+            revision (str): The modified time the snapshot matches.
+        """
+        cached = {
+            "revision": revision,
+            "change_token": self._change_token,
+            "position_gap": self._stored_gap,
+            "categories": list(self._categories.items()),
+            "todos": [todo.to_dict() for todo in self._todos],
+        }
+        try:
+            os.makedirs(os.path.dirname(self.cache_file) or ".",
+                        exist_ok=True)
+            tmp_file = f"{self.cache_file}.tmp"
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(cached, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            pass
+
+    @measured("close")
+    def close(self) -> None:
+        """
+        Commit buffered writes and persist the snapshot, including this
+        session's writes.
+
+        If this session wrote to the change feed, the feed's end is
+        stored in K1 first, or the feed is trimmed once it holds more
+        than trim_threshold entries.
+
+        The revision is read next and the snapshot is then caught up
+        from the change feed, so it holds at least every edit up to
+        that revision. If it cannot be caught up, the cache file is
+        left as it is and the next run fetches the worksheets.
+        """
+        with self._lock:
+            self.commit()
+            if self._todos is None:
+                return
+            if self._feed_grown:
+                self._checkpoint_changes()
+            revision = self._remote_revision()
+            if revision is None or self._catch_up() is None:
+                return
+            self._write_cache_file(revision)
+
+    def refresh_categories(self) -> None:
+        """
+        Reload the category index from the categories worksheet.
+
+        Call this when another client may have edited the categories.
+        """
+        self._install_categories(self.categories_worksheet.get_all_records())
+
+    def _install_categories(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Build the category index from categories worksheet records.
+
+        Args:
+            records (List[Dict[str, Any]]): The category records.
+        """
+        self._categories = {
+            row["category_id"]: row["category_name"] for row in records
+        }
+        self._category_ids = {
+            row["category_name"]: row["category_id"] for row in records
+        }
+
+    def _category_index(self) -> Dict[str, int]:
+        """
+        Return the category name to id index, loading it if needed.
+
+        Returns:
+            Dict[str, int]: Mapping of category names to category ids.
+        """
+        with self._lock:
+            if self._category_ids is None:
+                self.refresh_categories()
+            return self._category_ids
+
+    def _cached_todo(self, task_id: int) -> Optional[Todo]:
+        """
+        Return the cached todo for a task_id, if a snapshot is loaded.
+
+        Args:
+            task_id (int): The id of the task.
+
+        Returns:
+            Optional[Todo]: The cached todo, or None if it is not cached.
+        """
+        row = self._rows.get(task_id)
+        if self._todos is None or row is None:
+            return None
+        return self._todos[row - 2]
+
+    def _changes(self, create: bool = True) -> Optional[ScheduledWorksheet]:
+        """
+        Return the changes worksheet, creating it on first use.
+
+        The changes worksheet is the change feed: every write appends
+        the new state of each touched todo, or a delete marker, to it.
+        Creating it also adds the modified_at header to the tasks
+        worksheet of spreadsheets that predate the change feed, and an
+        existing feed with too few header columns is widened.
+
+        Args:
+            create (bool): Whether to create a missing worksheet.
+
+        Returns:
+            Optional[ScheduledWorksheet]:
+            The worksheet, or None if it is missing and create is False.
+        """
+        if self._changes_worksheet is None:
+            try:
+                worksheet = self.scheduler.call(
+                    self.sheet.worksheet, "changes"
+                )
+            except WorksheetNotFound:
+                if not create:
+                    return None
+                worksheet = self.scheduler.call(
+                    self.sheet.add_worksheet,
+                    "changes",
+                    rows=1,
+                    cols=CHANGES_COLUMNS,
+                    idempotent=False,
+                )
+                generation = uuid.uuid4().hex
+                self.scheduler.call(
+                    worksheet.append_row,
+                    CHANGES_HEADER + [generation, f"{generation}:1"],
+                    idempotent=False,
+                )
+                self.tasks_worksheet.batch_update(
+                    [{"range": "H1", "values": [["modified_at"]]}]
+                )
+                if self._todos is not None and self._change_token is None:
+                    # The feed starts empty, so it holds exactly the
+                    # writes made after this snapshot.
+                    self._change_token = f"{generation}:1"
+            else:
+                if worksheet.col_count < CHANGES_COLUMNS:
+                    # Feeds created by older versions lack the header
+                    # cells after J1, and reads of them would fail.
+                    self.scheduler.call(
+                        worksheet.add_cols,
+                        CHANGES_COLUMNS - worksheet.col_count,
+                        idempotent=False,
+                    )
+            self._changes_worksheet = ScheduledWorksheet(
+                worksheet, self.scheduler
+            )
+        return self._changes_worksheet
+
+    def _current_change_token(self) -> Optional[str]:
+        """
+        Return a token for the current end of the change feed.
+
+        Returns:
+            Optional[str]:
+            The token, or None if the spreadsheet has no change feed.
+        """
+        changes = self._changes(create=False)
+        if changes is None:
+            return None
+        header = changes.get_values("J1:L1")[0]
+        self._note_stored_gap(header)
+        generation = header[0]
+        if len(header) > 1 and header[1].startswith(f"{generation}:"):
+            return header[1]
+        # K1 is missing or left over from an earlier generation.
+        return f"{generation}:1"
+
+    def _read_changes(
+        self, token: Optional[str]
+    ) -> Optional[Tuple[List[List[str]], str]]:
+        """
+        Read the change feed entries written after a token.
+
+        Tokens have the form "<generation>:<last row read>". The
+        generation in cell J1 is replaced whenever the feed is trimmed,
+        which invalidates all outstanding tokens. The last row read is
+        fetched again to check that the token is within the feed, as a
+        trim deletes the entries before it replaces the generation.
+
+        Args:
+            token (Optional[str]): The token to read from.
+
+        Returns:
+            Optional[Tuple[List[List[str]], str]]:
+            The new entries and the token after them, or None if the
+            token is missing or no longer valid.
+        """
+        changes = self._changes(create=False) if token else None
+        if changes is None:
+            return None
+        generation, _, row = token.rpartition(":")
+        try:
+            start = int(row) + 1
+        except ValueError:
+            return None
+        if start < 2:
+            return None
+        header, rows = changes.batch_get(["J1:L1", f"A{start - 1}:I"])
+        if not header or header[0][0] != generation or not rows:
+            return None
+        self._note_stored_gap(header[0])
+        return rows[1:], f"{generation}:{start - 2 + len(rows)}"
+
+    def _note_stored_gap(self, header: List[str]) -> None:
+        """
+        Remember the position gap stored in the change feed's header.
+
+        Args:
+            header (List[str]): The values of J1:L1.
+        """
+        self._stored_gap = int(header[2]) if header[2:] else None
+
+    def _apply_changes(self) -> Optional[Dict[int, Optional[Todo]]]:
+        """
+        Bring the snapshot up to date from the change feed.
+
+        Returns:
+            Optional[Dict[int, Optional[Todo]]]:
+            The latest state of every changed task_id, None for deleted
+            ones, or None if the snapshot has no valid change token and
+            must be reloaded.
+        """
+        self.commit()
+        return self._catch_up()
+
+    def _catch_up(self) -> Optional[Dict[int, Optional[Todo]]]:
+        """
+        Apply the change feed entries after the snapshot's token.
+
+        Unlike _apply_changes(), buffered edits are not committed
+        first; they are applied to the caught up snapshot again.
+
+        Returns:
+            Optional[Dict[int, Optional[Todo]]]:
+            As for _apply_changes().
+        """
+        changed = self._read_changes(self._change_token)
+        if self._todos is None or changed is None:
+            return None
+        rows, token = changed
+        latest = self._latest_changes(rows)
+        self._install_changes(latest, token)
+        return latest
+
+    def _latest_changes(
+        self, rows: List[List[str]]
+    ) -> Dict[int, Optional[Todo]]:
+        """
+        Decode change feed entries into the latest state of each task.
+
+        Args:
+            rows (List[List[str]]): The entries, oldest first.
+
+        Returns:
+            Dict[int, Optional[Todo]]:
+            The latest state of every changed task_id, None for deleted
+            ones, in the order they were last changed.
+        """
+        latest: Dict[int, Optional[Todo]] = {}
+        for values in rows:
+            values = list(values) + [""] * (9 - len(values))
+            task_id = int(values[0])
+            latest.pop(task_id, None)
+            if values[8] == "delete":
+                latest[task_id] = None
+            else:
+                latest[task_id] = self._decode_row(values[:8])
+        return latest
+
+    def _install_changes(
+        self, latest: Dict[int, Optional[Todo]], token: str
+    ) -> None:
+        """
+        Apply decoded change feed entries to the snapshot.
+
+        Args:
+            latest (Dict[int, Optional[Todo]]):
+            The changes, as returned by _latest_changes().
+            token (str): The token after the entries.
+        """
+        for task_id, todo in latest.items():
+            row = self._rows.get(task_id)
+            if todo is None:
+                if row is not None:
+                    self._forget_row(task_id)
+            elif row is None:
+                self._todos.append(todo)
+                self._rows[task_id] = len(self._todos) + 1
+            else:
+                self._todos[row - 2] = todo
+        self._change_token = token
+        self._loaded_at = time.monotonic()
+        self._reapply(self._buffer)
+
+    @measured("sync")
+    def get_changes_since(self, token: Optional[str] = None) -> ChangeSet:
+        """
+        Return the todos changed since a previous call.
+
+        While the token's generation of the change feed is current,
+        only the entries written after it are read, so the transfer is
+        proportional to the number of changes rather than the size of
+        the sheet. This holds however far the snapshot has moved on
+        since; the entries also catch up the snapshot if it was at the
+        same token. Otherwise, e.g. after a trim, the full state is
+        fetched.
+
+        Args:
+            token (Optional[str]):
+            The token of the previous ChangeSet, or None for everything.
+
+        Returns:
+            ChangeSet: The changes and the token for the next call.
+        """
+        with self._lock:
+            self.commit()
+            changed = self._read_changes(token)
+            if changed is None:
+                self.invalidate_cache()
+                return ChangeSet(
+                    todos=self.get_all_todos(),
+                    token=self._change_token,
+                    full=True,
+                )
+            rows, next_token = changed
+            latest = self._latest_changes(rows)
+            if self._todos is not None and token == self._change_token:
+                self._install_changes(latest, next_token)
+            return ChangeSet(
+                todos=[todo for todo in latest.values() if todo],
+                deleted=[
+                    task_id for task_id, todo in latest.items()
+                    if todo is None
+                ],
+                token=next_token,
+            )
+
+    @measured("sync")
+    def trim_changes(self) -> None:
+        """
+        Empty the change feed and start a new generation of it.
+
+        This keeps the changes worksheet small. Outstanding tokens from
+        other clients become invalid, so each of them falls back to one
+        full read; this backend's own snapshot is caught up first and
+        stays incremental. close() calls it once the feed holds more
+        than trim_threshold entries.
+        """
+        with self._lock:
+            caught_up = self._apply_changes() is not None
+            changes = self._changes()
+            if caught_up:
+                token = self._change_token
+            else:
+                token = self._current_change_token()
+            last_row = int(token.rpartition(":")[2])
+            if last_row > 1:
+                changes.delete_rows(2, last_row)
+            # Entries appended meanwhile moved up to row 2 and are read
+            # again from the new token.
+            generation = uuid.uuid4().hex
+            token = f"{generation}:1"
+            changes.batch_update([
+                {"range": "J1", "values": [[generation]]},
+                {"range": "K1", "values": [[token]]},
+            ])
+            self._change_token = token if caught_up else None
+            self._feed_grown = False
+
+    def _checkpoint_changes(self) -> None:
+        """
+        Store the feed's end in K1, or trim the feed if it is too long.
+
+        The snapshot is caught up first, so its token names the last
+        entry the feed held at that time.
+        """
+        if self._catch_up() is None:
+            return
+        entries = int(self._change_token.rpartition(":")[2]) - 1
+        if 0 < self.trim_threshold < entries:
+            self.trim_changes()
+        else:
+            self._changes().batch_update(
+                [{"range": "K1", "values": [[self._change_token]]}]
+            )
+        self._feed_grown = False
+
+    def _change_row(self, todo: Todo) -> List[Any]:
+        """Return the change feed entry recording a todo's state."""
+        return [
+            todo.task_id,
+            todo.task,
+            self._category_index()[todo.category],
+            todo.date_added,
+            todo.due_date or "",
+            todo.date_completed or "",
+            todo.position,
+            todo.modified_at,
+            "upsert",
+        ]
+
+    def _reapply(self, edits: Edits) -> None:
+        """
+        Apply edits to the snapshot's todos, skipping missing ones.
+
+        Args:
+            edits (Edits): New field values by task_id.
+        """
+        for task_id, fields in edits.items():
+            todo = self._cached_todo(task_id)
+            if todo is not None:
+                for name, value in fields.items():
+                    setattr(todo, name, value)
+
+    def _rows_hold(self, rows: Dict[int, int]) -> bool:
+        """
+        Check that rows of the tasks worksheet hold the given task_ids.
+
+        The task_id column of the rows is read in a single request.
+
+        Args:
+            rows (Dict[int, int]): Expected row by task_id.
+
+        Returns:
+            bool: True if every row holds its task_id.
+        """
+        if not rows:
+            return True
+        low, high = min(rows.values()), max(rows.values())
+        column = self.tasks_worksheet.get_values(f"A{low}:A{high}")
+        return all(
+            row - low < len(column)
+            and column[row - low][:1] == [str(task_id)]
+            for task_id, row in rows.items()
+        )
+
+    def _verified_rows(self, edits: Edits) -> Dict[int, int]:
+        """
+        Return the rows of todos about to be written, checked against
+        the tasks worksheet.
+
+        The row index goes stale when another client inserts or deletes
+        rows, so it is verified before every row-addressed write. On a
+        mismatch the snapshot is caught up from the change feed, or
+        reloaded if that does not fix the index, and the edits are
+        applied to it again.
+
+        Args:
+            edits (Edits): New field values by task_id.
+
+        Returns:
+            Dict[int, int]:
+            The row of each todo that still exists; todos deleted by
+            another client are left out.
+        """
+
+        def rows() -> Dict[int, int]:
+            return {
+                task_id: self._rows[task_id]
+                for task_id in edits if task_id in self._rows
+            }
+
+        self._snapshot()
+        if self._rows_hold(rows()):
+            return rows()
+        if self._catch_up() is not None:
+            self._reapply(edits)
+            if self._rows_hold(rows()):
+                return rows()
+        self._reload_snapshot()
+        self._reapply(edits)
+        return rows()
+
+    def _log_changes(self) -> None:
+        """Append the written todos' new state to the change feed."""
+        rows = [
+            self._change_row(todo)
+            for todo in map(self._cached_todo, self._changed)
+            if todo is not None
+        ]
+        self._changed = {}
+        if rows:
+            self._append_changes(rows)
+
+    def _append_changes(self, rows: List[List[Any]]) -> None:
+        """
+        Append entries to the change feed.
+
+        Args:
+            rows (List[List[Any]]): The entries, as from _change_row().
+        """
+        self._changes().append_rows(rows)
+        self._feed_grown = True
+
+    def _forget_row(self, task_id: int) -> None:
+        """Remove a todo from the snapshot and shift the rows below."""
+        row = self._rows.pop(task_id)
+        del self._todos[row - 2]
+        for other_id, other_row in self._rows.items():
+            if other_row > row:
+                self._rows[other_id] = other_row - 1
+
+    @measured("list")
     def get_all_todos(self) -> List[Todo]:
         """
-        Retrieve all todos from the Google Sheet.
+        Retrieve all todos, served from the local snapshot when fresh.
+
+        The returned Todo objects are shared with the snapshot and
+        should be treated as read-only.
 
         Returns:
             List[Todo]: A list of Todo objects representing all tasks.
@@ -75,45 +945,328 @@ class TodoGoogleSheets:
             If there's an error communicating with Google Sheets API.
         """
         try:
-            data = self.tasks_worksheet.get_all_records()
-            categories = {
-                row["category_id"]: row["category_name"]
-                for row in self.categories_worksheet.get_all_records()
-            }
-            return [
-                Todo(
-                    task_id=item["task_id"],
-                    task=item["task"],
-                    category=categories[item["category_id"]],
-                    date_added=item["date_added"],
-                    due_date=item["due_date"],
-                    date_completed=item["date_completed"],
-                    position=item["position"],
-                )
-                for item in data
-            ]
+            return list(self._snapshot())
         except gspread.exceptions.APIError as e:
             raise gspread.exceptions.APIError(
                 f"Failed to fetch todos from Google Sheets: {str(e)}"
             )
 
-    def insert_todo(self, todo: Todo) -> None:
-        """Insert a new todo into the Google Sheet."""
-        task_id = self.get_next_task_id()
-        category_id = self.get_category_id(todo.category)
-        position = self.get_next_position()
-        self.tasks_worksheet.append_row(
-            [
-                task_id,
-                todo.task,
-                category_id,
-                todo.date_added or datetime.now().isoformat(),
-                todo.due_date,
-                todo.date_completed,
-                position,
-            ]
+    def iter_todos(
+        self, page_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Todo]:
+        """
+        Stream all todos without materializing the whole sheet.
+
+        A fresh snapshot is reused when there is one; otherwise the tasks
+        worksheet is read in pages of page_size rows, and only one page
+        is held in memory at a time.
+
+        Args:
+            page_size (int): Number of rows fetched per request.
+
+        Yields:
+            Todo: The todos in sheet row order.
+        """
+        if self._todos is not None:
+            yield from self.get_all_todos()
+            return
+
+        self._category_index()
+        start = 2
+        while True:
+            end = start + page_size - 1
+            page = self.tasks_worksheet.get_values(f"A{start}:H{end}")
+            for values in page:
+                yield self._decode_row(values)
+            if len(page) < page_size:
+                return
+            start = end + 1
+
+    def _decode_row(self, values: List[str]) -> Todo:
+        """
+        Build a Todo from the cell values of columns A-H.
+
+        The category index is refreshed if it does not know the row's
+        category yet, e.g. one added by another client.
+
+        Args:
+            values (List[str]): The row's values; missing ones are empty.
+
+        Returns:
+            Todo: The decoded todo.
+        """
+        values = list(values) + [""] * (8 - len(values))
+        category_id = int(values[2])
+        if category_id not in self._categories:
+            self.refresh_categories()
+        return Todo.trusted(
+            int(values[0]),
+            values[1],
+            self._categories[category_id],
+            values[3],
+            values[4],
+            values[5],
+            int(values[6]),
+            values[7] or None,
         )
 
+    @measured("insert")
+    def insert_todo(self, todo: Todo) -> int:
+        """
+        Insert a new todo into the Google Sheet.
+
+        The todo's own task_id is kept if it has one, otherwise the next
+        available id is assigned.
+
+        Returns:
+            int: The task_id of the inserted todo.
+        """
+        self.get_category_id(todo.category)
+        return self._append_todos([todo])[0]
+
+    @measured("insert")
+    def insert_todos(
+        self, todos: Iterable[Todo], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> int:
+        """
+        Bulk insert todos with one append request per chunk.
+
+        Ids and positions are assigned locally, categories are resolved
+        from the category index and missing ones are created first.
+
+        Args:
+            todos (Iterable[Todo]): The todos to insert.
+            chunk_size (int): Maximum number of rows per append request.
+
+        Returns:
+            int: The number of inserted todos.
+        """
+        count = 0
+        chunk: List[Todo] = []
+        for todo in todos:
+            chunk.append(todo)
+            if len(chunk) >= chunk_size:
+                count += self._append_chunk(chunk)
+                chunk = []
+        if chunk:
+            count += self._append_chunk(chunk)
+        return count
+
+    def _append_chunk(self, todos: List[Todo]) -> int:
+        """
+        Create missing categories for a chunk, then append its todos.
+
+        Returns:
+            int: The number of appended todos.
+        """
+        index = self._category_index()
+        missing = list(dict.fromkeys(
+            todo.category for todo in todos if todo.category not in index
+        ))
+        if missing:
+            self._add_categories(missing)
+        self._append_todos(todos)
+        return len(todos)
+
+    def _append_todos(self, todos: List[Todo]) -> List[int]:
+        """
+        Append todos to the tasks worksheet in a single request, then
+        record them in the change feed.
+
+        The snapshot is caught up from the change feed first, so ids
+        and positions follow other clients' inserts. The appended rows
+        are indexed where the append response says they went.
+
+        Args:
+            todos (List[Todo]): Todos whose categories already exist.
+
+        Returns:
+            List[int]: The task_ids assigned to the todos.
+        """
+        if self._todos is not None:
+            self._catch_up()
+        next_id = self.get_next_task_id()
+        gap = self.get_position_gap()
+        position = self.get_next_position()
+        index = self._category_index()
+        modified_at = datetime.now().isoformat()
+        rows = []
+        added = []
+        for todo in todos:
+            task_id = todo.task_id or next_id
+            next_id = max(next_id, task_id + 1)
+            date_added = todo.date_added or datetime.now().isoformat()
+            rows.append(
+                [
+                    task_id,
+                    todo.task,
+                    index[todo.category],
+                    date_added,
+                    todo.due_date,
+                    todo.date_completed,
+                    position,
+                    modified_at,
+                ]
+            )
+            added.append(
+                Todo(
+                    task_id=task_id,
+                    task=todo.task,
+                    category=todo.category,
+                    date_added=date_added,
+                    due_date=todo.due_date or "",
+                    date_completed=todo.date_completed or "",
+                    position=position,
+                    modified_at=modified_at,
+                )
+            )
+            position += gap
+
+        if len(rows) == 1:
+            response = self.tasks_worksheet.append_row(rows[0])
+        else:
+            response = self.tasks_worksheet.append_rows(rows)
+        if self._todos is not None:
+            first_row = _first_row(response)
+            if first_row == len(self._todos) + 2:
+                for row, todo in enumerate(added, start=first_row):
+                    self._todos.append(todo)
+                    self._rows[todo.task_id] = row
+            else:
+                # Another client added or deleted rows since the
+                # snapshot was taken.
+                self._reload_snapshot()
+        self._append_changes([self._change_row(t) for t in added])
+        return [todo.task_id for todo in added]
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Buffer cell writes and commit them together at the end.
+
+        Inside the block, writes to the tasks worksheet are collected
+        instead of sent; writes hitting the same cell are merged, so a
+        multi-step edit costs a single batch_update. The buffer is also
+        committed early once it holds flush_size cells or is older than
+        flush_interval seconds, before rows are deleted, and on close().
+        Blocks may be nested; only the outermost one commits.
+
+        Yields:
+            None
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.commit()
+
+    @measured("commit")
+    def commit(self) -> None:
+        """
+        Send all buffered edits as one batch_update.
+
+        If the request fails the edits stay buffered.
+
+        Raises:
+            ValueError:
+            If another client deleted a todo with buffered edits; the
+            other edits are sent.
+        """
+        if not self._buffer:
+            return
+        buffered, self._buffer = self._buffer, {}
+        try:
+            missing = self._send(buffered)
+        except Exception:
+            # Keep the edits for the next commit.
+            newer, self._buffer = self._buffer, buffered
+            self._buffer_edits(newer)
+            raise
+        if missing:
+            raise ValueError(f"Task with id {missing[0]} not found")
+
+    def _buffer_edits(self, edits: Edits) -> None:
+        """Merge edits into the buffer, later values winning."""
+        if not self._buffer:
+            self._buffered_at = time.monotonic()
+        for task_id, fields in edits.items():
+            self._buffer.setdefault(task_id, {}).update(fields)
+
+    def _send(self, edits: Edits) -> List[int]:
+        """
+        Write edits to their verified rows in one batch_update and add
+        the todos' new state to the change feed.
+
+        Args:
+            edits (Edits): New field values by task_id.
+
+        Returns:
+            List[int]:
+            The task_ids that no longer exist; their edits are dropped.
+        """
+        rows = self._verified_rows(edits)
+        index = self._category_index()
+        updates = []
+        for task_id, fields in edits.items():
+            if task_id not in rows:
+                continue
+            for name, value in fields.items():
+                if name == "category":
+                    value = index[value]
+                updates.append({
+                    "range": f"{COLUMNS[name]}{rows[task_id]}",
+                    "values": [[value]],
+                })
+        if updates:
+            self.tasks_worksheet.batch_update(updates)
+        self._log_changes()
+        return [task_id for task_id in edits if task_id not in rows]
+
+    def _write(self, edits: Edits) -> None:
+        """
+        Apply edits to the snapshot, then send them now, or buffer them
+        inside batch().
+
+        Edits name Todo fields rather than cells, so buffered edits stay
+        valid when rows shift; rows are resolved when they are sent.
+        The todos' modified_at is set along with them, and their new
+        state is added to the change feed once the edits are sent.
+
+        Args:
+            edits (Edits): New field values by task_id.
+
+        Raises:
+            ValueError:
+            If another client deleted one of the todos.
+        """
+        if not edits:
+            return
+        modified_at = datetime.now().isoformat()
+        edits = {
+            task_id: {**fields, "modified_at": modified_at}
+            for task_id, fields in edits.items()
+        }
+        self._reapply(edits)
+        self._changed.update(dict.fromkeys(edits))
+        if self._batch_depth == 0:
+            try:
+                missing = self._send(edits)
+            except Exception:
+                # The snapshot already holds the failed writes.
+                self._drop_snapshot()
+                raise
+            if missing:
+                raise ValueError(f"Task with id {missing[0]} not found")
+            return
+        self._buffer_edits(edits)
+        cells = sum(len(fields) for fields in self._buffer.values())
+        age = time.monotonic() - self._buffered_at
+        if cells >= self.flush_size or age >= self.flush_interval:
+            self.commit()
+
+    @measured("update")
     def update_todo(
         self,
         task_id: int,
@@ -122,63 +1275,90 @@ class TodoGoogleSheets:
         due_date: Optional[str] = None,
     ) -> None:
         """Update a todo's task, category, and/or due date."""
-        row = self.find_row_by_task_id(task_id)
-        updates = []
-        if task is not None:
-            updates.append({"range": f"B{row}", "values": [[task]]})
+        self.find_row_by_task_id(task_id)
         if category is not None:
-            category_id = self.get_category_id(category)
-            updates.append({"range": f"C{row}", "values": [[category_id]]})
-        if due_date is not None:
-            updates.append({"range": f"E{row}", "values": [[due_date]]})
-
-        if updates:
-            self.tasks_worksheet.batch_update(updates)
+            self.get_category_id(category)
+        fields = {
+            name: value
+            for name, value in (
+                ("task", task), ("category", category), ("due_date", due_date)
+            )
+            if value is not None
+        }
+        if fields:
+            self._write({task_id: fields})
 
+    @measured("delete")
     def delete_todo(self, task_id: int) -> None:
-        """Delete a todo and update positions of remaining todos."""
-        row = self.find_row_by_task_id(task_id)
-        self.tasks_worksheet.delete_rows(row)
-        self.update_positions()
-
-    def complete_todo(self, task_id: int) -> None:
-        """Mark a todo as completed."""
-        row = self.find_row_by_task_id(task_id)
-        self.tasks_worksheet.update_cell(row, 6, datetime.now().isoformat())
-
-    def get_todos_by_category(self, category: str) -> List[Todo]:
-        """Get all todos for a specific category."""
-        all_todos = self.get_all_todos()
-        return [todo for todo in all_todos if todo.category == category]
-
-    def get_overdue_todos(self) -> List[Todo]:
-        """Get all overdue todos."""
-        all_todos = self.get_all_todos()
-        today = datetime.now().date()
-        return [
-            todo
-            for todo in all_todos
-            if todo.due_date
-            and datetime.fromisoformat(todo.due_date).date() < today
-            and not todo.date_completed
-        ]
+        """
+        Delete a todo.
+
+        In dense mode the positions of the remaining todos are
+        renumbered; in gapped mode the gap is simply left behind.
+        """
+        self.find_row_by_task_id(task_id)
+        dense = self.get_position_gap() == 1
+        # Send buffered edits first, so none of them targets the todo.
+        self.commit()
+        row = self._verified_rows({task_id: {}}).get(task_id)
+        if row is None:
+            raise ValueError(f"Task with id {task_id} not found")
+        try:
+            self.tasks_worksheet.delete_rows(row)
+        except Exception:
+            # The row may or may not be gone.
+            self._drop_snapshot()
+            raise
+        self._forget_row(task_id)
+        self._append_changes([
+            [task_id, "", "", "", "", "", "",
+             datetime.now().isoformat(), "delete"]
+        ])
+        if dense:
+            self.update_positions()
+
+    @measured("complete")
+    def complete_todo(
+        self, task_id: int, date_completed: Optional[str] = None
+    ) -> None:
+        """Mark a todo as completed, by default as of now."""
+        self.find_row_by_task_id(task_id)
+        date_completed = date_completed or datetime.now().isoformat()
+        self._write({task_id: {"date_completed": date_completed}})
 
     def get_next_task_id(self) -> int:
         """Get the next available task_id."""
-        task_ids = self.tasks_worksheet.col_values(1)[1:]  # Exclude header
+        task_ids = [todo.task_id for todo in self._snapshot()]
         return max(map(int, task_ids or [0])) + 1
 
     def get_next_position(self) -> int:
         """Get the next available position."""
-        positions = self.tasks_worksheet.col_values(7)[1:]  # Exclude header
-        return max(map(int, positions or [0])) + 1
+        positions = [todo.position for todo in self._snapshot()]
+        return max(map(int, positions or [0])) + self.get_position_gap()
+
+    def get_position_gap(self) -> int:
+        """
+        Return the position gap in effect for the current todos.
+
+        The gap stored in the sheet by migrate_positions() applies to
+        every client; sheets that were never migrated use position_gap.
+
+        Returns:
+            int:
+            1 for dense positions, otherwise the spacing of new ones.
+        """
+        self._snapshot()
+        if self._stored_gap is not None:
+            return self._stored_gap
+        return self.position_gap
 
     def find_row_by_task_id(self, task_id: int) -> int:
-        """Find the row number for a given task_id."""
-        cell = self.tasks_worksheet.find(str(task_id), in_column=1)
-        if cell is None:
+        """Find the row number for a given task_id in the row index."""
+        self._snapshot()
+        try:
+            return self._rows[task_id]
+        except KeyError:
             raise ValueError(f"Task with id {task_id} not found")
-        return cell.row
 
     def get_category_id(self, category_name: str) -> int:
         """
@@ -193,12 +1373,12 @@ class TodoGoogleSheets:
         Raises:
             ValueError: If the category is not found.
         """
-        categories = self.categories_worksheet.get_all_records()
-        for category in categories:
-            if category["category_name"] == category_name:
-                return category["category_id"]
-        raise ValueError(f"Category '{category_name}' not found")
+        try:
+            return self._category_index()[category_name]
+        except KeyError:
+            raise ValueError(f"Category '{category_name}' not found")
 
+    @measured("add_category")
     def add_category(self, category_name: str) -> None:
         """
         Add a new category.
@@ -206,8 +1386,26 @@ class TodoGoogleSheets:
         Args:
         category_name (str): The name of the new category.
         """
+        self._add_categories([category_name])
+
+    def _add_categories(self, category_names: List[str]) -> None:
+        """
+        Append several categories in one request and index them.
+
+        Args:
+            category_names (List[str]): The names of the new categories.
+        """
         category_id = self.get_next_category_id()
-        self.categories_worksheet.append_row([category_id, category_name])
+        rows = [
+            [category_id + i, name] for i, name in enumerate(category_names)
+        ]
+        if len(rows) == 1:
+            self.categories_worksheet.append_row(rows[0])
+        else:
+            self.categories_worksheet.append_rows(rows)
+        for new_id, name in rows:
+            self._categories[new_id] = name
+            self._category_ids[name] = new_id
 
     def get_next_category_id(self) -> int:
         """
@@ -216,42 +1414,159 @@ class TodoGoogleSheets:
         Returns:
             int: The next available category_id.
         """
-        category_ids = self.categories_worksheet.col_values(1)[1:]
+        category_ids = self._category_index().values()
         return max(map(int, category_ids or [0])) + 1
 
     def update_positions(self) -> None:
-        """Update positions after a todo is deleted."""
-        todos = self.get_all_todos()
-        updates = [
-            {"range": f"G{i+2}", "values": [[i + 1]]}
-            for i in range(len(todos))
-        ]
-        self.tasks_worksheet.batch_update(updates)
+        """
+        Renumber positions densely, keeping their order, after a todo
+        is deleted.
 
+        Only rows whose position changes are written.
+        """
+        ordered = sorted(self._snapshot(), key=lambda x: x.position)
+        self._respace_positions(ordered, 1)
+
+    @measured("reorder")
     def reorder_todo(self, task_id: int, new_position: int) -> None:
-        """Change the position of a todo."""
+        """
+        Change the position of a todo.
+
+        new_position is the 1-based rank the todo should end up at in
+        both modes, see get_position_gap(). In dense mode the shifted
+        positions are computed locally and written to column G in a
+        single batch update, regardless of the distance the todo is
+        moved. In gapped mode only the moved todo is rewritten, taking
+        the midpoint between its new neighbours; positions are
+        compacted first when no gap is left.
+
+        Args:
+            task_id (int): The id of the todo to move.
+            new_position (int): The position to move the todo to.
+        """
         todos = self.get_all_todos()
-        todos.sort(key=lambda x: x.position)
+        todo_to_move = self._cached_todo(task_id)
+        if todo_to_move is None:
+            raise ValueError(f"Task with id {task_id} not found")
+
+        gap = self.get_position_gap()
+        if gap > 1:
+            self._reorder_gapped(todo_to_move, new_position, gap)
+            return
 
-        todo_to_move = next(todo for todo in todos if todo.task_id == task_id)
-        old_position = todo_to_move.position
+        ordered = sorted(
+            (todo for todo in todos if todo is not todo_to_move),
+            key=lambda x: x.position,
+        )
+        rank = max(1, min(new_position, len(ordered) + 1))
+        ordered.insert(rank - 1, todo_to_move)
+        self._respace_positions(ordered, 1)
+
+    def _reorder_gapped(
+        self, todo_to_move: Todo, rank: int, gap: int
+    ) -> None:
+        """
+        Move a todo to a rank by writing the midpoint of its neighbours.
 
-        if old_position < new_position:
-            for todo in todos:
-                if old_position < todo.position <= new_position:
-                    self.update_position(todo.task_id, todo.position - 1)
+        Args:
+            todo_to_move (Todo): The cached todo to move.
+            rank (int): The 1-based rank the todo should end up at.
+            gap (int): The position gap in effect.
+        """
+        others = sorted(
+            (todo for todo in self._todos if todo is not todo_to_move),
+            key=lambda x: x.position,
+        )
+        rank = max(1, min(rank, len(others) + 1))
+        low = others[rank - 2].position if rank > 1 else 0
+        if rank <= len(others):
+            high = others[rank - 1].position
         else:
-            for todo in todos:
-                if new_position <= todo.position < old_position:
-                    self.update_position(todo.task_id, todo.position + 1)
+            high = low + 2 * gap
+
+        if high - low > 1:
+            self.update_position(todo_to_move.task_id, (low + high) // 2)
+            return
 
-        self.update_position(task_id, new_position)
+        others.insert(rank - 1, todo_to_move)
+        self._respace_positions(others, gap)
+
+    @measured("reorder")
+    def compact_positions(self) -> None:
+        """
+        Respace all positions evenly by the position gap in effect,
+        keeping the order.
+
+        Only rows whose position changes are written, in one batch.
+        """
+        todos = sorted(self.get_all_todos(), key=lambda x: x.position)
+        self._respace_positions(todos, self.get_position_gap())
+
+    @measured("reorder")
+    def migrate_positions(
+        self, position_gap: int = DEFAULT_POSITION_GAP
+    ) -> None:
+        """
+        One-shot migration of an existing sheet to gapped positions.
+
+        The gap is stored in cell L1 of the changes worksheet before any
+        position is rewritten, so other clients and later runs use it
+        without any setting, and a respacing that fails partway leaves
+        the sheet in the new mode rather than a guessed one. Migrating
+        with a position_gap of 1 makes the positions dense again.
+
+        Args:
+            position_gap (int):
+            The spacing to use from now on. Defaults to
+            DEFAULT_POSITION_GAP.
+        """
+        todos = sorted(self.get_all_todos(), key=lambda x: x.position)
+        self._changes().batch_update(
+            [{"range": "L1", "values": [[position_gap]]}]
+        )
+        self._stored_gap = position_gap
+        self.position_gap = position_gap
+        self._respace_positions(todos, position_gap)
+
+    def _respace_positions(self, ordered: List[Todo], gap: int) -> None:
+        """
+        Assign positions (i + 1) * gap to todos in the given order.
+
+        Args:
+            ordered (List[Todo]): The cached todos in their desired order.
+            gap (int): The spacing; 1 for dense positions.
+        """
+        moves = {
+            todo.task_id: (i + 1) * gap
+            for i, todo in enumerate(ordered)
+            if todo.position != (i + 1) * gap
+        }
+        self.update_positions_batch(moves)
+
+    def update_positions_batch(self, moves: Dict[int, int]) -> None:
+        """
+        Write several new positions to column G in one batch update.
+
+        Args:
+            moves (Dict[int, int]): Mapping of task_id to new position.
+        """
+        for task_id in moves:
+            self.find_row_by_task_id(task_id)
+        self._write({
+            task_id: {"position": position}
+            for task_id, position in moves.items()
+        })
 
     def update_position(self, task_id: int, new_position: int) -> None:
         """Update the position of a specific todo."""
-        row = self.find_row_by_task_id(task_id)
-        self.tasks_worksheet.update_cell(row, 7, new_position)
+        self.find_row_by_task_id(task_id)
+        self._write({task_id: {"position": new_position}})
 
+    @measured("categories")
     def get_all_categories(self) -> List[Dict[str, Any]]:
-        """Get all categories from the Google Sheet."""
-        return self.categories_worksheet.get_all_records()
+        """Get all categories from the category index."""
+        self._category_index()
+        return [
+            {"category_id": category_id, "category_name": category_name}
+            for category_id, category_name in self._categories.items()
+        ]
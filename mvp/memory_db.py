@@ -0,0 +1,224 @@
+from bisect import bisect_left, insort
+from typing import List, Dict, Any, Iterable, Optional, Set, Tuple
+from datetime import datetime
+from .backend import TodoBackend, TodoQuery, DEFAULT_CATEGORIES
+from .model import Todo
+
+
+class TodoMemory(TodoBackend):
+    """
+    Pure in-memory reference backend.
+
+    Todos live in a dict keyed by task_id, with a sorted list of
+    (position, task_id) pairs, a sorted list of (due_date, task_id)
+    pairs and a per-category set of task ids as secondary indexes.
+    Nothing is persisted, which makes it suitable for tests and for
+    benchmarking CLI logic without network cost.
+    """
+
+    display_name = "the in-memory store"
+
+    def __init__(self, categories: Optional[List[str]] = None):
+        """
+        Initialize the TodoMemory class.
+
+        Args:
+            categories (Optional[List[str]]):
+            Initial category names. Defaults to DEFAULT_CATEGORIES.
+        """
+        self._todos: Dict[int, Todo] = {}
+        self._by_position: List[Tuple[int, int]] = []
+        self._by_due_date: List[Tuple[str, int]] = []
+        self._by_category: Dict[str, Set[int]] = {}
+        self._category_ids: Dict[str, int] = {}
+        if categories is None:
+            categories = DEFAULT_CATEGORIES
+        for category_name in categories:
+            self.add_category(category_name)
+
+    def _get(self, task_id: int) -> Todo:
+        """
+        Return the stored todo for a task_id.
+
+        Raises:
+            ValueError: If the task does not exist.
+        """
+        try:
+            return self._todos[task_id]
+        except KeyError:
+            raise ValueError(f"Task with id {task_id} not found")
+
+    def _index(self, todo: Todo) -> None:
+        """Add a todo to the secondary indexes."""
+        insort(self._by_position, (todo.position, todo.task_id))
+        if todo.due_date:
+            insort(self._by_due_date, (todo.due_date, todo.task_id))
+        self._by_category.setdefault(todo.category, set()).add(todo.task_id)
+
+    def _unindex(self, todo: Todo) -> None:
+        """Remove a todo from the secondary indexes."""
+        self._by_position.remove((todo.position, todo.task_id))
+        if todo.due_date:
+            self._by_due_date.remove((todo.due_date, todo.task_id))
+        self._by_category[todo.category].discard(todo.task_id)
+
+    def get_all_todos(self) -> List[Todo]:
+        """Retrieve all todos in insertion order."""
+        return list(self._todos.values())
+
+    def insert_todo(self, todo: Todo) -> int:
+        """
+        Insert a new todo.
+
+        The todo's own task_id is kept if it has one, otherwise the next
+        available id is assigned.
+
+        Raises:
+            ValueError:
+            If the category is unknown or the task_id is already taken.
+        """
+        self.get_category_id(todo.category)
+        if todo.task_id in self._todos:
+            raise ValueError(f"Task with id {todo.task_id} already exists")
+        stored = Todo(
+            task_id=todo.task_id or max(self._todos, default=0) + 1,
+            task=todo.task,
+            category=todo.category,
+            date_added=todo.date_added or datetime.now().isoformat(),
+            due_date=todo.due_date,
+            date_completed=todo.date_completed,
+            position=self.get_next_position(),
+        )
+        self._todos[stored.task_id] = stored
+        self._index(stored)
+        return stored.task_id
+
+    def update_todo(
+        self,
+        task_id: int,
+        task: Optional[str] = None,
+        category: Optional[str] = None,
+        due_date: Optional[str] = None,
+    ) -> None:
+        """Update a todo's task, category, and/or due date."""
+        todo = self._get(task_id)
+        if category is not None:
+            self.get_category_id(category)
+        self._unindex(todo)
+        if task is not None:
+            todo.task = task
+        if category is not None:
+            todo.category = category
+        if due_date is not None:
+            todo.due_date = due_date
+        self._index(todo)
+
+    def delete_todo(self, task_id: int) -> None:
+        """Delete a todo and update positions of remaining todos."""
+        todo = self._get(task_id)
+        self._unindex(todo)
+        del self._todos[task_id]
+        start = bisect_left(self._by_position, (todo.position, task_id))
+        for i in range(start, len(self._by_position)):
+            position, other_id = self._by_position[i]
+            self._todos[other_id].position = position - 1
+            self._by_position[i] = (position - 1, other_id)
+
+    def complete_todo(
+        self, task_id: int, date_completed: Optional[str] = None
+    ) -> None:
+        """Mark a todo as completed, by default as of now."""
+        todo = self._get(task_id)
+        todo.date_completed = date_completed or datetime.now().isoformat()
+
+    def reorder_todo(self, task_id: int, new_position: int) -> None:
+        """
+        Change the position of a todo.
+
+        new_position is clamped to 1..n, as in the other backends.
+        """
+        todo = self._get(task_id)
+        old_position = todo.position
+        new_position = max(1, min(new_position, len(self._todos)))
+        low, high = sorted((old_position, new_position))
+        shift = -1 if old_position < new_position else 1
+        start = bisect_left(self._by_position, (low, 0))
+        end = bisect_left(self._by_position, (high + 1, 0))
+        for position, other_id in self._by_position[start:end]:
+            if other_id != task_id:
+                self._todos[other_id].position = position + shift
+        todo.position = new_position
+        self._by_position[start:end] = sorted(
+            (self._todos[other_id].position, other_id)
+            for _, other_id in self._by_position[start:end]
+        )
+
+    def find_todos(self, query: TodoQuery) -> List[Todo]:
+        """
+        Return the todos matching a query.
+
+        Candidates come from the category set and the due date range of
+        the indexes, whichever apply; only they are checked against the
+        rest of the query.
+
+        Args:
+            query (TodoQuery): The filter.
+
+        Returns:
+            List[Todo]: The matching todos ordered by task_id.
+        """
+        candidates: Optional[Iterable[int]] = None
+        if query.category is not None:
+            candidates = self._by_category.get(query.category, set())
+        if query.due_after is not None or query.due_before is not None:
+            start = 0
+            end = len(self._by_due_date)
+            if query.due_after is not None:
+                start = bisect_left(
+                    self._by_due_date, (query.due_after.isoformat(), 0)
+                )
+            if query.due_before is not None:
+                end = bisect_left(
+                    self._by_due_date, (query.due_before.isoformat(), 0)
+                )
+            in_range = {
+                task_id for _, task_id in self._by_due_date[start:end]
+            }
+            candidates = (
+                in_range if candidates is None else in_range & candidates
+            )
+        if candidates is None:
+            candidates = self._todos
+        return [
+            self._todos[task_id]
+            for task_id in sorted(candidates)
+            if query.matches(self._todos[task_id])
+        ]
+
+    def get_next_position(self) -> int:
+        """Get the next available position."""
+        return self._by_position[-1][0] + 1 if self._by_position else 1
+
+    def get_category_id(self, category_name: str) -> int:
+        """
+        Get the category_id for a given category name.
+
+        Raises:
+            ValueError: If the category is not found.
+        """
+        try:
+            return self._category_ids[category_name]
+        except KeyError:
+            raise ValueError(f"Category '{category_name}' not found")
+
+    def add_category(self, category_name: str) -> None:
+        """Add a new category."""
+        category_id = max(self._category_ids.values(), default=0) + 1
+        self._category_ids[category_name] = category_id
+
+    def get_all_categories(self) -> List[Dict[str, Any]]:
+        """Get all categories."""
+        return [
+            {"category_id": category_id, "category_name": category_name}
+            for category_name, category_id in self._category_ids.items()
+        ]
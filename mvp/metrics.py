@@ -0,0 +1,286 @@
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterator, Optional
+from urllib.parse import urlencode
+
+# Operation the requests made in the current context are counted for.
+_operation: ContextVar[Optional[str]] = ContextVar(
+    "todo_operation", default=None
+)
+
+UNATTRIBUTED = "other"
+
+
+class BudgetExceeded(AssertionError):
+    """An operation made more remote requests than its budget allows."""
+
+
+@dataclass
+class OperationMetrics:
+    """
+    Remote requests made on behalf of one high-level operation.
+
+    Attributes:
+        calls (int): Number of times the operation ran.
+        requests (int): HTTP requests sent, retries included.
+        errors (int): Requests answered with an error status.
+        bytes_sent (int): Size of the URLs, queries and JSON bodies.
+        bytes_received (int): Size of the response bodies.
+        seconds (float): Time spent waiting for responses.
+    """
+
+    calls: int = 0
+    requests: int = 0
+    errors: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    seconds: float = 0.0
+
+
+class RequestMetrics:
+    """
+    Count remote requests, bytes and latency per high-level operation.
+
+    The metrics hook into a gspread Client's HTTP session, so every
+    request is seen exactly once, whichever worksheet, scheduler retry
+    or queued write sent it. Backend methods declare the operation they
+    implement with the measured() decorator; requests made while one
+    runs are counted for it, and nested operations count for the
+    outermost one, e.g. the commit triggered by a delete is part of the
+    delete. A write queued by one thread can be sent by another thread's
+    flush and is then counted for that thread's operation.
+
+    Attributes:
+        operations (Dict[str, OperationMetrics]):
+        Metrics by operation name; requests made outside any operation
+        are counted under UNATTRIBUTED.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        """
+        Initialize RequestMetrics with no recorded requests.
+
+        Args:
+            clock (Callable[[], float]): Clock used to time requests.
+        """
+        self.operations: Dict[str, OperationMetrics] = {}
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def _entry(self, operation: str) -> OperationMetrics:
+        if operation not in self.operations:
+            self.operations[operation] = OperationMetrics()
+        return self.operations[operation]
+
+    @contextmanager
+    def operation(self, name: str) -> Iterator[None]:
+        """
+        Count the requests made inside the block for an operation.
+
+        Args:
+            name (str): The operation, e.g. "complete".
+
+        Yields:
+            None
+        """
+        if _operation.get() is not None:
+            yield
+            return
+        with self._lock:
+            self._entry(name).calls += 1
+        token = _operation.set(name)
+        try:
+            yield
+        finally:
+            _operation.reset(token)
+
+    def record(
+        self,
+        bytes_sent: int,
+        bytes_received: int,
+        seconds: float,
+        error: bool = False,
+    ) -> None:
+        """
+        Record one request for the operation currently running.
+
+        Args:
+            bytes_sent (int): Size of the request.
+            bytes_received (int): Size of the response body.
+            seconds (float): Time until the response arrived.
+            error (bool): Whether the response was an error.
+        """
+        with self._lock:
+            entry = self._entry(_operation.get() or UNATTRIBUTED)
+            entry.requests += 1
+            entry.errors += error
+            entry.bytes_sent += bytes_sent
+            entry.bytes_received += bytes_received
+            entry.seconds += seconds
+
+    def instrument(self, client: Any) -> Any:
+        """
+        Route a gspread Client's requests through these metrics.
+
+        Args:
+            client (gspread.Client): The client to instrument.
+
+        Returns:
+            gspread.Client: The same client.
+        """
+        http_client = client.http_client
+        if not isinstance(http_client.session, MeteredSession):
+            http_client.session = MeteredSession(http_client.session, self)
+        return client
+
+    def total(self) -> OperationMetrics:
+        """Return the metrics of all operations added up."""
+        total = OperationMetrics()
+        with self._lock:
+            for entry in self.operations.values():
+                for name, value in asdict(entry).items():
+                    setattr(total, name, getattr(total, name) + value)
+        return total
+
+    def reset(self) -> None:
+        """Forget all recorded requests."""
+        with self._lock:
+            self.operations.clear()
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Return the metrics by operation as JSON-serializable dicts."""
+        with self._lock:
+            return {
+                name: asdict(entry)
+                for name, entry in sorted(self.operations.items())
+            }
+
+    def report(self) -> str:
+        """Return the metrics as a human readable table."""
+        lines = [
+            f"{'operation':<12} {'calls':>5} {'requests':>8} "
+            f"{'errors':>6} {'sent':>10} {'received':>10} {'seconds':>8}"
+        ]
+        for name, entry in self.as_dict().items():
+            lines.append(
+                f"{name:<12} {entry['calls']:>5} {entry['requests']:>8} "
+                f"{entry['errors']:>6} {entry['bytes_sent']:>10} "
+                f"{entry['bytes_received']:>10} {entry['seconds']:>8.3f}"
+            )
+        return "\n".join(lines)
+
+    @contextmanager
+    def budget(
+        self, requests: int, operation: Optional[str] = None
+    ) -> Iterator[None]:
+        """
+        Fail if the block makes more than a number of requests.
+
+        Meant for tests guarding round trips against regressions:
+
+            with sheets.metrics.budget(2):
+                sheets.complete_todo(1)
+
+        Args:
+            requests (int): The most requests the block may make.
+            operation (Optional[str]):
+            Only count requests of this operation. Defaults to all.
+
+        Yields:
+            None
+
+        Raises:
+            BudgetExceeded: If the block made more requests.
+        """
+
+        def count() -> int:
+            if operation is None:
+                return self.total().requests
+            with self._lock:
+                entry = self.operations.get(operation)
+                return entry.requests if entry else 0
+
+        before = count()
+        yield
+        used = count() - before
+        if used > requests:
+            raise BudgetExceeded(
+                f"{operation or 'block'} made {used} requests, "
+                f"budget is {requests}"
+            )
+
+
+class MeteredSession:
+    """
+    HTTP session proxy recording every request in RequestMetrics.
+
+    Attributes:
+        session (requests.Session): The wrapped session.
+        metrics (RequestMetrics): Where requests are recorded.
+    """
+
+    def __init__(self, session: Any, metrics: RequestMetrics):
+        """
+        Initialize the MeteredSession.
+
+        Args:
+            session (requests.Session): The session to wrap.
+            metrics (RequestMetrics): Where requests are recorded.
+        """
+        self.session = session
+        self.metrics = metrics
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.session, name)
+
+    def request(self, method: str, url: str, **kwargs) -> Any:
+        """Send a request through the wrapped session and record it."""
+        sent = len(url)
+        if kwargs.get("params"):
+            sent += len(urlencode(
+                {k: v for k, v in kwargs["params"].items() if v is not None},
+                doseq=True,
+            ))
+        if kwargs.get("json") is not None:
+            sent += len(json.dumps(kwargs["json"]))
+        start = self.metrics._clock()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except Exception:
+            self.metrics.record(sent, 0, self.metrics._clock() - start, True)
+            raise
+        self.metrics.record(
+            sent,
+            len(response.content or b""),
+            self.metrics._clock() - start,
+            not response.ok,
+        )
+        return response
+
+
+def measured(operation: str) -> Callable:
+    """
+    Decorate a backend method as a high-level operation.
+
+    Requests the method makes are counted for the operation in the
+    backend's metrics attribute.
+
+    Args:
+        operation (str): The operation name, e.g. "delete".
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.metrics.operation(operation):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
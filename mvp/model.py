@@ -1,13 +1,51 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from datetime import datetime, date
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
+# Initial value of the parsed date caches; never matches a field value.
+_UNPARSED: Tuple[Any, Optional[date]] = (object(), None)
 
-@dataclass
+
+def _to_iso(field: str, value: Any) -> Any:
+    """
+    Convert a date field value that is not a string to an ISO string.
+
+    Args:
+        field (str): The field name, for the error message.
+        value (Any): The value to convert.
+
+    Returns:
+        Any: The ISO string, or the value itself if it is empty.
+
+    Raises:
+        ValueError: If the value is neither a date nor a datetime object.
+    """
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if value:
+        raise ValueError(
+            f"{field} must be a string, date, or datetime object"
+        )
+    return value
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    """Parse an ISO date or datetime string to a date, None if empty."""
+    return datetime.fromisoformat(value).date() if value else None
+
+
+@dataclass(slots=True)
 class Todo:
     """
     Represents a Todo item in the task management system.
 
+    Todos are slotted to keep large lists compact. Backends decoding
+    rows they wrote themselves use the trusted() constructor, which
+    skips the date validation done by the regular constructor.
+
+    The due and completed_on properties parse their ISO string once and
+    cache the result until the string is replaced.
+
     Attributes:
         task (str):
         The description of the todo task.
@@ -23,6 +61,9 @@ class Todo:
         The date when the task was completed. Defaults to None.
         position (Optional[int]):
         The position of the task in the list. Defaults to None.
+        modified_at (Optional[str]):
+        When the task was last written, if the backend tracks it.
+        Defaults to None.
     """
 
     task: str
@@ -32,37 +73,129 @@ class Todo:
     due_date: Optional[str] = None
     date_completed: Optional[str] = None
     position: Optional[int] = None
+    modified_at: Optional[str] = None
+    _due_cache: Tuple[Any, Optional[date]] = field(
+        default=_UNPARSED, init=False, repr=False, compare=False
+    )
+    _completed_cache: Tuple[Any, Optional[date]] = field(
+        default=_UNPARSED, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """
         Post-initialization method to validate and convert date fields.
-        """
-        self._validate_dates()
-        self._convert_dates_to_iso()
-
-    def _validate_dates(self):
-        """
-        Basic validation for date fields.
 
         Raises:
             ValueError:
             If a date field is neither a string nor a date/datetime object.
         """
-        for field in ["date_added", "due_date", "date_completed"]:
-            value = getattr(self, field)
-            if value and not isinstance(value, (str, date, datetime)):
-                raise ValueError(
-                    f"{field} must be a string, date, or datetime object"
-                )
+        # Strings and None, by far the common case, need no work.
+        if self.date_added is not None and type(self.date_added) is not str:
+            self.date_added = _to_iso("date_added", self.date_added)
+        if self.due_date is not None and type(self.due_date) is not str:
+            self.due_date = _to_iso("due_date", self.due_date)
+        if (
+            self.date_completed is not None
+            and type(self.date_completed) is not str
+        ):
+            self.date_completed = _to_iso(
+                "date_completed", self.date_completed
+            )
+
+    @classmethod
+    def trusted(
+        cls,
+        task_id: Optional[int],
+        task: str,
+        category: str,
+        date_added: Optional[str] = None,
+        due_date: Optional[str] = None,
+        date_completed: Optional[str] = None,
+        position: Optional[int] = None,
+        modified_at: Optional[str] = None,
+    ) -> "Todo":
+        """
+        Create a Todo from already validated values, skipping checks.
+
+        The arguments follow the column order of the storage backends,
+        so a decoded row can be passed as Todo.trusted(*row). Dates must
+        already be ISO strings or None.
+
+        Returns:
+            Todo: The new Todo instance.
+        """
+        todo = object.__new__(cls)
+        todo.task_id = task_id
+        todo.task = task
+        todo.category = category
+        todo.date_added = date_added
+        todo.due_date = due_date
+        todo.date_completed = date_completed
+        todo.position = position
+        todo.modified_at = modified_at
+        todo._due_cache = _UNPARSED
+        todo._completed_cache = _UNPARSED
+        return todo
 
-    def _convert_dates_to_iso(self):
+    @property
+    def due(self) -> Optional[date]:
         """
-        Convert date fields to ISO format strings.
+        The due date as a date object, or None if there is none.
+
+        Returns:
+            Optional[date]: The parsed due_date.
         """
-        for field in ["date_added", "due_date", "date_completed"]:
-            value = getattr(self, field)
-            if isinstance(value, (date, datetime)):
-                setattr(self, field, value.isoformat())
+        cache = self._due_cache
+        if cache[0] is not self.due_date:
+            cache = self._due_cache = (
+                self.due_date, _parse_date(self.due_date)
+            )
+        return cache[1]
+
+    @property
+    def completed_on(self) -> Optional[date]:
+        """
+        The completion date as a date object, or None if still open.
+
+        Returns:
+            Optional[date]: The parsed date_completed.
+        """
+        cache = self._completed_cache
+        if cache[0] is not self.date_completed:
+            cache = self._completed_cache = (
+                self.date_completed, _parse_date(self.date_completed)
+            )
+        return cache[1]
+
+    def is_overdue(self, today: date) -> bool:
+        """
+        Check whether the todo is open and was due before a date.
+
+        Callers checking many todos pass the same reference date to all
+        of them instead of reading the clock per todo.
+
+        Args:
+            today (date): The reference date.
+
+        Returns:
+            bool: True if the todo is overdue on that date.
+        """
+        if self.date_completed:
+            return False
+        due = self.due
+        return due is not None and due < today
+
+    @property
+    def completed_late(self) -> bool:
+        """
+        Whether the todo was completed after its due date.
+
+        Returns:
+            bool: True if both dates are set and completion was later.
+        """
+        completed = self.completed_on
+        due = self.due
+        return completed is not None and due is not None and completed > due
 
     @property
     def status(self) -> str:
@@ -79,10 +212,21 @@ class Todo:
         """
         Convert the Todo object to a dictionary.
 
+        All fields are immutable scalars, so no deep copy is needed.
+
         Returns:
             Dict[str, Any]: A dictionary representation of the Todo object.
         """
-        return asdict(self)
+        return {
+            "task": self.task,
+            "category": self.category,
+            "task_id": self.task_id,
+            "date_added": self.date_added,
+            "due_date": self.due_date,
+            "date_completed": self.date_completed,
+            "position": self.position,
+            "modified_at": self.modified_at,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Todo":
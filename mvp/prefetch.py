@@ -0,0 +1,75 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+DEFAULT_MAX_WORKERS = 2
+
+
+class Prefetcher:
+    """
+    Run likely-next backend reads in a thread pool.
+
+    TodoCLI starts loading todos and categories while the main menu is
+    shown, so by the time the user picks an action the data is local.
+    Each prefetched result is handed out once: later reads, and reads
+    made after a write, go to the backend again.
+
+    Attributes:
+        executor (ThreadPoolExecutor): The pool running the loaders.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        """
+        Initialize the Prefetcher.
+
+        Args:
+            max_workers (int): Number of loader threads.
+        """
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="todo-prefetch"
+        )
+        self._pending: Dict[str, Future] = {}
+
+    def prefetch(self, key: str, loader: Callable[[], Any]) -> None:
+        """
+        Start loading a value in the background.
+
+        A result for the same key that has not been used yet is
+        replaced, so the data is as fresh as the last menu draw.
+
+        Args:
+            key (str): Name of the value, e.g. "todos".
+            loader (Callable[[], Any]): Function that loads it.
+        """
+        self._pending[key] = self.executor.submit(loader)
+
+    def get(self, key: str, loader: Callable[[], Any]) -> Any:
+        """
+        Return a prefetched value, waiting for it if still loading.
+
+        Falls back to calling the loader if nothing was prefetched.
+
+        Args:
+            key (str): Name of the value.
+            loader (Callable[[], Any]): Function that loads it.
+
+        Returns:
+            Any: The loaded value.
+
+        Raises:
+            Exception: Any error raised by the loader.
+        """
+        future = self._pending.pop(key, None)
+        if future is None:
+            return loader()
+        return future.result()
+
+    def discard(self) -> None:
+        """Drop all prefetched values, e.g. after a write."""
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+
+    def shutdown(self) -> None:
+        """Drop prefetched values and stop the loader threads."""
+        self.discard()
+        self.executor.shutdown(wait=False)
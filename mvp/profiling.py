@@ -0,0 +1,150 @@
+import cProfile
+import os
+import pstats
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_PROFILE_DIR = os.path.join("~", ".cache", "task_tracker", "profiles")
+
+Function = Tuple[str, int, str]
+
+
+def frame_name(func: Function) -> str:
+    """Return a flamegraph frame name for a pstats function key."""
+    filename, line, name = func
+    if filename == "~":
+        return name
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def collapsed_stacks(stats: pstats.Stats) -> List[str]:
+    """
+    Convert profile statistics into collapsed stacks.
+
+    cProfile only records caller/callee pairs, not whole stacks, so each
+    function's time is split between its callers in proportion to the
+    time spent on each call path. The result is exact for call trees
+    and a close estimate where functions are shared.
+
+    Args:
+        stats (pstats.Stats): The profile statistics.
+
+    Returns:
+        List[str]:
+        Lines of "frame;frame;... microseconds", the input format of
+        flamegraph.pl, speedscope and similar tools.
+    """
+    raw = stats.stats
+    callees: Dict[Function, List[Tuple[Function, float]]] = {}
+    roots = []
+    for func, (_, _, _, cumulative, callers) in raw.items():
+        known = [caller for caller in callers if caller in raw]
+        if not known:
+            roots.append((func, cumulative))
+        for caller in known:
+            callees.setdefault(caller, []).append(
+                (func, callers[caller][3])
+            )
+
+    lines: Dict[str, float] = {}
+
+    def walk(func, seconds, path, seen):
+        cumulative = raw[func][3]
+        share = seconds / cumulative if cumulative else 0.0
+        stack = path + [frame_name(func)]
+        key = ";".join(stack)
+        lines[key] = lines.get(key, 0.0) + raw[func][2] * share
+        for callee, edge_time in callees.get(func, []):
+            if callee not in seen:
+                walk(callee, edge_time * share, stack, seen | {callee})
+
+    for func, cumulative in roots:
+        walk(func, cumulative, [], {func})
+    return [
+        f"{stack} {round(seconds * 1e6)}"
+        for stack, seconds in lines.items()
+        if round(seconds * 1e6) > 0
+    ]
+
+
+class ActionProfiler:
+    """
+    Profile CLI actions with cProfile and write one report per action.
+
+    Each profiled action produces two files named after the time and the
+    action: a .pstats file for pstats and snakeviz, and a .collapsed
+    file of collapsed stacks for flamegraph tools. Interactive actions
+    include the time spent waiting for the user, which shows up under
+    the menu and input functions. Only the calling thread is profiled;
+    background work such as prefetching is not included.
+
+    Attributes:
+        directory (str): Where the reports are written.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Initialize the ActionProfiler.
+
+        Args:
+            directory (Optional[str]):
+            Where the reports are written. Defaults to the
+            TODO_PROFILE_DIR environment variable or DEFAULT_PROFILE_DIR.
+        """
+        if directory is None:
+            directory = os.environ.get(
+                "TODO_PROFILE_DIR", DEFAULT_PROFILE_DIR
+            )
+        self.directory = os.path.expanduser(directory)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def profile(self, name: str) -> Iterator[None]:
+        """
+        Profile the block and write its reports.
+
+        Profiles do not nest, so a block started while another one runs
+        is left to the outer profile.
+
+        Args:
+            name (str): The action name used in the file names.
+
+        Yields:
+            None
+        """
+        if not self._lock.acquire(blocking=False):
+            yield
+            return
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            try:
+                self.write(name, profile)
+            finally:
+                self._lock.release()
+
+    def write(self, name: str, profile: cProfile.Profile) -> str:
+        """
+        Write a profile's .pstats and .collapsed reports.
+
+        Args:
+            name (str): The action name.
+            profile (cProfile.Profile): The finished profile.
+
+        Returns:
+            str: The report path without extension.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        base = os.path.join(self.directory, f"{stamp}-{name}")
+        stats = pstats.Stats(profile)
+        stats.dump_stats(f"{base}.pstats")
+        with open(f"{base}.collapsed", "w", encoding="utf-8") as f:
+            for line in collapsed_stacks(stats):
+                f.write(line + "\n")
+        return base
@@ -0,0 +1,538 @@
+import json
+import logging
+import os
+import sys
+import threading
+from typing import List, Dict, Any, Optional, Callable
+from datetime import datetime
+from .backend import TodoBackend, TodoQuery, create_backend
+from .model import Todo
+from .sqlite_db import TodoSQLite
+
+DEFAULT_REPLICA = "replica.db"
+DEFAULT_SYNC_INTERVAL = 30.0
+
+# Operations that add or remove rows. Remote backends send these at
+# once even inside batch(), so they are done when the call returns;
+# cell edits may still sit in the batch's buffer.
+UNBUFFERED_OPS = {"insert_todo", "delete_todo", "add_category"}
+
+logger = logging.getLogger(__name__)
+
+
+def is_offline_error(error: Exception) -> bool:
+    """
+    Check whether a failed sync means the remote could not be used.
+
+    Network errors, including requests' ConnectionError and Timeout,
+    are OSErrors. gspread and google-auth are only imported by the
+    Google Sheets backend, so their errors are checked only once they
+    have been loaded.
+
+    Args:
+        error (Exception): The error raised by the sync.
+
+    Returns:
+        bool: True for network and API errors, False for anything else.
+    """
+    if isinstance(error, OSError):
+        return True
+    for module, name in [
+        ("gspread.exceptions", "APIError"),
+        ("google.auth.exceptions", "TransportError"),
+    ]:
+        exceptions = sys.modules.get(module)
+        if exceptions is not None and isinstance(
+            error, getattr(exceptions, name)
+        ):
+            return True
+    return False
+
+OPLOG_SCHEMA = """
+CREATE TABLE IF NOT EXISTS oplog (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    op TEXT NOT NULL,
+    task_id INTEGER,
+    payload TEXT NOT NULL,
+    modified_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_oplog_task ON oplog (task_id);
+"""
+
+
+class TodoReplica(TodoBackend):
+    """
+    Offline-first backend backed by a durable local SQLite replica.
+
+    Every read and write hits the local replica immediately. Writes are
+    also recorded in an operation log in the same database, which a
+    background SyncWorker pushes to the remote backend (Google Sheets by
+    default) before pulling remote changes back.
+
+    Conflicts are resolved per task_id: a task with pending local
+    operations keeps its local state unless the remote copy carries a
+    newer modified_at stamp; every other task takes the remote state.
+
+    Attributes:
+        local (TodoSQLite): The local replica.
+        remote (Optional[TodoBackend]):
+        The remote backend, connected lazily by the first sync.
+    """
+
+    display_name = "the local replica"
+
+    def __init__(
+        self,
+        database: Optional[str] = None,
+        remote_factory: Optional[Callable[[], TodoBackend]] = None,
+        sync_interval: Optional[float] = None,
+        start_sync: bool = True,
+    ):
+        """
+        Initialize the TodoReplica class.
+
+        Args:
+            database (Optional[str]):
+            Path of the replica database. Defaults to the
+            TODO_REPLICA_PATH environment variable or DEFAULT_REPLICA.
+            remote_factory (Optional[Callable[[], TodoBackend]]):
+            Creates the remote backend. Defaults to the Google Sheets
+            backend.
+            sync_interval (Optional[float]):
+            Seconds between background syncs. Defaults to the
+            TODO_SYNC_INTERVAL environment variable or
+            DEFAULT_SYNC_INTERVAL.
+            start_sync (bool):
+            Whether to start the background SyncWorker.
+        """
+        if database is None:
+            database = os.environ.get("TODO_REPLICA_PATH", DEFAULT_REPLICA)
+        if sync_interval is None:
+            sync_interval = float(
+                os.environ.get("TODO_SYNC_INTERVAL", DEFAULT_SYNC_INTERVAL)
+            )
+        self.local = TodoSQLite(database)
+        self.local.conn.executescript(OPLOG_SCHEMA)
+        self.remote: Optional[TodoBackend] = None
+        self._remote_token: Optional[str] = None
+        self.remote_factory = remote_factory or (
+            lambda: create_backend("sheets")
+        )
+        self._lock = threading.RLock()
+        self._sync_lock = threading.Lock()
+        self.worker = SyncWorker(self, sync_interval)
+        if start_sync:
+            self.worker.start()
+
+    @property
+    def metrics(self):
+        """The remote backend's request metrics, once it is connected."""
+        return self.remote.metrics if self.remote is not None else None
+
+    def _log(
+        self,
+        op: str,
+        task_id: Optional[int],
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Append an operation to the log and wake the sync worker.
+
+        Args:
+            op (str): Name of the backend method to replay remotely.
+            task_id (Optional[int]): The task the operation applies to.
+            payload (Optional[Dict[str, Any]]):
+            Keyword arguments for the remote method.
+        """
+        with self.local.conn:
+            self.local.conn.execute(
+                "INSERT INTO oplog (op, task_id, payload, modified_at)"
+                " VALUES (?, ?, ?, ?)",
+                (op, task_id, json.dumps(payload or {}),
+                 datetime.now().isoformat()),
+            )
+        self.worker.wake()
+
+    def pending_operations(self) -> int:
+        """
+        Return the number of operations not yet pushed to the remote.
+
+        Returns:
+            int: The length of the operation log.
+        """
+        with self._lock:
+            (count,) = self.local.conn.execute(
+                "SELECT COUNT(*) FROM oplog"
+            ).fetchone()
+            return count
+
+    def get_all_todos(self) -> List[Todo]:
+        """Retrieve all todos from the local replica."""
+        with self._lock:
+            return self.local.get_all_todos()
+
+    def insert_todo(self, todo: Todo) -> int:
+        """Insert a new todo locally and queue it for the remote."""
+        with self._lock:
+            task_id = self.local.get_next_task_id()
+            self.local.insert_todo(
+                Todo(
+                    task_id=task_id,
+                    task=todo.task,
+                    category=todo.category,
+                    date_added=todo.date_added,
+                    due_date=todo.due_date,
+                    date_completed=todo.date_completed,
+                )
+            )
+            (stored,) = self.local._select("t.task_id = ?", (task_id,))
+            self._log("insert_todo", task_id, stored.to_dict())
+            return task_id
+
+    def update_todo(
+        self,
+        task_id: int,
+        task: Optional[str] = None,
+        category: Optional[str] = None,
+        due_date: Optional[str] = None,
+    ) -> None:
+        """Update a todo locally and queue the update for the remote."""
+        with self._lock:
+            self.local.update_todo(task_id, task, category, due_date)
+            self._log(
+                "update_todo",
+                task_id,
+                {"task": task, "category": category, "due_date": due_date},
+            )
+
+    def delete_todo(self, task_id: int) -> None:
+        """Delete a todo locally and queue the deletion for the remote."""
+        with self._lock:
+            self.local.delete_todo(task_id)
+            self._log("delete_todo", task_id)
+
+    def complete_todo(
+        self, task_id: int, date_completed: Optional[str] = None
+    ) -> None:
+        """
+        Complete a todo locally and queue it for the remote.
+
+        The completion time is logged with the operation, so the remote
+        records when the todo was completed rather than when it synced.
+        """
+        date_completed = date_completed or datetime.now().isoformat()
+        with self._lock:
+            self.local.complete_todo(task_id, date_completed)
+            self._log(
+                "complete_todo", task_id, {"date_completed": date_completed}
+            )
+
+    def reorder_todo(self, task_id: int, new_position: int) -> None:
+        """Reorder a todo locally and queue the move for the remote."""
+        with self._lock:
+            self.local.reorder_todo(task_id, new_position)
+            self._log(
+                "reorder_todo", task_id, {"new_position": new_position}
+            )
+
+    def find_todos(self, query: TodoQuery) -> List[Todo]:
+        """Return the todos matching a query, using the local indexes."""
+        with self._lock:
+            return self.local.find_todos(query)
+
+    def get_category_id(self, category_name: str) -> int:
+        """Get the local category_id for a given category name."""
+        with self._lock:
+            return self.local.get_category_id(category_name)
+
+    def add_category(self, category_name: str) -> None:
+        """Add a category locally and queue it for the remote."""
+        with self._lock:
+            self.local.add_category(category_name)
+            self._log(
+                "add_category", None, {"category_name": category_name}
+            )
+
+    def get_all_categories(self) -> List[Dict[str, Any]]:
+        """Get all categories from the replica."""
+        with self._lock:
+            return self.local.get_all_categories()
+
+    def sync(self) -> bool:
+        """
+        Push the operation log to the remote, then pull remote changes.
+
+        Returns:
+            bool:
+            True if the sync completed, False if the remote could not be
+            reached. Unpushed operations stay in the log for next time.
+
+        Raises:
+            Exception:
+            Any error other than a network or API error, e.g. a failed
+            authentication or a bug, so it is not mistaken for being
+            offline.
+        """
+        with self._sync_lock:
+            try:
+                if self.remote is None:
+                    self.remote = self.remote_factory()
+                self._push()
+                self._pull()
+            except Exception as e:
+                if not is_offline_error(e):
+                    raise
+                return False
+            return True
+
+    def _push(self) -> None:
+        """
+        Replay logged operations on the remote, oldest first.
+
+        The replay runs as one remote batch, so backends that buffer
+        writes send the cell edits of a whole sync together. Buffered
+        operations leave the log only once the batch has committed, so
+        a failed commit replays them on the next sync.
+        """
+        with self.remote.batch():
+            buffered = self._push_operations()
+        self._forget_operations(buffered)
+
+    def _push_operations(self) -> List[int]:
+        """
+        Replay the logged operations.
+
+        Unbuffered operations are removed from the log as soon as they
+        are applied; the others are left for the caller to remove.
+
+        Returns:
+            List[int]: The seqs of the applied buffered operations.
+        """
+        buffered: List[int] = []
+        last_seq = 0
+        while True:
+            with self._lock:
+                row = self.local.conn.execute(
+                    "SELECT seq, op, task_id, payload FROM oplog"
+                    " WHERE seq > ? ORDER BY seq LIMIT 1",
+                    (last_seq,),
+                ).fetchone()
+                if row is None:
+                    return buffered
+                seq, op, task_id, payload = row
+                payload = json.loads(payload)
+                if op == "insert_todo":
+                    task_id = self._claim_remote_id(task_id)
+                    payload["task_id"] = task_id
+
+            try:
+                self._apply_remote(op, task_id, payload)
+            except ValueError:
+                # The remote no longer has the task or category; the
+                # remote state wins and is pulled back afterwards.
+                pass
+
+            last_seq = seq
+            if op in UNBUFFERED_OPS:
+                self._forget_operations([seq])
+            else:
+                buffered.append(seq)
+
+    def _forget_operations(self, seqs: List[int]) -> None:
+        """
+        Remove pushed operations from the log.
+
+        Args:
+            seqs (List[int]): The seqs of the operations.
+        """
+        with self._lock, self.local.conn:
+            self.local.conn.executemany(
+                "DELETE FROM oplog WHERE seq = ?", [(seq,) for seq in seqs]
+            )
+
+    def _apply_remote(
+        self, op: str, task_id: Optional[int], payload: Dict[str, Any]
+    ) -> None:
+        """
+        Apply one logged operation to the remote backend.
+
+        Args:
+            op (str): The logged backend method name.
+            task_id (Optional[int]): The task the operation applies to.
+            payload (Dict[str, Any]): The logged keyword arguments.
+        """
+        if op == "insert_todo":
+            self.remote.insert_todo(Todo.from_dict(payload))
+        elif op == "add_category":
+            self.remote.add_category(**payload)
+        else:
+            getattr(self.remote, op)(task_id, **payload)
+
+    def _claim_remote_id(self, task_id: int) -> int:
+        """
+        Return a task_id that is free on the remote for a local insert.
+
+        If another client already used the id, the local task and its
+        pending operations are renumbered to a fresh id.
+
+        Args:
+            task_id (int): The locally assigned id.
+
+        Returns:
+            int: The id to insert the task under remotely.
+        """
+        remote_ids = {todo.task_id for todo in self.remote.get_all_todos()}
+        if task_id not in remote_ids:
+            return task_id
+        new_id = max(remote_ids | {self.local.get_next_task_id()}) + 1
+        with self.local.conn:
+            self.local.conn.execute(
+                "UPDATE tasks SET task_id = ? WHERE task_id = ?",
+                (new_id, task_id),
+            )
+            self.local.conn.execute(
+                "UPDATE oplog SET task_id = ? WHERE task_id = ?",
+                (new_id, task_id),
+            )
+        return new_id
+
+    def _pull(self) -> None:
+        """
+        Overwrite the replica with remote state for unchanged tasks.
+
+        Only the changes since the previous pull are fetched when the
+        remote supports it; otherwise the full remote state is.
+        """
+        changes = self.remote.get_changes_since(self._remote_token)
+        remote_categories = self.remote.get_all_categories()
+
+        with self._lock, self.local.conn:
+            pending = dict(
+                self.local.conn.execute(
+                    "SELECT task_id, MAX(modified_at) FROM oplog"
+                    " WHERE task_id IS NOT NULL GROUP BY task_id"
+                )
+            )
+            local_names = {
+                category["category_name"]
+                for category in self.local.get_all_categories()
+            }
+            for category in remote_categories:
+                if category["category_name"] not in local_names:
+                    self.local.add_category(category["category_name"])
+
+            local = {todo.task_id: todo for todo in self.local._select()}
+            for todo in changes.todos:
+                if todo.task_id in pending:
+                    stamp = todo.modified_at
+                    if not stamp or stamp <= pending[todo.task_id]:
+                        continue
+                    self.local.conn.execute(
+                        "DELETE FROM oplog WHERE task_id = ?",
+                        (todo.task_id,),
+                    )
+                if self._row(local.pop(todo.task_id, None)) != \
+                        self._row(todo):
+                    self._store(todo)
+
+            deleted = local if changes.full else changes.deleted
+            for task_id in deleted:
+                if task_id in local and task_id not in pending:
+                    self.local.conn.execute(
+                        "DELETE FROM tasks WHERE task_id = ?", (task_id,)
+                    )
+        self._remote_token = changes.token
+
+    @staticmethod
+    def _row(todo: Optional[Todo]) -> Optional[tuple]:
+        """
+        Return a comparable tuple of a todo's fields.
+
+        Empty strings and None are treated as equal, since Google Sheets
+        returns empty cells as "". modified_at is left out because the
+        replica does not store it.
+        """
+        if todo is None:
+            return None
+        record = todo.to_dict()
+        del record["modified_at"]
+        return tuple(value or None for value in record.values())
+
+    def _store(self, todo: Todo) -> None:
+        """
+        Insert or replace a todo in the replica exactly as given.
+
+        Args:
+            todo (Todo): The remote todo to store.
+        """
+        self.local.conn.execute(
+            "INSERT OR REPLACE INTO tasks (task_id, task, category_id,"
+            " date_added, due_date, date_completed, position)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                todo.task_id,
+                todo.task,
+                self.local.get_category_id(todo.category),
+                todo.date_added,
+                todo.due_date or None,
+                todo.date_completed or None,
+                todo.position,
+            ),
+        )
+
+    def close(self) -> None:
+        """
+        Stop the sync worker after a final sync attempt, then close the
+        remote so it can commit buffered writes.
+        """
+        self.worker.stop()
+        try:
+            self.sync()
+        finally:
+            if self.remote is not None:
+                self.remote.close()
+
+
+class SyncWorker(threading.Thread):
+    """
+    Background thread that periodically syncs a TodoReplica.
+
+    The worker sleeps for the sync interval, or until woken by a local
+    write, and then runs TodoReplica.sync(). Failed syncs are retried on
+    the next cycle; errors other than being offline are also logged.
+    """
+
+    def __init__(self, replica: TodoReplica, interval: float):
+        """
+        Initialize the SyncWorker.
+
+        Args:
+            replica (TodoReplica): The replica to sync.
+            interval (float): Seconds between syncs.
+        """
+        super().__init__(name="todo-sync", daemon=True)
+        self.replica = replica
+        self.interval = interval
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+
+    def wake(self) -> None:
+        """Request a sync as soon as possible."""
+        self._wake.set()
+
+    def stop(self) -> None:
+        """Stop the worker and wait for the running sync to finish."""
+        self._stopped.set()
+        self._wake.set()
+        if self.is_alive():
+            self.join()
+
+    def run(self) -> None:
+        """Sync until stopped."""
+        while not self._stopped.is_set():
+            try:
+                self.replica.sync()
+            except Exception:
+                logger.exception("Background sync failed")
+            self._wake.wait(self.interval)
+            self._wake.clear()
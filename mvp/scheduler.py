@@ -0,0 +1,346 @@
+import random
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+import requests
+from gspread.exceptions import APIError
+from gspread.utils import rowcol_to_a1
+
+# The Sheets API allows 60 requests per minute per user and project.
+DEFAULT_REQUESTS_PER_MINUTE = 60.0
+DEFAULT_BURST = 10
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BASE_DELAY = 1.0
+DEFAULT_MAX_DELAY = 32.0
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Worksheet and spreadsheet methods that change the sheet's structure.
+# Sending one twice applies it twice, e.g. deletes the rows that moved
+# up, so they are only retried when the server rejected them outright.
+NON_IDEMPOTENT_METHODS = {
+    "add_cols",
+    "add_rows",
+    "add_worksheet",
+    "append_row",
+    "append_rows",
+    "delete_columns",
+    "delete_rows",
+    "duplicate_sheet",
+    "insert_cols",
+    "insert_row",
+    "insert_rows",
+}
+
+
+def is_retryable(error: Exception, idempotent: bool = True) -> bool:
+    """
+    Check whether a failed request is worth retrying.
+
+    Quota errors (429), server errors (5xx) and dropped connections are
+    transient; anything else, e.g. a bad range, fails the same way again.
+    A server error or dropped connection may hide a request that was
+    applied, so non-idempotent requests are only retried on 429, which
+    the server returns before doing anything.
+
+    Args:
+        error (Exception): The error raised by the request.
+        idempotent (bool): Whether sending the request twice is safe.
+
+    Returns:
+        bool: True if the request should be retried.
+    """
+    if isinstance(error, APIError):
+        if not idempotent:
+            return error.code == 429
+        return error.code in RETRYABLE_STATUS_CODES
+    if not idempotent:
+        return False
+    return isinstance(
+        error, (requests.exceptions.ConnectionError, requests.Timeout)
+    )
+
+
+def retry_after(error: Exception) -> Optional[float]:
+    """
+    Return the delay the server asked for in a Retry-After header.
+
+    Args:
+        error (Exception): The error raised by the request.
+
+    Returns:
+        Optional[float]: The delay in seconds, or None if not given.
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers["Retry-After"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter.
+
+    Tokens are added at a steady rate up to a maximum burst size; each
+    request takes one token and waits if none is left.
+
+    Attributes:
+        rate (float): Tokens added per second. 0 disables limiting.
+        capacity (float): Maximum number of stored tokens.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize the TokenBucket with a full bucket.
+
+        Args:
+            rate (float): Tokens added per second. 0 disables limiting.
+            capacity (float): Maximum number of stored tokens.
+            clock (Callable[[], float]): Monotonic clock in seconds.
+            sleep (Callable[[float], None]): Function used to wait.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take a token, waiting until one is available.
+
+        Returns:
+            float: The number of seconds waited.
+        """
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) * self.rate,
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            self._sleep(wait)
+        return wait
+
+
+class RequestScheduler:
+    """
+    Run Sheets API requests within the quota, retrying transient errors.
+
+    Every request first takes a token from a shared TokenBucket, so
+    bulk operations run at the highest rate the quota sustains instead
+    of failing with 429 errors. Requests that fail anyway with a quota,
+    server or connection error are retried with exponential backoff and
+    full jitter, honouring a Retry-After header when the server sends
+    one. Non-idempotent requests are only retried on quota errors.
+
+    Attributes:
+        bucket (TokenBucket): The rate limiter shared by all requests.
+        max_retries (int): Retries before the error is re-raised.
+        base_delay (float): Backoff before the first retry, in seconds.
+        max_delay (float): Upper bound for a single backoff.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+        burst: int = DEFAULT_BURST,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize the RequestScheduler.
+
+        Args:
+            requests_per_minute (float):
+            Sustained request rate. 0 disables rate limiting.
+            burst (int): Requests that may be sent back to back.
+            max_retries (int): Retries before the error is re-raised.
+            base_delay (float): Backoff before the first retry.
+            max_delay (float): Upper bound for a single backoff.
+            sleep (Callable[[float], None]): Function used to wait.
+        """
+        self.bucket = TokenBucket(
+            requests_per_minute / 60, burst, sleep=sleep
+        )
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._sleep = sleep
+
+    def backoff(self, attempt: int, error: Exception) -> float:
+        """
+        Return the delay before retry number attempt (0-based).
+
+        Args:
+            attempt (int): The number of retries made so far.
+            error (Exception): The error that triggered the retry.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        delay = retry_after(error)
+        if delay is not None:
+            return min(delay, self.max_delay)
+        ceiling = min(self.max_delay, self.base_delay * 2 ** attempt)
+        return random.uniform(0, ceiling)
+
+    def call(
+        self,
+        func: Callable[..., Any],
+        *args,
+        idempotent: bool = True,
+        **kwargs,
+    ) -> Any:
+        """
+        Run a request under the rate limit, retrying transient errors.
+
+        Args:
+            func (Callable[..., Any]): The request to run.
+            *args: Positional arguments for func.
+            idempotent (bool):
+            Whether sending the request twice is safe. If not, only
+            quota errors are retried; see is_retryable().
+            **kwargs: Keyword arguments for func.
+
+        Returns:
+            Any: The request's result.
+
+        Raises:
+            Exception: The request's error if it is not transient or
+            still occurs after max_retries retries.
+        """
+        attempt = 0
+        while True:
+            self.bucket.acquire()
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if (attempt >= self.max_retries
+                        or not is_retryable(e, idempotent)):
+                    raise
+                self._sleep(self.backoff(attempt, e))
+                attempt += 1
+
+
+class ScheduledWorksheet:
+    """
+    Worksheet proxy sending every request through a RequestScheduler.
+
+    Cell writes (update_cell and batch_update) go through a queue keyed
+    by A1 range. While one batch waits for a token or backs off, writes
+    from other threads queue up behind it; writes to the same range are
+    coalesced so only the newest value is sent, and everything queued
+    goes out as a single batch_update. Other requests flush the queue
+    first so they never overtake a pending write. Structural requests
+    such as append_row and delete_rows are only retried on quota errors.
+
+    Attributes:
+        scheduler (RequestScheduler): The scheduler used for requests.
+    """
+
+    def __init__(self, worksheet, scheduler: RequestScheduler):
+        """
+        Initialize the ScheduledWorksheet.
+
+        Args:
+            worksheet (gspread.Worksheet): The worksheet to wrap.
+            scheduler (RequestScheduler): The scheduler to use.
+        """
+        self._worksheet = worksheet
+        self.scheduler = scheduler
+        self._pending: Dict[str, List[List[Any]]] = {}
+        self._waiters: List[Future] = []
+        self._queue_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._worksheet, name)
+        if not callable(attr):
+            return attr
+
+        idempotent = name not in NON_IDEMPOTENT_METHODS
+
+        def scheduled(*args, **kwargs):
+            self.flush()
+            return self.scheduler.call(
+                attr, *args, idempotent=idempotent, **kwargs
+            )
+        return scheduled
+
+    def update_cell(self, row: int, col: int, value: Any) -> Any:
+        """Queue a single cell write and wait until it is sent."""
+        return self.batch_update(
+            [{"range": rowcol_to_a1(row, col), "values": [[value]]}]
+        )
+
+    def batch_update(self, data: List[Dict[str, Any]]) -> Any:
+        """
+        Queue range writes and wait until they are sent.
+
+        Args:
+            data (List[Dict[str, Any]]):
+            Updates with "range" and "values" keys, as for gspread's
+            Worksheet.batch_update().
+
+        Returns:
+            Any: The response of the batch the writes were sent in.
+
+        Raises:
+            Exception: The error of the batch the writes were sent in.
+        """
+        future: Future = Future()
+        with self._queue_lock:
+            for update in data:
+                self._pending[update["range"]] = update["values"]
+            self._waiters.append(future)
+        self.flush()
+        return future.result()
+
+    def flush(self) -> None:
+        """
+        Send all queued writes as one batch_update.
+
+        The outcome is reported to each queued write's caller.
+        """
+        with self._flush_lock:
+            with self._queue_lock:
+                pending, waiters = self._pending, self._waiters
+                self._pending, self._waiters = {}, []
+            if not waiters:
+                return
+
+            def send():
+                # gspread rewrites each range in place, so every retry
+                # needs fresh dicts.
+                return self._worksheet.batch_update([
+                    {"range": cell_range, "values": values}
+                    for cell_range, values in pending.items()
+                ])
+
+            try:
+                result = self.scheduler.call(send)
+            except Exception as e:
+                for waiter in waiters:
+                    waiter.set_exception(e)
+            else:
+                for waiter in waiters:
+                    waiter.set_result(result)
@@ -0,0 +1,428 @@
+import os
+import sqlite3
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+from datetime import datetime
+from .backend import TodoBackend, TodoQuery, DEFAULT_CATEGORIES
+from .model import Todo
+
+DEFAULT_DATABASE = "todos.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS categories (
+    category_id INTEGER PRIMARY KEY,
+    category_name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id INTEGER PRIMARY KEY,
+    task TEXT NOT NULL,
+    category_id INTEGER NOT NULL REFERENCES categories (category_id),
+    date_added TEXT NOT NULL,
+    due_date TEXT,
+    date_completed TEXT,
+    position INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_category ON tasks (category_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks (due_date);
+CREATE INDEX IF NOT EXISTS idx_tasks_position ON tasks (position);
+"""
+
+SELECT_TODOS = """
+SELECT t.task_id, t.task, c.category_name, t.date_added,
+       t.due_date, t.date_completed, t.position
+FROM tasks t JOIN categories c ON c.category_id = t.category_id
+"""
+
+
+class TodoSQLite(TodoBackend):
+    """
+    Class for managing Todo List operations with a local SQLite database.
+
+    Provides the same methods as TodoGoogleSheets, so it can be used
+    as a drop-in backend for offline use and large task volumes.
+    """
+
+    display_name = "the local SQLite database"
+
+    def __init__(self, database: Optional[str] = None):
+        """
+        Initialize the TodoSQLite class.
+
+        Args:
+            database (Optional[str]):
+            Path of the SQLite database file, or ":memory:". Defaults to
+            the TODO_SQLITE_PATH environment variable or DEFAULT_DATABASE.
+        """
+        if database is None:
+            database = os.environ.get("TODO_SQLITE_PATH", DEFAULT_DATABASE)
+        self.conn = sqlite3.connect(database, check_same_thread=False)
+        # SQLite's LIKE and lower() only fold ASCII letters; text search
+        # must ignore case the way TodoQuery.matches() does.
+        self.conn.create_function(
+            "py_lower", 1, str.lower, deterministic=True
+        )
+        self.conn.executescript(SCHEMA)
+        if not self.get_all_categories():
+            for category_name in DEFAULT_CATEGORIES:
+                self.add_category(category_name)
+
+    @staticmethod
+    def _to_todo(row: tuple) -> Todo:
+        """
+        Decode a row selected with SELECT_TODOS into a Todo.
+
+        Args:
+            row (tuple): The selected row.
+
+        Returns:
+            Todo: The decoded todo.
+        """
+        return Todo.trusted(*row)
+
+    def _select(self, where: str = "", params: tuple = ()) -> List[Todo]:
+        """
+        Select todos joined with their category name.
+
+        Args:
+            where (str): Optional WHERE clause, without the keyword.
+            params (tuple): Parameters for the WHERE clause.
+
+        Returns:
+            List[Todo]: The matching todos ordered by task_id.
+        """
+        query = SELECT_TODOS
+        if where:
+            query += f" WHERE {where}"
+        query += " ORDER BY t.task_id"
+        return [
+            self._to_todo(row) for row in self.conn.execute(query, params)
+        ]
+
+    def get_all_todos(self) -> List[Todo]:
+        """
+        Retrieve all todos from the database.
+
+        Returns:
+            List[Todo]: A list of Todo objects representing all tasks.
+        """
+        return self._select()
+
+    def iter_todos(self) -> Iterator[Todo]:
+        """
+        Stream all todos straight from a database cursor.
+
+        Yields:
+            Todo: The todos ordered by task_id.
+        """
+        cursor = self.conn.execute(SELECT_TODOS + " ORDER BY t.task_id")
+        for row in cursor:
+            yield self._to_todo(row)
+
+    def insert_todo(self, todo: Todo) -> int:
+        """
+        Insert a new todo into the database.
+
+        The todo's own task_id is kept if it has one, otherwise the next
+        available id is assigned.
+
+        Returns:
+            int: The task_id of the inserted todo.
+        """
+        task_id = todo.task_id or self.get_next_task_id()
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO tasks (task_id, task, category_id, date_added,"
+                " due_date, date_completed, position)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    task_id,
+                    todo.task,
+                    self.get_category_id(todo.category),
+                    todo.date_added or datetime.now().isoformat(),
+                    todo.due_date or None,
+                    todo.date_completed or None,
+                    self.get_next_position(),
+                ),
+            )
+        return task_id
+
+    def insert_todos(self, todos: Iterable[Todo]) -> int:
+        """
+        Bulk insert todos in a single transaction.
+
+        Ids and positions are assigned locally and missing categories
+        are created on the way, in the same transaction, so a failed
+        insert leaves nothing behind.
+
+        Args:
+            todos (Iterable[Todo]): The todos to insert.
+
+        Returns:
+            int: The number of inserted todos.
+        """
+        categories = {
+            category["category_name"]: category["category_id"]
+            for category in self.get_all_categories()
+        }
+        next_id = self.get_next_task_id()
+        position = self.get_next_position()
+        rows = []
+        with self.conn:
+            for todo in todos:
+                if todo.category not in categories:
+                    # Not add_category(), which commits on its own.
+                    category_id = self.get_next_category_id()
+                    self.conn.execute(
+                        "INSERT INTO categories (category_id, category_name)"
+                        " VALUES (?, ?)",
+                        (category_id, todo.category),
+                    )
+                    categories[todo.category] = category_id
+                task_id = todo.task_id or next_id
+                next_id = max(next_id, task_id + 1)
+                rows.append((
+                    task_id,
+                    todo.task,
+                    categories[todo.category],
+                    todo.date_added or datetime.now().isoformat(),
+                    todo.due_date or None,
+                    todo.date_completed or None,
+                    position,
+                ))
+                position += 1
+            self.conn.executemany(
+                "INSERT INTO tasks (task_id, task, category_id, date_added,"
+                " due_date, date_completed, position)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def update_todo(
+        self,
+        task_id: int,
+        task: Optional[str] = None,
+        category: Optional[str] = None,
+        due_date: Optional[str] = None,
+    ) -> None:
+        """Update a todo's task, category, and/or due date."""
+        self.find_row_by_task_id(task_id)
+        columns = {}
+        if task is not None:
+            columns["task"] = task
+        if category is not None:
+            columns["category_id"] = self.get_category_id(category)
+        if due_date is not None:
+            columns["due_date"] = due_date
+
+        if columns:
+            assignments = ", ".join(f"{name} = ?" for name in columns)
+            with self.conn:
+                self.conn.execute(
+                    f"UPDATE tasks SET {assignments} WHERE task_id = ?",
+                    (*columns.values(), task_id),
+                )
+
+    def delete_todo(self, task_id: int) -> None:
+        """Delete a todo and update positions of remaining todos."""
+        position = self._position_of(task_id)
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM tasks WHERE task_id = ?", (task_id,)
+            )
+            self.conn.execute(
+                "UPDATE tasks SET position = position - 1"
+                " WHERE position > ?",
+                (position,),
+            )
+
+    def complete_todo(
+        self, task_id: int, date_completed: Optional[str] = None
+    ) -> None:
+        """Mark a todo as completed, by default as of now."""
+        self.find_row_by_task_id(task_id)
+        with self.conn:
+            self.conn.execute(
+                "UPDATE tasks SET date_completed = ? WHERE task_id = ?",
+                (date_completed or datetime.now().isoformat(), task_id),
+            )
+
+    def find_todos(self, query: TodoQuery) -> List[Todo]:
+        """
+        Return the todos matching a query, filtered in SQL.
+
+        Category and due date filters use the category_id and due_date
+        indexes. Due dates are compared as ISO strings, which orders
+        dates and datetimes alike. Text is matched with Python's
+        str.lower(), so case is ignored for all letters, not only ASCII.
+
+        Args:
+            query (TodoQuery): The filter.
+
+        Returns:
+            List[Todo]: The matching todos ordered by task_id.
+        """
+        clauses = []
+        params = []
+        if query.category is not None:
+            clauses.append("c.category_name = ?")
+            params.append(query.category)
+        if query.status == "open":
+            clauses.append("t.date_completed IS NULL")
+        elif query.status == "completed":
+            clauses.append("t.date_completed IS NOT NULL")
+        if query.due_after is not None:
+            clauses.append("t.due_date >= ?")
+            params.append(query.due_after.isoformat())
+        if query.due_before is not None:
+            # A due date cleared by update_todo() is stored as "".
+            clauses.append("t.due_date > '' AND t.due_date < ?")
+            params.append(query.due_before.isoformat())
+        if query.text is not None:
+            clauses.append("instr(py_lower(t.task), ?) > 0")
+            params.append(query.text.lower())
+        return self._select(" AND ".join(clauses), tuple(params))
+
+    def get_next_task_id(self) -> int:
+        """Get the next available task_id."""
+        (task_id,) = self.conn.execute(
+            "SELECT COALESCE(MAX(task_id), 0) + 1 FROM tasks"
+        ).fetchone()
+        return task_id
+
+    def get_next_position(self) -> int:
+        """Get the next available position."""
+        (position,) = self.conn.execute(
+            "SELECT COALESCE(MAX(position), 0) + 1 FROM tasks"
+        ).fetchone()
+        return position
+
+    def find_row_by_task_id(self, task_id: int) -> int:
+        """
+        Find the rowid for a given task_id.
+
+        Raises:
+            ValueError: If the task does not exist.
+        """
+        row = self.conn.execute(
+            "SELECT rowid FROM tasks WHERE task_id = ?", (task_id,)
+        ).fetchone()
+        if row is None:
+            raise ValueError(f"Task with id {task_id} not found")
+        return row[0]
+
+    def _position_of(self, task_id: int) -> int:
+        """
+        Return the current position of a task.
+
+        Raises:
+            ValueError: If the task does not exist.
+        """
+        row = self.conn.execute(
+            "SELECT position FROM tasks WHERE task_id = ?", (task_id,)
+        ).fetchone()
+        if row is None:
+            raise ValueError(f"Task with id {task_id} not found")
+        return row[0]
+
+    def get_category_id(self, category_name: str) -> int:
+        """
+        Get the category_id for a given category name.
+
+        Args:
+            category_name (str): The name of the category.
+
+        Returns:
+            int: The id of the category.
+
+        Raises:
+            ValueError: If the category is not found.
+        """
+        row = self.conn.execute(
+            "SELECT category_id FROM categories WHERE category_name = ?",
+            (category_name,),
+        ).fetchone()
+        if row is None:
+            raise ValueError(f"Category '{category_name}' not found")
+        return row[0]
+
+    def add_category(self, category_name: str) -> None:
+        """
+        Add a new category.
+
+        Args:
+        category_name (str): The name of the new category.
+        """
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO categories (category_id, category_name)"
+                " VALUES (?, ?)",
+                (self.get_next_category_id(), category_name),
+            )
+
+    def get_next_category_id(self) -> int:
+        """
+        Get the next available category_id.
+
+        Returns:
+            int: The next available category_id.
+        """
+        (category_id,) = self.conn.execute(
+            "SELECT COALESCE(MAX(category_id), 0) + 1 FROM categories"
+        ).fetchone()
+        return category_id
+
+    def update_positions(self) -> None:
+        """Renumber positions densely, keeping their current order."""
+        with self.conn:
+            self.conn.execute(
+                "UPDATE tasks SET position = ranked.rank FROM ("
+                " SELECT task_id, ROW_NUMBER() OVER"
+                " (ORDER BY position, task_id) AS rank FROM tasks"
+                ") AS ranked WHERE ranked.task_id = tasks.task_id"
+            )
+
+    def reorder_todo(self, task_id: int, new_position: int) -> None:
+        """
+        Change the position of a todo.
+
+        new_position is clamped to 1..n, as in the other backends.
+        """
+        old_position = self._position_of(task_id)
+        (count,) = self.conn.execute("SELECT COUNT(*) FROM tasks").fetchone()
+        new_position = max(1, min(new_position, count))
+        with self.conn:
+            if old_position < new_position:
+                self.conn.execute(
+                    "UPDATE tasks SET position = position - 1"
+                    " WHERE position > ? AND position <= ?",
+                    (old_position, new_position),
+                )
+            else:
+                self.conn.execute(
+                    "UPDATE tasks SET position = position + 1"
+                    " WHERE position >= ? AND position < ?",
+                    (new_position, old_position),
+                )
+            self.conn.execute(
+                "UPDATE tasks SET position = ? WHERE task_id = ?",
+                (new_position, task_id),
+            )
+
+    def update_position(self, task_id: int, new_position: int) -> None:
+        """Update the position of a specific todo."""
+        self.find_row_by_task_id(task_id)
+        with self.conn:
+            self.conn.execute(
+                "UPDATE tasks SET position = ? WHERE task_id = ?",
+                (new_position, task_id),
+            )
+
+    def get_all_categories(self) -> List[Dict[str, Any]]:
+        """Get all categories from the database."""
+        return [
+            {"category_id": category_id, "category_name": category_name}
+            for category_id, category_name in self.conn.execute(
+                "SELECT category_id, category_name FROM categories"
+                " ORDER BY category_id"
+            )
+        ]
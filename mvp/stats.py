@@ -0,0 +1,39 @@
+from collections import Counter
+from datetime import datetime, date
+from typing import Any, Dict, Iterable, Optional
+from .model import Todo
+
+
+def compute_statistics(
+    todos: Iterable[Todo], today: Optional[date] = None
+) -> Dict[str, Any]:
+    """
+    Calculate summary statistics for a list of todos.
+
+    Args:
+        todos (Iterable[Todo]): The todos to summarize.
+        today (Optional[date]):
+        Reference date for overdue checks. Defaults to today.
+
+    Returns:
+        Dict[str, Any]:
+        The total, completed and overdue counts, and the number of
+        todos per category under "by_category".
+    """
+    if today is None:
+        today = datetime.now().date()
+    total = completed = overdue = 0
+    by_category: Counter = Counter()
+    for todo in todos:
+        total += 1
+        by_category[todo.category] += 1
+        if todo.date_completed:
+            completed += 1
+        elif todo.is_overdue(today):
+            overdue += 1
+    return {
+        "total": total,
+        "completed": completed,
+        "overdue": overdue,
+        "by_category": dict(by_category),
+    }
@@ -0,0 +1,151 @@
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from typing import Callable, Iterator, Optional
+
+DEFAULT_TRACE_FILE = os.path.join("~", ".cache", "task_tracker", "trace.log")
+DEFAULT_MAX_BYTES = 1_000_000
+DEFAULT_BACKUP_COUNT = 3
+
+# True while a traced() call runs in the current context.
+_in_traced_call: ContextVar[bool] = ContextVar(
+    "todo_in_traced_call", default=False
+)
+
+
+class SpanTracer:
+    """
+    Record how long named spans take in a rotating local log.
+
+    Each finished span is written as one JSON line with its name,
+    duration, thread and error, if any. The log rotates at max_bytes and
+    keeps backup_count old files, so it can stay on in every session and
+    be attached to a "the tracker is slow" report.
+
+    Attributes:
+        path (str): The log file, or "" if tracing is disabled.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+    ):
+        """
+        Initialize the SpanTracer.
+
+        Args:
+            path (Optional[str]):
+            The log file. Defaults to the TODO_TRACE_FILE environment
+            variable or DEFAULT_TRACE_FILE. An empty string disables
+            tracing, as does a file that cannot be opened.
+            max_bytes (int): Size at which the log is rotated.
+            backup_count (int): Number of rotated logs to keep.
+        """
+        if path is None:
+            path = os.environ.get("TODO_TRACE_FILE", DEFAULT_TRACE_FILE)
+        self.path = os.path.expanduser(path)
+        # A private logger, so spans never reach the root handlers.
+        self._logger = logging.Logger("mvp.tracing")
+        if self.path:
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                handler = RotatingFileHandler(
+                    self.path,
+                    maxBytes=max_bytes,
+                    backupCount=backup_count,
+                    encoding="utf-8",
+                )
+            except OSError:
+                # Tracing must never stop the tracker from starting.
+                self.path = ""
+                return
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            self._logger.addHandler(handler)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """
+        Time the block and log it as a span.
+
+        Args:
+            name (str): The span name, e.g. "cli.show_todos".
+
+        Yields:
+            None
+        """
+        if not self.path:
+            yield
+            return
+        error = None
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            self._logger.info(json.dumps({
+                "time": datetime.now().isoformat(timespec="milliseconds"),
+                "span": name,
+                "ms": round((time.perf_counter() - start) * 1000, 3),
+                "thread": threading.current_thread().name,
+                "error": error,
+            }))
+
+    def close(self) -> None:
+        """Close the log file."""
+        for handler in self._logger.handlers:
+            handler.close()
+
+
+_tracer: Optional[SpanTracer] = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> SpanTracer:
+    """Return the process-wide SpanTracer, creating it on first use."""
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                _tracer = SpanTracer()
+    return _tracer
+
+
+def traced(name: str) -> Callable:
+    """
+    Decorate a function so that its calls are logged as spans.
+
+    Only the outermost traced call is logged: a backend method calling
+    another one, e.g. find_todos() reading get_all_todos(), is a single
+    span.
+
+    Args:
+        name (str): The span name.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _in_traced_call.get():
+                return func(*args, **kwargs)
+            token = _in_traced_call.set(True)
+            try:
+                with get_tracer().span(name):
+                    return func(*args, **kwargs)
+            finally:
+                _in_traced_call.reset(token)
+        return wrapper
+    return decorator
@@ -0,0 +1,198 @@
+import csv
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+from .model import Todo
+
+IMPORT_FIELDS = [
+    "task", "category", "date_added", "due_date", "date_completed",
+]
+
+DATE_FIELDS = ["date_added", "due_date", "date_completed"]
+
+
+def _to_todo(record: Dict[str, Any]) -> Todo:
+    """
+    Build a Todo from an imported record, ignoring ids and positions.
+
+    Args:
+        record (Dict[str, Any]): A record with at least task and category.
+
+    Returns:
+        Todo: The todo to insert.
+
+    Raises:
+        ValueError: If the task or category is missing, or a date field
+        is not an ISO date.
+    """
+    if not record.get("task") or not record.get("category"):
+        raise ValueError(f"Record needs a task and a category: {record}")
+    for field in DATE_FIELDS:
+        value = record.get(field)
+        if not value:
+            continue
+        try:
+            datetime.fromisoformat(str(value))
+        except ValueError:
+            raise ValueError(
+                f"Record has an invalid {field} '{value}': {record}"
+            ) from None
+    return Todo(**{
+        field: record.get(field) or None for field in IMPORT_FIELDS
+    })
+
+
+def read_todos(path: str) -> Iterator[Todo]:
+    """
+    Stream todos from a CSV, JSON or JSON Lines file.
+
+    The format is chosen from the file extension: .csv files need a
+    header row, .json files hold a list of objects and .jsonl files one
+    object per line. task_id and position are ignored so the target
+    backend can assign them.
+
+    Args:
+        path (str): The file to read.
+
+    Yields:
+        Todo: The todos in file order.
+
+    Raises:
+        ValueError: If the file extension is not supported.
+    """
+    if path.endswith(".csv"):
+        with open(path, newline="", encoding="utf-8") as f:
+            for record in csv.DictReader(f):
+                yield _to_todo(record)
+    elif path.endswith(".jsonl"):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield _to_todo(json.loads(line))
+    elif path.endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            for record in json.load(f):
+                yield _to_todo(record)
+    else:
+        raise ValueError(
+            f"Unsupported file type for '{path}'. Use .csv, .json or .jsonl"
+        )
+
+
+EXPORT_FIELDS = [
+    "task_id", "task", "category", "date_added",
+    "due_date", "date_completed", "position",
+]
+
+EXPORT_FORMATS = ["csv", "jsonl", "columnar"]
+
+EXPORT_EXTENSIONS = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".columnar": "columnar",
+}
+
+DEFAULT_ROW_GROUP_SIZE = 1000
+
+
+def _normalize_date(value: Optional[str]) -> Optional[str]:
+    """
+    Normalize a stored date to canonical ISO 8601, or None if empty.
+
+    Values that are not valid ISO dates are exported unchanged.
+    """
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).isoformat()
+    except (TypeError, ValueError):
+        return value
+
+
+def export_record(todo: Todo) -> Dict[str, Any]:
+    """
+    Return the export record of a todo with normalized date fields.
+
+    Args:
+        todo (Todo): The todo to export.
+
+    Returns:
+        Dict[str, Any]: The record with the fields in EXPORT_FIELDS.
+    """
+    return {
+        "task_id": todo.task_id,
+        "task": todo.task,
+        "category": todo.category,
+        "date_added": _normalize_date(todo.date_added),
+        "due_date": _normalize_date(todo.due_date),
+        "date_completed": _normalize_date(todo.date_completed),
+        "position": todo.position,
+    }
+
+
+def write_todos(
+    todos: Iterable[Todo],
+    f: TextIO,
+    fmt: str,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> int:
+    """
+    Stream todos to a text file in one of the EXPORT_FORMATS.
+
+    csv writes a header and one row per todo, jsonl one JSON object per
+    line. columnar writes a header line naming the fields followed by
+    row groups of up to row_group_size todos, each stored as one JSON
+    array per field. Only one row group is held in memory at a time.
+
+    Args:
+        todos (Iterable[Todo]): The todos to export.
+        f (TextIO): The file to write to.
+        fmt (str): One of EXPORT_FORMATS.
+        row_group_size (int): Todos per row group in columnar format.
+
+    Returns:
+        int: The number of exported todos.
+
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(
+            f"Unsupported export format '{fmt}'. "
+            f"Choose one of: {', '.join(EXPORT_FORMATS)}"
+        )
+    count = 0
+    if fmt == "csv":
+        writer = csv.DictWriter(
+            f, fieldnames=EXPORT_FIELDS, lineterminator="\n"
+        )
+        writer.writeheader()
+        for todo in todos:
+            writer.writerow(export_record(todo))
+            count += 1
+    elif fmt == "jsonl":
+        for todo in todos:
+            f.write(json.dumps(export_record(todo)) + "\n")
+            count += 1
+    else:
+        f.write(json.dumps({"format": "todo-columnar", "version": 1,
+                            "fields": EXPORT_FIELDS}) + "\n")
+        group: List[Dict[str, Any]] = []
+        for todo in todos:
+            group.append(export_record(todo))
+            count += 1
+            if len(group) >= row_group_size:
+                _write_row_group(f, group)
+                group = []
+        if group:
+            _write_row_group(f, group)
+    return count
+
+
+def _write_row_group(f: TextIO, group: List[Dict[str, Any]]) -> None:
+    """Write one columnar row group as a single JSON line."""
+    columns = {
+        field: [record[field] for record in group]
+        for field in EXPORT_FIELDS
+    }
+    f.write(json.dumps({"rows": len(group), "columns": columns}) + "\n")
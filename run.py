@@ -1,4 +1,5 @@
-from mvp import TodoCLI
+from mvp.backend import connect_in_background
+from mvp.commands import cli, echo_metrics
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
@@ -41,8 +42,24 @@ def display_welcome_screen():
     console.print(welcome_panel)
 
 
-def start_app():
-    """Start the Todo CLI application."""
+def start_app(backend=None, show_stats=False, profile=False):
+    """
+    Start the Todo CLI application.
+
+    The backend connection is established in the background while the
+    welcome screen is shown, and the menu modules are only imported once
+    the user chooses to start.
+
+    Args:
+        backend (Optional[str]):
+        Name of the storage backend to use. Defaults to the
+        TODO_BACKEND environment variable or "sheets".
+        show_stats (bool):
+        Whether to print the remote request metrics on exit.
+        profile (bool):
+        Whether to write a profile report for each menu action.
+    """
+    connection = connect_in_background(backend)
     while True:
         display_welcome_screen()
         user_input = console.input().strip().lower()
@@ -57,7 +74,15 @@ def start_app():
             console.print(
                 "[bold green]Starting Task Tracker CLI...[/bold green]\n"
                 )
-            TodoCLI().run()
+            from mvp.cli import TodoCLI
+            from mvp.profiling import ActionProfiler
+            profiler = ActionProfiler() if profile else None
+            app = TodoCLI(connection=connection, profiler=profiler)
+            app.run()
+            if show_stats:
+                echo_metrics(app.gs)
+            if profiler is not None:
+                console.print(f"Profiles written to {profiler.directory}")
             break
         else:
             console.print(
@@ -66,4 +91,4 @@ def start_app():
 
 
 if __name__ == "__main__":
-    start_app()
+    cli(obj={"interactive": start_app})
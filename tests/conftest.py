@@ -0,0 +1,202 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+from gspread.exceptions import WorksheetNotFound
+from mvp import tracing
+from mvp.google_sheets_db import CHANGES_HEADER, TodoGoogleSheets
+from mvp.fake_sheets import FakeSheetsServer
+from mvp.scheduler import RequestScheduler
+
+
+@pytest.fixture(autouse=True)
+def no_trace_file(monkeypatch):
+    """Keep the span tracer from writing to the user's trace log."""
+    monkeypatch.setattr(tracing, "_tracer", tracing.SpanTracer(path=""))
+
+
+class FakeWorksheet:
+    """
+    In-memory stand-in for a gspread Worksheet.
+
+    Rows are stored as lists of values with the header in row 1, and
+    every call is recorded in ``calls`` so tests can assert how many
+    remote requests an operation would have made.
+    """
+
+    col_count = 26
+
+    def __init__(self, rows):
+        self.rows = [list(row) for row in rows]
+        self.calls = []
+
+    def _record(self, name):
+        self.calls.append(name)
+
+    def get_all_records(self):
+        self._record("get_all_records")
+        header = self.rows[0]
+        return [
+            {key: ("" if value is None else value)
+             for key, value in zip(header, row)}
+            for row in self.rows[1:]
+        ]
+
+    def _range(self, range_name):
+        start, _, end = range_name.partition(":")
+        end = end or start
+        first_row = int(start[1:] or 1)
+        last_row = int(end[1:]) if end[1:] else len(self.rows)
+        return [
+            ["" if value is None else str(value)
+             for value in row[ord(start[0]) - 65:ord(end[0]) - 64]]
+            for row in self.rows[first_row - 1:last_row]
+        ]
+
+    def get_values(self, range_name):
+        self._record("get_values")
+        return self._range(range_name)
+
+    def batch_get(self, ranges):
+        self._record("batch_get")
+        return [self._range(range_name) for range_name in ranges]
+
+    def col_values(self, col):
+        self._record("col_values")
+        return [row[col - 1] for row in self.rows]
+
+    def find(self, query, in_column=None):
+        self._record("find")
+        for index, row in enumerate(self.rows, start=1):
+            if str(row[in_column - 1]) == query:
+                return SimpleNamespace(row=index, col=in_column)
+        return None
+
+    def _appended(self, count):
+        first = len(self.rows) - count + 1
+        return {"updates": {
+            "updatedRange": f"sheet!A{first}:H{len(self.rows)}"
+        }}
+
+    def append_row(self, values):
+        self._record("append_row")
+        self.rows.append(list(values))
+        return self._appended(1)
+
+    def append_rows(self, values):
+        self._record("append_rows")
+        values = [list(row) for row in values]
+        self.rows.extend(values)
+        return self._appended(len(values))
+
+    def update_cell(self, row, col, value):
+        self._record("update_cell")
+        self.rows[row - 1][col - 1] = value
+
+    def batch_update(self, data):
+        self._record("batch_update")
+        for update in data:
+            cell = update["range"]
+            col = ord(cell[0]) - ord("A")
+            row = self.rows[int(cell[1:]) - 1]
+            row.extend([""] * (col + 1 - len(row)))
+            row[col] = update["values"][0][0]
+
+    def delete_rows(self, index, end_index=None):
+        self._record("delete_rows")
+        del self.rows[index - 1:end_index or index]
+
+
+TASK_HEADER = [
+    "task_id", "task", "category_id", "date_added",
+    "due_date", "date_completed", "position", "modified_at",
+]
+
+
+@pytest.fixture
+def sheets(request):
+    """
+    Fixture to create a TodoGoogleSheets instance backed by fake
+    worksheets instead of the Google Sheets API.
+
+    The on-disk cache is disabled unless the test is parametrized
+    indirectly with a cache file path.
+    """
+    tasks = FakeWorksheet([
+        TASK_HEADER,
+        [1, "Task 1", 1, "2024-01-01", "2024-02-01", "", 1],
+        [2, "Task 2", 2, "2024-01-02", "", "", 2],
+        [3, "Task 3", 1, "2024-01-03", "", "", 3],
+    ])
+    categories = FakeWorksheet([
+        ["category_id", "category_name"],
+        [1, "Coding"],
+        [2, "Personal"],
+    ])
+    changes = FakeWorksheet([CHANGES_HEADER + ["gen-1", "gen-1:1"]])
+    worksheets = {
+        "tasks": tasks, "categories": categories, "changes": changes
+    }
+
+    def worksheet(title):
+        try:
+            return worksheets[title]
+        except KeyError:
+            raise WorksheetNotFound(title)
+
+    def add_worksheet(title, rows, cols):
+        worksheets[title] = FakeWorksheet([])
+        return worksheets[title]
+
+    client = MagicMock()
+    client.open.return_value.get_lastUpdateTime.return_value = "rev-1"
+    client.open.return_value.worksheet.side_effect = worksheet
+    client.open.return_value.add_worksheet.side_effect = add_worksheet
+    with patch("mvp.google_sheets_db.Credentials"), \
+            patch("mvp.google_sheets_db.gspread.authorize",
+                  return_value=client):
+        gs = TodoGoogleSheets(
+            cache_file=getattr(request, "param", ""),
+            scheduler=RequestScheduler(requests_per_minute=0),
+        )
+    yield gs
+
+
+class FakeClock:
+    """Clock whose sleep() advances time instead of waiting."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """Fixture providing a FakeClock starting at 0."""
+    return FakeClock()
+
+
+@pytest.fixture
+def server(clock):
+    """
+    Fixture to create a FakeSheetsServer holding a small task_tracker
+    spreadsheet. Its latency and retries sleep on the fake clock.
+    """
+    server = FakeSheetsServer(clock=clock, sleep=clock.sleep)
+    server.add_spreadsheet("task_tracker", {
+        "tasks": [
+            TASK_HEADER,
+            [1, "Task 1", 1, "2024-01-01", "2024-02-01", "", 1, ""],
+            [2, "Task 2", 2, "2024-01-02", "", "", 2, ""],
+        ],
+        "categories": [
+            ["category_id", "category_name"], [1, "Coding"], [2, "Personal"]
+        ],
+    })
+    return server
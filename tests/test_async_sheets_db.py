@@ -0,0 +1,93 @@
+import asyncio
+import copy
+import threading
+import pytest
+from mvp.async_sheets_db import AsyncTodoGoogleSheets
+from mvp.model import Todo
+
+
+def block_until_both_read(sheets):
+    """
+    Make each worksheet read wait for the other one to start, so the
+    reads only complete if they run concurrently.
+    """
+    barrier = threading.Barrier(2, timeout=2)
+    for worksheet in (sheets.tasks_worksheet, sheets.categories_worksheet):
+        read = worksheet.get_all_records
+
+        def concurrent_read(read=read):
+            barrier.wait()
+            return read()
+        worksheet.get_all_records = concurrent_read
+
+
+class TestAsyncTodoGoogleSheets:
+    def test_worksheets_are_fetched_concurrently(self, sheets):
+        """
+        The tasks and categories worksheets are read at the same time.
+        """
+        block_until_both_read(sheets)
+
+        todos = asyncio.run(AsyncTodoGoogleSheets(sheets).get_all_todos())
+
+        assert [todo.category for todo in todos] == [
+            "Coding", "Personal", "Coding"
+        ]
+
+    def test_prefetch_is_shared_by_later_reads(self, sheets):
+        """
+        Reads issued while a prefetch is running wait for it instead of
+        fetching again.
+        """
+        async def flow():
+            backend = AsyncTodoGoogleSheets(sheets)
+            backend.prefetch()
+            todos, categories = await asyncio.gather(
+                backend.get_all_todos(), backend.get_all_categories()
+            )
+            return todos, categories
+
+        todos, categories = asyncio.run(flow())
+
+        assert len(todos) == 3
+        assert len(categories) == 2
+        assert sheets.tasks_worksheet.calls.count("get_all_records") == 1
+
+    @pytest.mark.parametrize("sheets", ["cache.json"], indirect=True)
+    def test_cache_hit_skips_change_feed(self, sheets, tmp_path,
+                                         monkeypatch):
+        """
+        A load served by the cache file reads neither the worksheets nor
+        the change feed.
+        """
+        monkeypatch.chdir(tmp_path)
+        sheets.get_all_todos()
+        fresh = copy.copy(sheets)
+        fresh.invalidate_cache()
+        changes = sheets._changes()
+        sheets.tasks_worksheet.calls.clear()
+        changes.calls.clear()
+
+        todos = asyncio.run(AsyncTodoGoogleSheets(fresh).get_all_todos())
+
+        assert len(todos) == 3
+        assert sheets.tasks_worksheet.calls == []
+        assert changes.calls == []
+
+    def test_writes_go_through_wrapped_backend(self, sheets):
+        """
+        Inserts and completions reach the sheet and the snapshot.
+        """
+        async def flow():
+            backend = AsyncTodoGoogleSheets(sheets)
+            task_id = await backend.insert_todo(
+                Todo(task="Async", category="Personal")
+            )
+            await backend.complete_todo(task_id)
+            return await backend.get_all_todos()
+
+        todos = asyncio.run(flow())
+
+        assert todos[-1].task == "Async"
+        assert todos[-1].date_completed
+        assert sheets.tasks_worksheet.rows[-1][1] == "Async"
@@ -0,0 +1,208 @@
+import json
+import pytest
+from click.testing import CliRunner
+from mvp.commands import cli
+from mvp.google_sheets_db import TodoGoogleSheets
+from mvp.scheduler import RequestScheduler
+
+
+@pytest.fixture
+def run(tmp_path, monkeypatch):
+    """
+    Fixture to invoke the command-line interface against a temporary
+    SQLite database.
+    """
+    monkeypatch.setenv("TODO_SQLITE_PATH", str(tmp_path / "todos.db"))
+    runner = CliRunner()
+
+    def invoke(*args):
+        return runner.invoke(cli, ["--backend", "sqlite", *args])
+    return invoke
+
+
+class TestImportCommand:
+    def test_import_csv(self, run, tmp_path):
+        """
+        The import command bulk inserts every row of a CSV file.
+        """
+        path = tmp_path / "todos.csv"
+        path.write_text(
+            "task,category,due_date\n"
+            "Write docs,Coding,2030-01-01\n"
+            "Buy milk,Groceries,\n"
+        )
+
+        result = run("import", str(path))
+
+        assert result.exit_code == 0
+        assert "Imported 2 todos." in result.output
+
+    def test_import_jsonl_rejects_incomplete_records(self, run, tmp_path):
+        """
+        Records without a category abort the import with an error.
+        """
+        path = tmp_path / "todos.jsonl"
+        path.write_text(json.dumps({"task": "No category"}) + "\n")
+
+        result = run("import", str(path))
+
+        assert result.exit_code != 0
+        assert "needs a task and a category" in result.output
+
+    def test_import_rejects_invalid_dates(self, run, tmp_path):
+        """
+        A date that is not ISO formatted aborts the import and names the
+        record.
+        """
+        path = tmp_path / "todos.csv"
+        path.write_text(
+            "task,category,due_date\n"
+            "Write docs,Coding,2030-01-01\n"
+            "Buy milk,Groceries,next tuesday\n"
+        )
+
+        result = run("import", str(path))
+
+        assert result.exit_code != 0
+        assert "invalid due_date 'next tuesday'" in result.output
+        assert "Buy milk" in result.output
+        assert "Imported" not in result.output
+
+
+class TestExportCommand:
+    def test_export_formats_round_trip(self, run, tmp_path):
+        """
+        Exported CSV and JSON Lines files contain every todo with
+        category names and normalized dates.
+        """
+        path = tmp_path / "todos.csv"
+        path.write_text(
+            "task,category,due_date\n"
+            "Write docs,Coding,2030-01-01\n"
+            "Buy milk,Errands,\n"
+        )
+        run("import", str(path))
+
+        result = run("export", str(tmp_path / "out.csv"))
+        assert result.exit_code == 0
+        lines = (tmp_path / "out.csv").read_text().splitlines()
+        assert lines[0].startswith("task_id,task,category")
+        assert ",Coding," in lines[1]
+        assert "2030-01-01T00:00:00" in lines[1]
+
+        result = run("export", "-")
+        records = [
+            json.loads(line)
+            for line in result.stdout.splitlines() if line.startswith("{")
+        ]
+        assert [record["task"] for record in records] == [
+            "Write docs", "Buy milk"
+        ]
+        assert records[1]["due_date"] is None
+
+    def test_export_columnar_row_groups(self, run, tmp_path):
+        """
+        The columnar format writes a header and one line per row group.
+        """
+        path = tmp_path / "todos.jsonl"
+        path.write_text("".join(
+            json.dumps({"task": f"Task {i}", "category": "Coding"}) + "\n"
+            for i in range(3)
+        ))
+        run("import", str(path))
+
+        run("export", "--format", "columnar", str(tmp_path / "out.col"))
+
+        header, group = (tmp_path / "out.col").read_text().splitlines()
+        assert json.loads(header)["format"] == "todo-columnar"
+        assert json.loads(group)["columns"]["task_id"] == [1, 2, 3]
+
+
+class TestTodoCommands:
+    def test_add_list_complete_flow(self, run):
+        """
+        Todos can be added, completed and listed as JSON.
+        """
+        result = run("add", "Write docs", "-c", "Coding",
+                     "--due", "2000-01-01", "--json")
+        assert json.loads(result.output) == {"task_id": 1}
+        run("add", "Buy milk", "-c", "Errands")
+
+        assert run("list", "--overdue", "--json").output.count(
+            "Write docs") == 1
+        run("complete", "1")
+
+        records = json.loads(run("list", "--status", "open", "--json").output)
+        assert [record["task"] for record in records] == ["Buy milk"]
+        assert run("list", "--overdue", "--status", "completed").exit_code \
+            == 2
+
+        stats = json.loads(run("stats", "--json").output)
+        assert stats == {
+            "total": 2, "completed": 1, "overdue": 0,
+            "by_category": {"Coding": 1, "Errands": 1},
+        }
+
+    def test_update_reorder_delete(self, run):
+        """
+        Update, reorder and delete change the stored todos.
+        """
+        run("add", "First", "-c", "Coding")
+        run("add", "Second", "-c", "Coding")
+
+        run("update", "1", "--task", "Renamed")
+        run("reorder", "2", "1")
+        run("delete", "1")
+
+        records = json.loads(run("list", "--json").output)
+        assert [(r["task"], r["position"]) for r in records] == [
+            ("Second", 1)
+        ]
+
+    def test_migrate_positions_needs_sheets(self, run):
+        """
+        migrate-positions is refused by backends that are always dense.
+        """
+        result = run("migrate-positions")
+
+        assert result.exit_code == 1
+        assert "always dense" in result.output
+
+    def test_migrate_positions(self, server):
+        """
+        migrate-positions respaces the Google Sheets positions.
+        """
+        sheets = TodoGoogleSheets(
+            client=server.client(),
+            cache_file="",
+            scheduler=RequestScheduler(requests_per_minute=0),
+        )
+
+        result = CliRunner().invoke(
+            cli, ["migrate-positions", "--gap", "10", "--json"],
+            obj={"gs": sheets},
+        )
+
+        assert json.loads(result.output) == {"position_gap": 10}
+        assert [t.position for t in sheets.get_all_todos()] == [10, 20]
+
+    def test_unknown_task_is_an_error(self, run):
+        """
+        Backend ValueErrors become non-zero exits with a message.
+        """
+        result = run("complete", "42")
+
+        assert result.exit_code == 1
+        assert "Task with id 42 not found" in result.output
+
+
+class TestStatsOption:
+    def test_local_backend_reports_no_requests(self, run):
+        """
+        --stats reports on exit that a local backend made no remote
+        requests.
+        """
+        result = run("--stats", "add", "Write docs", "-c", "Coding")
+
+        assert result.exit_code == 0
+        assert "No remote requests were made." in result.output
@@ -0,0 +1,142 @@
+import pytest
+from gspread.exceptions import APIError, SpreadsheetNotFound
+from mvp.google_sheets_db import TodoGoogleSheets
+from mvp.model import Todo
+from mvp.scheduler import RequestScheduler
+
+
+def connect(server, **kwargs):
+    """Create a TodoGoogleSheets backend talking to the fake server."""
+    kwargs.setdefault("scheduler", RequestScheduler(requests_per_minute=0))
+    return TodoGoogleSheets(
+        client=server.client(), cache_file="", **kwargs
+    )
+
+
+class TestFakeSheetsServer:
+    def test_backend_round_trip(self, server):
+        """
+        Writes made through TodoGoogleSheets land in the fake worksheets
+        and are read back by a fresh backend.
+        """
+        sheets = connect(server)
+
+        task_id = sheets.insert_todo(Todo(task="Task 3", category="Coding"))
+        sheets.update_todo(1, task="Renamed")
+        sheets.delete_todo(2)
+        todos = connect(server).get_all_todos()
+
+        assert [(t.task_id, t.task) for t in todos] == [
+            (1, "Renamed"), (task_id, "Task 3")
+        ]
+        assert server.get_values("task_tracker", "tasks")[1][:2] == [
+            "1", "Renamed"
+        ]
+        assert len(server.get_values("task_tracker", "changes")) == 5
+
+    def test_clients_see_each_others_row_changes(self, server):
+        """
+        Writes of one client land on the right rows after another
+        client deleted and appended rows.
+        """
+        first = connect(server)
+        first.get_all_todos()
+        second = connect(server)
+        second.delete_todo(1)
+        second.insert_todo(Todo(task="Task 3", category="Coding"))
+
+        first.complete_todo(2)
+        task_id = first.insert_todo(Todo(task="Task 4", category="Coding"))
+        todos = connect(server).get_all_todos()
+
+        assert [(t.task_id, t.task) for t in todos] == [
+            (2, "Task 2"), (3, "Task 3"), (task_id, "Task 4")
+        ]
+        assert todos[0].date_completed and task_id == 4
+        assert first.find_row_by_task_id(task_id) == 4
+
+    def test_migration_widens_an_old_change_feed(self, server):
+        """
+        A change feed created before L1 was used is widened when opened,
+        so the migration can store the gap and later clients read it.
+        """
+        connect(server).complete_todo(1)
+        server.client().open("task_tracker").worksheet("changes").resize(
+            cols=11
+        )
+
+        connect(server).migrate_positions(10)
+
+        fresh = connect(server)
+        assert fresh.get_position_gap() == 10
+        assert [t.position for t in fresh.get_all_todos()] == [10, 20]
+
+    def test_requests_are_logged(self, server):
+        """
+        Every request is logged with its operation and payload sizes.
+        """
+        sheets = connect(server)
+        server.requests.clear()
+
+        sheets.get_all_todos()
+
+        operations = [request.operation for request in server.requests]
+        assert operations.count("values.get") == 2
+        assert all(request.status == 200 for request in server.requests)
+        assert all(request.response_bytes > 0 for request in server.requests)
+
+    def test_latency_and_bandwidth_delay_requests(self, server, clock):
+        """
+        Each request is delayed by the latency plus its transfer time.
+        """
+        server.latency = 0.1
+        server.bandwidth = 1000.0
+        client = server.client()
+        clock.sleeps.clear()
+
+        client.open("task_tracker").get_lastUpdateTime()
+
+        request = server.requests[-1]
+        size = request.request_bytes + request.response_bytes
+        assert clock.sleeps[-1] == pytest.approx(0.1 + size / 1000)
+
+    def test_quota_rejects_with_429_until_the_minute_passes(
+        self, server, clock
+    ):
+        """
+        Requests beyond the per-minute quota fail with 429 until the
+        oldest request is a minute old.
+        """
+        sheet = server.client().open("task_tracker")
+        server.quota = 2
+        sheet.get_lastUpdateTime()
+        sheet.get_lastUpdateTime()
+
+        with pytest.raises(APIError) as error:
+            sheet.get_lastUpdateTime()
+        clock.now += 60
+
+        assert error.value.code == 429
+        assert sheet.get_lastUpdateTime()
+
+    def test_scheduler_retries_injected_failures(self, server, clock):
+        """
+        Injected 503s are retried by the scheduler, honouring the
+        Retry-After header.
+        """
+        sheets = connect(server, scheduler=RequestScheduler(
+            requests_per_minute=0, sleep=clock.sleep
+        ))
+        clock.sleeps.clear()
+        server.fail_next(503, count=2, retry_after=1.5)
+
+        assert len(sheets.get_all_todos()) == 2
+        assert clock.sleeps == [1.5, 1.5]
+        assert [r.status for r in server.requests].count(503) == 2
+
+    def test_unknown_spreadsheet(self, server):
+        """
+        Opening a spreadsheet that does not exist fails like the API.
+        """
+        with pytest.raises(SpreadsheetNotFound):
+            connect(server, spreadsheet_name="missing")
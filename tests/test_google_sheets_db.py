@@ -0,0 +1,727 @@
+import copy
+import pytest
+from datetime import date
+from gspread.exceptions import WorksheetNotFound
+from mvp.backend import TodoQuery
+from mvp.google_sheets_db import CHANGES_HEADER
+from mvp.model import Todo
+
+
+class TestSnapshotCache:
+    def test_get_all_todos_reads_sheets_once(self, sheets):
+        """
+        Repeated reads are served from the snapshot without re-fetching
+        the tasks or categories worksheets.
+        """
+        first = sheets.get_all_todos()
+        second = sheets.get_all_todos()
+
+        assert [todo.task_id for todo in first] == [1, 2, 3]
+        assert first == second
+        assert sheets.tasks_worksheet.calls.count("get_all_records") == 1
+        assert (
+            sheets.categories_worksheet.calls.count("get_all_records") == 1
+        )
+
+    def test_queries_are_served_from_the_snapshot(self, sheets):
+        """
+        Filtered reads are evaluated on the snapshot, so they fetch the
+        tasks worksheet no more often than get_all_todos().
+        """
+        sheets.complete_todo(3)
+
+        assert [t.task_id for t in sheets.get_todos_by_category("Coding")] \
+            == [1, 3]
+        assert [
+            t.task_id for t in sheets.find_todos(TodoQuery(
+                status="open", due_before=date(2024, 3, 1)
+            ))
+        ] == [1]
+        assert sheets.tasks_worksheet.calls.count("get_all_records") == 1
+
+    def test_text_search_ignores_unicode_case(self, sheets):
+        """
+        Text search ignores case for non-ASCII letters, like SQLite's.
+        """
+        sheets.update_todo(3, task="Äpfel kaufen")
+
+        assert [
+            t.task_id for t in sheets.find_todos(TodoQuery(text="äPFEL"))
+        ] == [3]
+
+    def test_writes_update_snapshot_in_place(self, sheets):
+        """
+        Insert, update, complete and delete keep the snapshot consistent
+        with the sheet without another full read.
+        """
+        sheets.get_all_todos()
+        sheets.insert_todo(Todo(task="Task 4", category="Personal"))
+        sheets.update_todo(1, task="Renamed")
+        sheets.complete_todo(2)
+        sheets.delete_todo(3)
+
+        todos = sheets.get_all_todos()
+        assert [todo.task_id for todo in todos] == [1, 2, 4]
+        assert todos[0].task == "Renamed"
+        assert todos[1].date_completed
+        assert [todo.position for todo in todos] == [1, 2, 3]
+        assert sheets.tasks_worksheet.calls.count("get_all_records") == 1
+
+    def test_invalidate_cache_forces_refetch(self, sheets):
+        """
+        invalidate_cache() triggers a re-fetch.
+        """
+        sheets.get_all_todos()
+        sheets.invalidate_cache()
+        sheets.get_all_todos()
+
+        assert sheets.tasks_worksheet.calls.count("get_all_records") == 2
+
+    def test_expired_snapshot_reads_only_the_change_feed(self, sheets):
+        """
+        An expired TTL refreshes the snapshot from the change feed
+        instead of re-reading the tasks worksheet.
+        """
+        sheets.get_all_todos()
+        sheets.cache_ttl = 0
+        sheets.get_all_todos()
+
+        assert sheets.tasks_worksheet.calls == ["get_all_records"]
+        assert sheets._changes().calls == ["get_values", "batch_get"]
+
+
+class TestCategoryIndex:
+    def test_inserts_resolve_categories_without_sheet_reads(self, sheets):
+        """
+        The category index is loaded once and shared by every insert
+        and category update.
+        """
+        for i in range(5):
+            sheets.insert_todo(Todo(task=f"New {i}", category="Coding"))
+        sheets.update_todo(1, category="Personal")
+
+        assert (
+            sheets.categories_worksheet.calls.count("get_all_records") == 1
+        )
+        assert sheets.tasks_worksheet.rows[1][2] == 2
+
+    def test_add_category_updates_index(self, sheets):
+        """
+        A new category is immediately resolvable in both directions.
+        """
+        sheets.add_category("Study")
+
+        assert sheets.get_category_id("Study") == 3
+        assert {"category_id": 3, "category_name": "Study"} in (
+            sheets.get_all_categories()
+        )
+        assert "col_values" not in sheets.categories_worksheet.calls
+
+    def test_refresh_categories_picks_up_remote_edits(self, sheets):
+        """
+        refresh_categories() re-reads categories added by other clients.
+        """
+        sheets.get_category_id("Coding")
+        sheets.categories_worksheet.rows.append([3, "Errands"])
+
+        sheets.refresh_categories()
+
+        assert sheets.get_category_id("Errands") == 3
+
+
+class TestRowIndex:
+    def test_edits_use_local_row_index(self, sheets):
+        """
+        Complete, update, delete and reorder resolve rows locally
+        instead of searching the worksheet.
+        """
+        sheets.complete_todo(1)
+        sheets.update_todo(2, task="Renamed")
+        sheets.reorder_todo(3, 1)
+        sheets.delete_todo(1)
+
+        assert "find" not in sheets.tasks_worksheet.calls
+
+    def test_row_index_follows_appends_and_deletes(self, sheets):
+        """
+        Rows below a deleted row shift up, and appended rows are indexed
+        at the end of the sheet.
+        """
+        sheets.insert_todo(Todo(task="Task 4", category="Coding"))
+        sheets.delete_todo(2)
+
+        assert sheets.find_row_by_task_id(1) == 2
+        assert sheets.find_row_by_task_id(3) == 3
+        assert sheets.find_row_by_task_id(4) == 4
+        sheets.complete_todo(4)
+        assert sheets.tasks_worksheet.rows[3][0] == 4
+        assert sheets.tasks_worksheet.rows[3][5]
+
+
+class TestStaleRowIndex:
+    def test_write_after_remote_delete_finds_moved_row(self, sheets):
+        """
+        A row deleted by another client is detected before the write,
+        so the edit lands on the todo's new row.
+        """
+        sheets.get_all_todos()
+        other_client(sheets).delete_todo(1)
+
+        sheets.complete_todo(3)
+
+        rows = sheets.tasks_worksheet.rows
+        assert [row[0] for row in rows[1:]] == [2, 3]
+        assert rows[2][5] and not rows[1][5]
+        assert sheets.find_row_by_task_id(3) == 3
+
+    def test_write_to_remotely_deleted_todo_fails(self, sheets):
+        """
+        Editing a todo another client deleted raises ValueError and
+        writes nothing.
+        """
+        sheets.get_all_todos()
+        other_client(sheets).delete_todo(3)
+        sheets.tasks_worksheet.calls.clear()
+
+        with pytest.raises(ValueError):
+            sheets.complete_todo(3)
+
+        assert "batch_update" not in sheets.tasks_worksheet.calls
+        assert [row[0] for row in sheets.tasks_worksheet.rows[1:]] == [1, 2]
+
+    def test_reload_picks_up_new_categories(self, sheets):
+        """
+        A reload caused by a stale row index also learns categories
+        added to the sheet by hand.
+        """
+        sheets.get_all_todos()
+        sheets.categories_worksheet.rows.append([3, "Study"])
+        sheets.tasks_worksheet.rows.append(
+            [4, "Task 4", 3, "2024-01-04", "", "", 4]
+        )
+        del sheets.tasks_worksheet.rows[1]
+
+        sheets.complete_todo(3)
+
+        assert sheets.tasks_worksheet.rows[2][5]
+        assert sheets.get_all_todos()[-1].category == "Study"
+
+    def test_append_indexes_the_reported_rows(self, sheets):
+        """
+        Inserts catch up with other clients' inserts first, and are
+        indexed at the rows the append response reports.
+        """
+        sheets.get_all_todos()
+        other = other_client(sheets)
+        other.insert_todo(Todo(task="Remote", category="Coding"))
+
+        task_id = sheets.insert_todo(Todo(task="Local", category="Coding"))
+
+        assert task_id == 5
+        assert sheets.find_row_by_task_id(task_id) == 6
+        assert sheets.tasks_worksheet.rows[5][1] == "Local"
+
+
+class TestReorder:
+    def test_reorder_is_a_single_batch_update(self, sheets):
+        """
+        Moving a todo any distance costs exactly one write request,
+        after one read verifying the rows.
+        """
+        for i in range(20):
+            sheets.insert_todo(Todo(task=f"New {i}", category="Coding"))
+        sheets.tasks_worksheet.calls.clear()
+
+        sheets.reorder_todo(1, 20)
+
+        assert sheets.tasks_worksheet.calls == ["get_values", "batch_update"]
+        positions = {
+            todo.task_id: todo.position for todo in sheets.get_all_todos()
+        }
+        assert positions[1] == 20
+        assert positions[2] == 1
+        assert positions[20] == 19
+        assert positions[21] == 21
+        assert sorted(positions.values()) == list(range(1, 24))
+
+    def test_reorder_upwards_shifts_down(self, sheets):
+        """
+        Moving a todo up pushes the todos in between down by one.
+        """
+        sheets.reorder_todo(3, 1)
+
+        assert [row[6] for row in sheets.tasks_worksheet.rows[1:]] == [
+            2, 3, 1
+        ]
+
+
+class TestGappedPositions:
+    def test_delete_does_not_renumber(self, sheets):
+        """
+        In gapped mode deleting a todo only removes its row.
+        """
+        sheets.migrate_positions(10)
+        sheets.tasks_worksheet.calls.clear()
+
+        sheets.delete_todo(1)
+
+        assert sheets.tasks_worksheet.calls == ["get_values", "delete_rows"]
+        assert [todo.position for todo in sheets.get_all_todos()] == [20, 30]
+
+    def test_move_writes_one_cell(self, sheets):
+        """
+        Moving a todo between two neighbours rewrites only that todo.
+        """
+        sheets.migrate_positions(10)
+        sheets.tasks_worksheet.calls.clear()
+
+        sheets.reorder_todo(3, 1)
+
+        assert sheets.tasks_worksheet.calls == ["get_values", "batch_update"]
+        ordered = sorted(sheets.get_all_todos(), key=lambda x: x.position)
+        assert [todo.task_id for todo in ordered] == [3, 1, 2]
+
+    def test_exhausted_gap_is_compacted(self, sheets):
+        """
+        When two neighbours are adjacent the positions are respaced.
+        """
+        sheets.position_gap = 2
+        sheets.reorder_todo(3, 2)
+
+        ordered = sorted(sheets.get_all_todos(), key=lambda x: x.position)
+        assert [todo.task_id for todo in ordered] == [1, 3, 2]
+        assert [todo.position for todo in ordered] == [2, 4, 6]
+
+
+    def test_migrated_sheet_stays_gapped_without_setting(self, sheets):
+        """
+        A backend configured dense uses the gap the migration stored in
+        the sheet: moves are rank-based and deletes do not renumber.
+        """
+        for i in range(4, 6):
+            sheets.insert_todo(Todo(task=f"Task {i}", category="Coding"))
+        sheets.migrate_positions(10)
+        fresh = restart(sheets)
+        fresh.position_gap = 1
+
+        fresh.reorder_todo(4, 2)
+        fresh.delete_todo(2)
+
+        ordered = sorted(fresh.get_all_todos(), key=lambda x: x.position)
+        assert [todo.task_id for todo in ordered] == [1, 4, 3, 5]
+        assert [todo.position for todo in ordered] == [10, 15, 30, 50]
+        assert fresh.get_position_gap() == 10
+
+    def test_mode_is_stored_not_inferred(self, sheets):
+        """
+        Positions left mixed by an interrupted respacing do not switch
+        a sheet that was never migrated to gapped mode.
+        """
+        sheets.tasks_worksheet.rows[2][6] = 2048
+        fresh = restart(sheets)
+
+        fresh.delete_todo(1)
+
+        assert fresh.get_position_gap() == 1
+        assert sorted(t.position for t in fresh.get_all_todos()) == [1, 2]
+
+    def test_migration_stores_the_gap(self, sheets):
+        """
+        migrate_positions() records the gap in L1 of the change feed.
+        """
+        sheets.migrate_positions(10)
+
+        assert sheets._changes().rows[0][11] == 10
+
+    def test_dense_delete_keeps_moved_order(self, sheets):
+        """
+        Dense renumbering after a delete follows the positions, not
+        the row order.
+        """
+        sheets.reorder_todo(3, 1)
+
+        sheets.delete_todo(1)
+
+        assert [(t.task_id, t.position) for t in sheets.get_all_todos()] \
+            == [(2, 2), (3, 1)]
+
+
+class TestBulkInsert:
+    def test_insert_todos_appends_in_chunks(self, sheets):
+        """
+        Bulk inserts use one append per chunk and no per-row reads.
+        """
+        todos = [
+            Todo(task=f"Imported {i}", category="Coding") for i in range(5)
+        ]
+
+        count = sheets.insert_todos(todos, chunk_size=2)
+
+        assert count == 5
+        assert sheets.tasks_worksheet.calls.count("append_rows") == 2
+        assert sheets.tasks_worksheet.calls.count("append_row") == 1
+        assert sheets.tasks_worksheet.calls.count("get_all_records") == 1
+        assert [row[0] for row in sheets.tasks_worksheet.rows[1:]] == [
+            1, 2, 3, 4, 5, 6, 7, 8
+        ]
+        assert [todo.position for todo in sheets.get_all_todos()][-1] == 8
+
+    def test_insert_todos_creates_missing_categories_once(self, sheets):
+        """
+        Unknown categories are appended in a single request.
+        """
+        sheets.insert_todos([
+            Todo(task="A", category="Study"),
+            Todo(task="B", category="Errands"),
+            Todo(task="C", category="Study"),
+        ])
+
+        assert sheets.categories_worksheet.calls.count("append_rows") == 1
+        assert sheets.get_category_id("Errands") == 4
+        assert sheets.tasks_worksheet.rows[-1][2] == 3
+
+
+class TestIterTodos:
+    def test_iter_todos_pages_through_sheet(self, sheets):
+        """
+        Without a snapshot, todos are streamed in pages of rows.
+        """
+        todos = list(sheets.iter_todos(page_size=2))
+
+        assert [todo.task_id for todo in todos] == [1, 2, 3]
+        assert todos[1].category == "Personal"
+        assert sheets.tasks_worksheet.calls == ["get_values", "get_values"]
+        assert sheets._todos is None
+
+
+def restart(sheets):
+    """Return a copy of the backend with an empty in-memory snapshot."""
+    fresh = copy.copy(sheets)
+    fresh.invalidate_cache()
+    sheets.tasks_worksheet.calls.clear()
+    return fresh
+
+
+class TestDiskCache:
+    @pytest.mark.parametrize("sheets", ["cache.json"], indirect=True)
+    def test_unchanged_revision_reuses_cache_file(self, sheets, tmp_path,
+                                                  monkeypatch):
+        """
+        A new session with an unchanged revision reads no worksheets.
+        """
+        monkeypatch.chdir(tmp_path)
+        sheets.get_all_todos()
+
+        fresh = restart(sheets)
+        todos = fresh.get_all_todos()
+
+        assert [todo.task_id for todo in todos] == [1, 2, 3]
+        assert fresh.get_category_id("Personal") == 2
+        assert sheets.tasks_worksheet.calls == []
+
+    @pytest.mark.parametrize("sheets", ["cache.json"], indirect=True)
+    def test_changed_revision_refetches(self, sheets, tmp_path, monkeypatch):
+        """
+        A moved revision forces a full fetch.
+        """
+        monkeypatch.chdir(tmp_path)
+        sheets.get_all_todos()
+        sheets.sheet.get_lastUpdateTime.return_value = "rev-2"
+
+        restart(sheets).get_all_todos()
+
+        assert sheets.tasks_worksheet.calls == ["get_all_records"]
+
+    @pytest.mark.parametrize("sheets", ["cache.json"], indirect=True)
+    def test_close_persists_session_writes(self, sheets, tmp_path,
+                                           monkeypatch):
+        """
+        close() stores this session's writes under the new revision.
+        """
+        monkeypatch.chdir(tmp_path)
+        sheets.complete_todo(1)
+        sheets.sheet.get_lastUpdateTime.return_value = "rev-2"
+        sheets.close()
+
+        fresh = restart(sheets)
+
+        assert fresh.get_all_todos()[0].date_completed
+        assert sheets.tasks_worksheet.calls == []
+
+    @pytest.mark.parametrize("sheets", ["cache.json"], indirect=True)
+    def test_close_catches_up_before_persisting(self, sheets, tmp_path,
+                                                monkeypatch):
+        """
+        close() applies other clients' edits before storing the snapshot.
+        """
+        monkeypatch.chdir(tmp_path)
+        sheets.complete_todo(1)
+        other_client(sheets).update_todo(2, task="Remote")
+        sheets.sheet.get_lastUpdateTime.return_value = "rev-2"
+        sheets.close()
+
+        fresh = restart(sheets)
+
+        assert fresh.get_all_todos()[1].task == "Remote"
+        assert sheets.tasks_worksheet.calls == []
+
+    @pytest.mark.parametrize("sheets", ["cache.json"], indirect=True)
+    def test_close_skips_cache_when_feed_was_trimmed(self, sheets, tmp_path,
+                                                      monkeypatch):
+        """
+        close() keeps the old cache file if the snapshot cannot catch up.
+        """
+        monkeypatch.chdir(tmp_path)
+        sheets.complete_todo(1)
+        other = other_client(sheets)
+        other.update_todo(2, task="Remote")
+        other.trim_changes()
+        sheets.sheet.get_lastUpdateTime.return_value = "rev-2"
+        sheets.close()
+
+        fresh = restart(sheets)
+
+        assert fresh.get_all_todos()[1].task == "Remote"
+        assert sheets.tasks_worksheet.calls == ["get_all_records"]
+
+
+class TestWriteBuffer:
+    def test_batch_merges_edits_into_one_request(self, sheets):
+        """
+        Several edits inside batch() are sent as one batch_update, with
+        repeated writes to a cell merged into the last one.
+        """
+        sheets.get_all_todos()
+        with sheets.batch():
+            sheets.update_todo(2, task="Draft")
+            sheets.update_todo(2, task="Final", due_date="2024-03-01")
+            sheets.complete_todo(1)
+            sheets.reorder_todo(3, 1)
+            assert sheets.tasks_worksheet.calls == ["get_all_records"]
+
+        assert sheets.tasks_worksheet.calls == [
+            "get_all_records", "get_values", "batch_update"
+        ]
+        assert sheets.tasks_worksheet.rows[2][1] == "Final"
+        assert sheets.tasks_worksheet.rows[2][4] == "2024-03-01"
+        assert sheets.tasks_worksheet.rows[1][5]
+        assert [row[6] for row in sheets.tasks_worksheet.rows[1:]] == [
+            2, 3, 1
+        ]
+
+    def test_size_threshold_commits_early(self, sheets):
+        """
+        The buffer is committed once it holds flush_size cells; each
+        edit here writes the task and modified_at cells.
+        """
+        sheets.flush_size = 4
+        sheets.get_all_todos()
+        with sheets.batch():
+            sheets.update_todo(1, task="One")
+            sheets.update_todo(2, task="Two")
+            assert sheets.tasks_worksheet.calls.count("batch_update") == 1
+            sheets.update_todo(3, task="Three")
+
+        assert sheets.tasks_worksheet.calls.count("batch_update") == 2
+
+    def test_delete_commits_buffered_rows_first(self, sheets):
+        """
+        Buffered writes are sent before a delete shifts the rows.
+        """
+        with sheets.batch():
+            sheets.update_todo(3, task="Kept")
+            sheets.delete_todo(2)
+
+        assert [row[1] for row in sheets.tasks_worksheet.rows[1:]] == [
+            "Task 1", "Kept"
+        ]
+
+    def test_failed_commit_keeps_writes(self, sheets):
+        """
+        Writes whose commit failed are sent by the next commit.
+        """
+        worksheet = sheets.tasks_worksheet._worksheet
+        batch_update = worksheet.batch_update
+        worksheet.batch_update = lambda data: 1 / 0
+        with pytest.raises(ZeroDivisionError):
+            with sheets.batch():
+                sheets.update_todo(1, task="Retry me")
+
+        worksheet.batch_update = batch_update
+        sheets.close()
+
+        assert worksheet.rows[1][1] == "Retry me"
+
+
+def other_client(sheets):
+    """Return a second backend on the same spreadsheet."""
+    other = restart(sheets)
+    other._buffer = {}
+    other._changed = {}
+    return other
+
+
+class TestChangeFeed:
+    def test_writes_stamp_rows_and_log_changes(self, sheets):
+        """
+        Every write path sets modified_at and appends to the feed.
+        """
+        task_id = sheets.insert_todo(Todo(task="Task 4", category="Coding"))
+        sheets.update_todo(1, task="Renamed")
+        sheets.delete_todo(2)
+
+        rows = sheets.tasks_worksheet.rows
+        assert rows[1][1] == "Renamed" and rows[1][7]
+        assert rows[3][0] == task_id and rows[3][7]
+        log = [(row[0], row[8]) for row in sheets._changes().rows[1:]]
+        assert log[:3] == [
+            (task_id, "upsert"), (1, "upsert"), (2, "delete")
+        ]
+        # Dense positions are renumbered after the delete.
+        assert log[3:] == [(3, "upsert"), (task_id, "upsert")]
+
+    def test_changes_since_reads_only_new_entries(self, sheets):
+        """
+        With a current token only the feed's tail is read, and the
+        snapshot is brought up to date with another client's edits.
+        """
+        token = sheets.get_changes_since().token
+        other = other_client(sheets)
+        other.update_todo(2, task="Edited elsewhere")
+        other.delete_todo(3)
+        sheets.tasks_worksheet.calls.clear()
+
+        changes = sheets.get_changes_since(token)
+
+        assert not changes.full
+        assert [todo.task for todo in changes.todos] == ["Edited elsewhere"]
+        assert changes.deleted == [3]
+        assert sheets.tasks_worksheet.calls == []
+        assert [todo.task_id for todo in sheets.get_all_todos()] == [1, 2]
+        assert sheets.get_changes_since(changes.token).todos == []
+
+    def test_changes_since_older_token_stays_incremental(self, sheets):
+        """
+        A token stays incremental after the snapshot has moved past it,
+        here through this backend's inserts and a TTL refresh.
+        """
+        token = sheets.get_changes_since().token
+        for task in ["Four", "Five"]:
+            sheets.insert_todo(Todo(task=task, category="Coding"))
+        other_client(sheets).update_todo(1, task="Edited elsewhere")
+        sheets.cache_ttl = 0
+        sheets.get_all_todos()
+        assert sheets._change_token != token
+
+        changes = sheets.get_changes_since(token)
+
+        assert not changes.full
+        assert [todo.task for todo in changes.todos] == [
+            "Four", "Five", "Edited elsewhere"
+        ]
+        assert changes.token == sheets._change_token
+
+    def test_token_past_feed_end_returns_full_state(self, sheets):
+        """
+        A token beyond the feed's last entry, e.g. read just before a
+        trim deleted the entries, falls back to a full read.
+        """
+        sheets.get_all_todos()
+
+        changes = sheets.get_changes_since("gen-1:5")
+
+        assert changes.full
+        assert [todo.task_id for todo in changes.todos] == [1, 2, 3]
+
+    def test_unknown_token_returns_full_state(self, sheets):
+        """
+        A token from another generation of the feed falls back to a
+        full read.
+        """
+        sheets.get_all_todos()
+
+        changes = sheets.get_changes_since("old-generation:5")
+
+        assert changes.full
+        assert [todo.task_id for todo in changes.todos] == [1, 2, 3]
+        assert changes.token == "gen-1:1"
+
+    def test_feed_is_created_for_old_spreadsheets(self, sheets):
+        """
+        A spreadsheet without a changes worksheet gets one, and the
+        tasks header gains the modified_at column, on the first write.
+        """
+        sheets.sheet.worksheet.side_effect = WorksheetNotFound("changes")
+        sheets._changes_worksheet = None
+        sheets.invalidate_cache()
+        del sheets.tasks_worksheet.rows[0][7]
+
+        assert sheets.get_changes_since().token is None
+        sheets.complete_todo(1)
+
+        assert sheets.tasks_worksheet.rows[0][7] == "modified_at"
+        changes = sheets._changes()
+        assert changes.rows[0][:9] == CHANGES_HEADER
+        assert changes.rows[1][0] == 1
+        assert sheets._change_token == f"{changes.rows[0][9]}:1"
+
+    def test_close_stores_the_feed_end(self, sheets):
+        """
+        close() stores the feed's end in K1, so other clients get their
+        token from the header instead of reading column A.
+        """
+        sheets.update_todo(1, task="Renamed")
+        sheets.update_todo(2, task="Renamed too")
+        sheets.close()
+        changes = sheets._changes()
+        changes.calls.clear()
+
+        other = other_client(sheets)
+        other.get_all_todos()
+
+        assert changes.rows[0][10] == "gen-1:3"
+        assert other._change_token == "gen-1:3"
+        assert changes.calls == ["get_values"]
+
+    def test_header_token_of_old_generation_is_ignored(self, sheets):
+        """
+        A K1 token left over from an earlier generation is not trusted;
+        the feed is read from its start instead.
+        """
+        sheets._changes().rows[0][10] = "gen-0:50"
+
+        assert sheets._current_change_token() == "gen-1:1"
+
+    def test_close_trims_past_threshold(self, sheets):
+        """
+        close() trims the feed once it holds more entries than
+        trim_threshold, keeping this backend's token valid.
+        """
+        sheets.trim_threshold = 2
+        for task in ["One", "Two", "Three"]:
+            sheets.update_todo(1, task=task)
+        sheets.close()
+
+        changes = sheets._changes()
+        generation = changes.rows[0][9]
+        assert len(changes.rows) == 1
+        assert generation != "gen-1"
+        assert changes.rows[0][10] == f"{generation}:1"
+        assert sheets._change_token == f"{generation}:1"
+
+    def test_trim_invalidates_other_tokens(self, sheets):
+        """
+        Trimming empties the feed; other clients' tokens fall back to a
+        full read while this backend stays incremental.
+        """
+        other = other_client(sheets)
+        token = other.get_changes_since().token
+        sheets.update_todo(1, task="Renamed")
+
+        sheets.trim_changes()
+        sheets.update_todo(2, task="After trim")
+
+        assert len(sheets._changes().rows) == 2
+        assert other.get_changes_since(token).full
+        changes = sheets.get_changes_since(sheets._change_token)
+        assert [todo.task for todo in changes.todos] == ["After trim"]
@@ -0,0 +1,119 @@
+import pytest
+from datetime import date
+from mvp.backend import TodoBackend, TodoQuery, create_backend
+from mvp.memory_db import TodoMemory
+from mvp.model import Todo
+
+
+@pytest.fixture
+def memory():
+    """
+    Fixture to create a TodoMemory backend with three todos.
+    """
+    memory = TodoMemory()
+    memory.insert_todo(Todo(task="Task 1", category="Coding",
+                            due_date="2000-01-01"))
+    memory.insert_todo(Todo(task="Task 2", category="Personal",
+                            due_date="2999-01-01"))
+    memory.insert_todo(Todo(task="Task 3", category="Coding"))
+    yield memory
+
+
+class TestTodoMemory:
+    def test_delete_renumbers_positions(self, memory):
+        """
+        Deleting a todo shifts the positions of the todos after it.
+        """
+        memory.delete_todo(1)
+
+        assert [todo.position for todo in memory.get_all_todos()] == [1, 2]
+        assert memory.get_next_position() == 3
+
+    @pytest.mark.parametrize("task_id, new_position, expected", [
+        (3, 1, [2, 3, 1]),
+        (1, 3, [3, 1, 2]),
+        (1, 500, [3, 1, 2]),
+        (2, 0, [2, 1, 3]),
+    ])
+    def test_reorder_todo(self, memory, task_id, new_position, expected):
+        """
+        Reordering keeps the position index sorted in both directions.
+        """
+        memory.reorder_todo(task_id, new_position)
+
+        assert [todo.position for todo in memory.get_all_todos()] == expected
+        assert memory._by_position == sorted(memory._by_position)
+
+    def test_insert_with_taken_id_raises(self, memory):
+        """
+        Inserting under an existing task_id fails and leaves the stored
+        todo and its indexes untouched.
+        """
+        with pytest.raises(ValueError):
+            memory.insert_todo(Todo(task_id=1, task="Dup", category="Study"))
+
+        assert memory.get_all_todos()[0].task == "Task 1"
+        assert memory.get_todos_by_category("Study") == []
+
+    def test_indexed_filters(self, memory):
+        """
+        Category and overdue queries follow updates and completion.
+        """
+        memory.update_todo(3, category="Personal")
+
+        assert [t.task_id for t in memory.get_todos_by_category("Coding")] \
+            == [1]
+        assert [t.task_id for t in memory.get_overdue_todos()] == [1]
+        memory.complete_todo(1)
+        assert memory.get_overdue_todos() == []
+
+    @pytest.mark.parametrize("query, expected", [
+        (TodoQuery(category="Coding", status="open"), [1, 3]),
+        (TodoQuery(due_after=date(2000, 1, 1)), [1, 2]),
+        (TodoQuery(due_before=date(2500, 1, 1)), [1]),
+        (TodoQuery(category="Personal", due_before=date(2500, 1, 1)), []),
+        (TodoQuery(text="TASK 2"), [2]),
+        (TodoQuery(status="completed"), []),
+    ])
+    def test_find_todos(self, memory, query, expected):
+        """
+        find_todos() combines the category and due date indexes with the
+        remaining predicates.
+        """
+        assert [t.task_id for t in memory.find_todos(query)] == expected
+
+    def test_text_search_ignores_unicode_case(self, memory):
+        """
+        Text search ignores case for non-ASCII letters, like SQLite's.
+        """
+        memory.update_todo(3, task="Äpfel kaufen")
+
+        assert [
+            t.task_id for t in memory.find_todos(TodoQuery(text="äPFEL"))
+        ] == [3]
+
+
+class TestCreateBackend:
+    def test_selects_backend_by_name(self):
+        """
+        create_backend() resolves registered names to backend instances.
+        """
+        backend = create_backend("memory")
+
+        assert isinstance(backend, TodoMemory)
+        assert isinstance(backend, TodoBackend)
+
+    def test_selects_backend_from_environment(self, monkeypatch):
+        """
+        TODO_BACKEND is used when no backend name is given.
+        """
+        monkeypatch.setenv("TODO_BACKEND", "memory")
+
+        assert isinstance(create_backend(), TodoMemory)
+
+    def test_unknown_backend_raises(self):
+        """
+        Unknown backend names raise ValueError.
+        """
+        with pytest.raises(ValueError):
+            create_backend("nope")
@@ -0,0 +1,107 @@
+import pytest
+from mvp.google_sheets_db import TodoGoogleSheets
+from mvp.metrics import BudgetExceeded, RequestMetrics
+from mvp.model import Todo
+from mvp.scheduler import RequestScheduler
+
+
+@pytest.fixture
+def sheets(server):
+    """
+    Fixture to create a TodoGoogleSheets backend talking to the fake
+    server, with its snapshot loaded and the metrics reset.
+    """
+    sheets = TodoGoogleSheets(
+        client=server.client(),
+        cache_file="",
+        scheduler=RequestScheduler(requests_per_minute=0),
+    )
+    sheets.get_all_todos()
+    sheets.complete_todo(2)  # creates the change feed
+    sheets.metrics.reset()
+    return sheets
+
+
+class TestRequestBudgets:
+    """Round trips per operation; raising one is a regression."""
+
+    @pytest.mark.parametrize("operation, action, budget", [
+        ("list", lambda gs: gs.get_all_todos(), 0),
+        ("insert", lambda gs: gs.insert_todo(
+            Todo(task="New", category="Coding")), 3),
+        ("update", lambda gs: gs.update_todo(1, task="Renamed"), 3),
+        ("complete", lambda gs: gs.complete_todo(1), 3),
+        ("reorder", lambda gs: gs.reorder_todo(2, 1), 3),
+        ("delete", lambda gs: gs.delete_todo(1), 6),
+    ])
+    def test_operation_budget(self, sheets, operation, action, budget):
+        """
+        Each operation stays within its request budget and its
+        requests are counted for it.
+        """
+        with sheets.metrics.budget(budget):
+            action(sheets)
+
+        if budget:
+            assert sheets.metrics.operations[operation].requests <= budget
+            assert sheets.metrics.total().requests == (
+                sheets.metrics.operations[operation].requests
+            )
+
+    def test_batched_edits_share_requests(self, sheets):
+        """
+        Three edits inside batch() cost as much as a single one.
+        """
+        with sheets.metrics.budget(3):
+            with sheets.batch():
+                sheets.update_todo(1, task="Renamed")
+                sheets.complete_todo(1)
+                sheets.update_todo(2, due_date="2030-01-01")
+
+        assert sheets.metrics.operations["commit"].requests == 3
+
+    def test_budget_exceeded(self, sheets):
+        """
+        A block making more requests than its budget fails.
+        """
+        with pytest.raises(BudgetExceeded, match="made 3 requests"):
+            with sheets.metrics.budget(1, operation="complete"):
+                sheets.complete_todo(1)
+
+
+class TestRequestMetrics:
+    def test_nested_operations_count_for_the_outermost(self):
+        """
+        Requests made by an operation called from another operation
+        count for the outer one.
+        """
+        metrics = RequestMetrics()
+
+        with metrics.operation("delete"):
+            with metrics.operation("commit"):
+                metrics.record(10, 20, 0.5)
+        metrics.record(1, 2, 0.1)
+
+        assert metrics.as_dict() == {
+            "delete": {
+                "calls": 1, "requests": 1, "errors": 0,
+                "bytes_sent": 10, "bytes_received": 20, "seconds": 0.5,
+            },
+            "other": {
+                "calls": 0, "requests": 1, "errors": 0,
+                "bytes_sent": 1, "bytes_received": 2, "seconds": 0.1,
+            },
+        }
+
+    def test_failed_requests_are_counted(self, server, sheets):
+        """
+        Retried requests and their errors show up in the metrics.
+        """
+        server.fail_next(503, retry_after=0)
+
+        sheets.complete_todo(1)
+
+        complete = sheets.metrics.operations["complete"]
+        assert (complete.requests, complete.errors) == (4, 1)
+        assert complete.bytes_sent > 0 and complete.bytes_received > 0
+        assert "complete" in sheets.metrics.report()
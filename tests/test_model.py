@@ -0,0 +1,88 @@
+import pytest
+from datetime import date, datetime
+from mvp.model import Todo
+
+
+class TestTodo:
+    def test_dates_are_converted_to_iso(self):
+        """
+        date and datetime values are stored as ISO strings.
+        """
+        todo = Todo(
+            task="Task",
+            category="Coding",
+            date_added=datetime(2024, 1, 1, 9, 30),
+            due_date=date(2024, 2, 1),
+        )
+
+        assert todo.date_added == "2024-01-01T09:30:00"
+        assert todo.due_date == "2024-02-01"
+        assert todo.date_completed is None
+
+    def test_invalid_date_raises(self):
+        """
+        A date field that is not a string or date is rejected.
+        """
+        with pytest.raises(ValueError, match="due_date"):
+            Todo(task="Task", category="Coding", due_date=20240201)
+
+    def test_trusted_matches_validated_constructor(self):
+        """
+        The trusted constructor builds the same todo from a row.
+        """
+        row = (7, "Task", "Coding", "2024-01-01", "", None, 3, None)
+
+        assert Todo.trusted(*row) == Todo(
+            task_id=7, task="Task", category="Coding",
+            date_added="2024-01-01", due_date="", position=3,
+        )
+
+    def test_to_dict_round_trips(self):
+        """
+        to_dict() returns every field and from_dict() restores it.
+        """
+        todo = Todo.trusted(1, "Task", "Coding", "2024-01-01",
+                            position=1, modified_at="2024-01-02")
+
+        data = todo.to_dict()
+
+        assert data["modified_at"] == "2024-01-02"
+        assert Todo.from_dict(data) == todo
+
+    def test_todos_are_slotted(self):
+        """
+        Todos have no per-instance __dict__.
+        """
+        assert not hasattr(Todo(task="Task", category="Coding"), "__dict__")
+
+    def test_parsed_dates_are_cached_until_changed(self):
+        """
+        due is parsed once and re-parsed when due_date is replaced.
+        """
+        todo = Todo.trusted(1, "Task", "Coding", due_date="2024-02-01")
+
+        first = todo.due
+        assert todo.due is first
+        todo.due_date = "2024-03-01T12:00:00"
+
+        assert first == date(2024, 2, 1)
+        assert todo.due == date(2024, 3, 1)
+
+    @pytest.mark.parametrize("due_date, date_completed, overdue, late", [
+        ("2024-02-01", None, True, False),
+        ("2024-03-01", None, False, False),
+        ("2024-02-01", "2024-02-10T08:00:00", False, True),
+        ("2024-02-01", "2024-01-20T08:00:00", False, False),
+        ("", None, False, False),
+    ])
+    def test_overdue_and_late(self, due_date, date_completed, overdue,
+                              late):
+        """
+        is_overdue() uses the given reference date; completed_late
+        compares the completion and due dates.
+        """
+        todo = Todo(task="Task", category="Coding", due_date=due_date,
+                    date_completed=date_completed)
+
+        assert todo.is_overdue(date(2024, 2, 15)) is overdue
+        assert todo.completed_late is late
@@ -0,0 +1,66 @@
+import threading
+from unittest.mock import MagicMock
+from mvp.prefetch import Prefetcher
+
+
+class TestPrefetcher:
+    def test_prefetched_value_is_used_once(self):
+        """
+        A prefetched value is returned once; the next read hits the
+        loader again.
+        """
+        prefetcher = Prefetcher()
+        loader = MagicMock(side_effect=[["prefetched"], ["fresh"]])
+
+        prefetcher.prefetch("todos", loader)
+
+        assert prefetcher.get("todos", loader) == ["prefetched"]
+        assert prefetcher.get("todos", loader) == ["fresh"]
+        assert loader.call_count == 2
+        prefetcher.shutdown()
+
+    def test_get_without_prefetch_calls_loader(self):
+        """
+        Without a prefetch, get() loads the value directly.
+        """
+        prefetcher = Prefetcher()
+        loader = MagicMock(return_value=["direct"])
+
+        assert prefetcher.get("categories", loader) == ["direct"]
+        loader.assert_called_once()
+        prefetcher.shutdown()
+
+    def test_loads_run_concurrently(self):
+        """
+        Todos and categories are loaded on separate threads at once.
+        """
+        prefetcher = Prefetcher()
+        barrier = threading.Barrier(2, timeout=2)
+
+        def load(value):
+            barrier.wait()
+            return value
+
+        prefetcher.prefetch("todos", lambda: load("todos"))
+        prefetcher.prefetch("categories", lambda: load("categories"))
+
+        assert prefetcher.get("todos", MagicMock()) == "todos"
+        assert prefetcher.get("categories", MagicMock()) == "categories"
+        prefetcher.shutdown()
+
+
+def test_sheets_share_one_fetch_across_threads(sheets):
+    """
+    Concurrent reads of a cold Google Sheets backend fetch each
+    worksheet only once.
+    """
+    prefetcher = Prefetcher()
+
+    prefetcher.prefetch("todos", sheets.get_all_todos)
+    prefetcher.prefetch("categories", sheets.get_all_categories)
+    prefetcher.get("todos", sheets.get_all_todos)
+    prefetcher.get("categories", sheets.get_all_categories)
+
+    assert sheets.tasks_worksheet.calls.count("get_all_records") == 1
+    assert sheets.categories_worksheet.calls.count("get_all_records") == 1
+    prefetcher.shutdown()
@@ -0,0 +1,76 @@
+import cProfile
+import pstats
+from click.testing import CliRunner
+from mvp.commands import cli
+from mvp.profiling import ActionProfiler, collapsed_stacks
+
+
+def busy(n):
+    return sum(i * i for i in range(n))
+
+
+def parent():
+    return busy(20000) + busy(20000)
+
+
+class TestCollapsedStacks:
+    def test_stacks_follow_the_call_tree(self):
+        """
+        Time is attributed along the caller chain of each function.
+        """
+        profile = cProfile.Profile()
+        profile.runcall(parent)
+
+        lines = collapsed_stacks(pstats.Stats(profile))
+
+        stacks = [line.rsplit(" ", 1)[0] for line in lines]
+        assert any(
+            stack.startswith("parent (test_profiling.py")
+            and ";busy (test_profiling.py" in stack
+            for stack in stacks
+        )
+        assert all(int(line.rsplit(" ", 1)[1]) > 0 for line in lines)
+
+
+class TestActionProfiler:
+    def test_profile_writes_reports(self, tmp_path):
+        """
+        Each profiled block writes a .pstats and a .collapsed report.
+        """
+        profiler = ActionProfiler(str(tmp_path))
+
+        with profiler.profile("show_todos"):
+            parent()
+
+        names = sorted(p.suffix for p in tmp_path.iterdir())
+        assert names == [".collapsed", ".pstats"]
+        report = next(tmp_path.glob("*.pstats"))
+        assert report.name.endswith("-show_todos.pstats")
+        assert pstats.Stats(str(report)).total_calls > 0
+
+    def test_nested_profiles_are_merged(self, tmp_path):
+        """
+        A profile started inside another one does not write reports.
+        """
+        profiler = ActionProfiler(str(tmp_path))
+
+        with profiler.profile("outer"):
+            with profiler.profile("inner"):
+                parent()
+
+        assert len(list(tmp_path.glob("*-outer.pstats"))) == 1
+        assert not list(tmp_path.glob("*-inner.*"))
+
+    def test_profile_option_profiles_a_command(self, tmp_path, monkeypatch):
+        """
+        --profile writes the reports of a subcommand.
+        """
+        monkeypatch.setenv("TODO_PROFILE_DIR", str(tmp_path / "profiles"))
+        monkeypatch.setenv("TODO_SQLITE_PATH", str(tmp_path / "todos.db"))
+
+        result = CliRunner().invoke(
+            cli, ["--backend", "sqlite", "--profile", "stats"]
+        )
+
+        assert result.exit_code == 0
+        assert len(list((tmp_path / "profiles").glob("*-stats.*"))) == 2
@@ -0,0 +1,192 @@
+import pytest
+from mvp.google_sheets_db import TodoGoogleSheets
+from mvp.memory_db import TodoMemory
+from mvp.model import Todo
+from mvp.replica import TodoReplica
+from mvp.scheduler import RequestScheduler
+
+
+@pytest.fixture
+def remote():
+    """
+    Fixture to create an in-memory remote backend with one todo.
+    """
+    remote = TodoMemory()
+    remote.insert_todo(Todo(task="Remote task", category="Coding"))
+    yield remote
+
+
+@pytest.fixture
+def replica(remote):
+    """
+    Fixture to create a synced in-memory replica of the remote.
+    """
+    replica = TodoReplica(
+        ":memory:", remote_factory=lambda: remote, start_sync=False
+    )
+    assert replica.sync()
+    yield replica
+
+
+class TestTodoReplica:
+    def test_initial_sync_pulls_remote(self, replica):
+        """
+        The first sync copies the remote todos into the replica.
+        """
+        assert [todo.task for todo in replica.get_all_todos()] == [
+            "Remote task"
+        ]
+
+    def test_local_writes_are_queued_then_pushed(self, replica, remote):
+        """
+        Writes hit the replica immediately and reach the remote on sync.
+        """
+        replica.insert_todo(Todo(task="Local task", category="Personal"))
+        replica.complete_todo(1)
+
+        assert len(replica.get_all_todos()) == 2
+        assert replica.pending_operations() == 2
+        assert len(remote.get_all_todos()) == 1
+
+        assert replica.sync()
+        assert replica.pending_operations() == 0
+        assert [todo.task for todo in remote.get_all_todos()] == [
+            "Remote task", "Local task"
+        ]
+        assert remote.get_all_todos()[0].date_completed
+
+    def test_remote_changes_are_pulled(self, replica, remote):
+        """
+        Remote edits and deletions replace the replica state.
+        """
+        remote.insert_todo(Todo(task="Other client", category="Study"))
+        remote.update_todo(1, task="Renamed remotely")
+        replica.sync()
+        remote.delete_todo(2)
+        replica.sync()
+
+        assert [todo.task for todo in replica.get_all_todos()] == [
+            "Renamed remotely"
+        ]
+
+    def test_pending_local_edit_wins(self, replica, remote):
+        """
+        A task with unpushed local edits keeps its local state on pull.
+        """
+        replica.update_todo(1, task="Edited offline")
+        remote.update_todo(1, task="Edited remotely")
+        replica._pull()
+
+        assert replica.get_all_todos()[0].task == "Edited offline"
+
+    def test_conflicting_insert_is_renumbered(self, replica, remote):
+        """
+        A local insert whose id was taken remotely gets a fresh id.
+        """
+        replica.insert_todo(Todo(task="Local task", category="Coding"))
+        remote.insert_todo(Todo(task="Other client", category="Coding"))
+
+        assert replica.sync()
+        assert sorted(todo.task for todo in remote.get_all_todos()) == [
+            "Local task", "Other client", "Remote task"
+        ]
+        assert len(replica.get_all_todos()) == 3
+
+    def test_offline_sync_keeps_operations(self):
+        """
+        When the remote is unreachable the operation log is kept.
+        """
+        def unreachable():
+            raise ConnectionError("offline")
+
+        replica = TodoReplica(
+            ":memory:", remote_factory=unreachable, start_sync=False
+        )
+        replica.insert_todo(Todo(task="Offline", category="Coding"))
+
+        assert not replica.sync()
+        assert replica.pending_operations() == 1
+
+    def test_unexpected_sync_error_is_raised(self):
+        """
+        Errors other than being offline are not swallowed by sync().
+        """
+        def broken():
+            raise RuntimeError("bad credentials")
+
+        replica = TodoReplica(
+            ":memory:", remote_factory=broken, start_sync=False
+        )
+        replica.insert_todo(Todo(task="Offline", category="Coding"))
+
+        with pytest.raises(RuntimeError):
+            replica.sync()
+        assert replica.pending_operations() == 1
+
+    def test_completion_keeps_local_timestamp(self, replica, remote):
+        """
+        A replayed completion records when the todo was completed locally.
+        """
+        replica.complete_todo(1)
+        completed = replica.get_all_todos()[0].date_completed
+
+        assert replica.sync()
+        assert remote.get_all_todos()[0].date_completed == completed
+
+    def test_background_worker_pushes_on_close(self, remote):
+        """
+        close() stops the SyncWorker after a final sync.
+        """
+        replica = TodoReplica(
+            ":memory:", remote_factory=lambda: remote, sync_interval=60
+        )
+        replica.insert_todo(Todo(task="Background", category="Coding"))
+        replica.close()
+
+        assert not replica.worker.is_alive()
+        assert replica.pending_operations() == 0
+        assert remote.get_all_todos()[-1].task == "Background"
+
+
+def test_sync_pulls_only_sheet_changes(sheets):
+    """
+    Against Google Sheets, syncs after the first one read the change
+    feed instead of the whole tasks worksheet.
+    """
+    replica = TodoReplica(
+        ":memory:", remote_factory=lambda: sheets, start_sync=False
+    )
+    assert replica.sync()
+    sheets.update_todo(2, task="Edited remotely")
+    sheets.tasks_worksheet.calls.clear()
+
+    assert replica.sync()
+
+    assert "get_all_records" not in sheets.tasks_worksheet.calls
+    assert replica.get_all_todos()[1].task == "Edited remotely"
+
+
+def test_failed_batch_commit_keeps_operations(server):
+    """
+    Operations buffered in the remote batch stay in the log until the
+    batch is committed, so a failed commit is pushed again.
+    """
+    sheets = TodoGoogleSheets(
+        client=server.client(),
+        cache_file="",
+        scheduler=RequestScheduler(requests_per_minute=0, max_retries=0),
+    )
+    replica = TodoReplica(
+        ":memory:", remote_factory=lambda: sheets, start_sync=False
+    )
+    assert replica.sync()
+    replica.complete_todo(1)
+    server.fail_next(503)
+
+    assert not replica.sync()
+    assert replica.pending_operations() == 1
+
+    assert replica.sync()
+    assert replica.pending_operations() == 0
+    sheets.invalidate_cache()
+    assert sheets.get_all_todos()[0].date_completed
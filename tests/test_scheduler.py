@@ -0,0 +1,228 @@
+import threading
+import time
+import pytest
+import requests
+from unittest.mock import MagicMock
+from gspread.exceptions import APIError
+from mvp.scheduler import (
+    RequestScheduler,
+    ScheduledWorksheet,
+    TokenBucket,
+    is_retryable,
+)
+
+
+def api_error(code, headers=None):
+    """Build a gspread APIError with the given HTTP status code."""
+    response = MagicMock()
+    response.json.return_value = {
+        "error": {"code": code, "message": "error", "status": "ERROR"}
+    }
+    response.headers = headers or {}
+    return APIError(response)
+
+
+class FakeClock:
+    """Clock whose sleep() advances time instead of waiting."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket:
+    def test_burst_then_steady_rate(self):
+        """
+        A full bucket allows a burst, after which requests are spaced
+        at the refill rate.
+        """
+        clock = FakeClock()
+        bucket = TokenBucket(2.0, 3, clock=clock, sleep=clock.sleep)
+
+        waits = [bucket.acquire() for _ in range(5)]
+
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3:] == [pytest.approx(0.5), pytest.approx(0.5)]
+
+    def test_zero_rate_disables_limit(self):
+        """
+        A rate of 0 never waits.
+        """
+        clock = FakeClock()
+        bucket = TokenBucket(0, 1, clock=clock, sleep=clock.sleep)
+
+        assert [bucket.acquire() for _ in range(10)] == [0.0] * 10
+
+
+class TestRequestScheduler:
+    @pytest.mark.parametrize("code, expected", [
+        (429, True), (500, True), (503, True), (400, False), (404, False),
+    ])
+    def test_is_retryable(self, code, expected):
+        """
+        Quota and server errors are retried; client errors are not.
+        """
+        assert is_retryable(api_error(code)) is expected
+
+    @pytest.mark.parametrize("error, expected", [
+        (api_error(429), True),
+        (api_error(503), False),
+        (requests.ConnectionError(), False),
+        (requests.Timeout(), False),
+    ])
+    def test_non_idempotent_requests_retry_only_quota_errors(self, error,
+                                                             expected):
+        """
+        A request that may have been applied despite the error is not
+        retried unless it is idempotent.
+        """
+        assert is_retryable(error, idempotent=False) is expected
+
+    def test_retries_transient_errors_with_backoff(self):
+        """
+        A request failing with 429 and 503 is retried until it succeeds,
+        backing off within the exponential bounds.
+        """
+        sleeps = []
+        scheduler = RequestScheduler(
+            requests_per_minute=0, base_delay=1.0, sleep=sleeps.append
+        )
+        request = MagicMock(
+            side_effect=[api_error(429), api_error(503), "ok"]
+        )
+
+        assert scheduler.call(request, "A1") == "ok"
+        assert request.call_count == 3
+        assert 0 <= sleeps[0] <= 1.0
+        assert 0 <= sleeps[1] <= 2.0
+
+    def test_honours_retry_after(self):
+        """
+        The server's Retry-After header overrides the computed backoff.
+        """
+        sleeps = []
+        scheduler = RequestScheduler(
+            requests_per_minute=0, sleep=sleeps.append
+        )
+        request = MagicMock(
+            side_effect=[api_error(429, {"Retry-After": "7"}), "ok"]
+        )
+
+        scheduler.call(request)
+
+        assert sleeps == [7.0]
+
+    def test_gives_up_after_max_retries(self):
+        """
+        The error is re-raised once the retries are used up.
+        """
+        scheduler = RequestScheduler(
+            requests_per_minute=0, max_retries=2, sleep=lambda s: None
+        )
+        request = MagicMock(side_effect=api_error(500))
+
+        with pytest.raises(APIError):
+            scheduler.call(request)
+        assert request.call_count == 3
+
+    def test_client_errors_are_not_retried(self):
+        """
+        A 400 error fails immediately.
+        """
+        scheduler = RequestScheduler(requests_per_minute=0)
+        request = MagicMock(side_effect=api_error(400))
+
+        with pytest.raises(APIError):
+            scheduler.call(request)
+        request.assert_called_once()
+
+
+class TestScheduledWorksheet:
+    def test_structural_requests_are_not_resent_after_server_error(self):
+        """
+        delete_rows failing with a 503 is raised at once, while a read
+        failing the same way is retried.
+        """
+        worksheet = MagicMock()
+        worksheet.delete_rows.side_effect = [api_error(503), None]
+        worksheet.get_values.side_effect = [api_error(503), [["1"]]]
+        scheduled = ScheduledWorksheet(
+            worksheet,
+            RequestScheduler(requests_per_minute=0, sleep=lambda s: None),
+        )
+
+        with pytest.raises(APIError):
+            scheduled.delete_rows(2)
+
+        assert scheduled.get_values("A2") == [["1"]]
+        worksheet.delete_rows.assert_called_once_with(2)
+        assert worksheet.get_values.call_count == 2
+
+    def test_writes_queued_during_backoff_are_coalesced(self):
+        """
+        Writes made while a batch backs off wait behind it and are sent
+        together as one batch, with only the newest value of each cell.
+        """
+        worksheet = MagicMock()
+        sent = []
+        retrying = threading.Event()
+        queued = threading.Event()
+
+        def batch_update(data):
+            sent.append(data)
+            if len(sent) == 1:
+                raise api_error(429)
+
+        def backoff(seconds):
+            retrying.set()
+            queued.wait(timeout=2)
+
+        worksheet.batch_update.side_effect = batch_update
+        scheduled = ScheduledWorksheet(
+            worksheet,
+            RequestScheduler(requests_per_minute=0, sleep=backoff),
+        )
+        writers = [
+            threading.Thread(target=scheduled.update_cell, args=args)
+            for args in [(2, 7, 1), (2, 2, "second"), (2, 2, "third")]
+        ]
+        writers[0].start()
+        retrying.wait(timeout=2)
+        for writer in writers[1:]:
+            writer.start()
+        while len(scheduled._waiters) < 2:
+            time.sleep(0.001)
+        queued.set()
+        for writer in writers:
+            writer.join(timeout=2)
+
+        assert sent[:2] == [[{"range": "G2", "values": [[1]]}]] * 2
+        assert len(sent) == 3
+        assert [update["range"] for update in sent[2]] == ["B2"]
+
+
+def test_edit_survives_quota_error(sheets):
+    """
+    An edit rejected with a 429 is retried instead of being lost.
+    """
+    sheets.scheduler._sleep = lambda seconds: None
+    worksheet = sheets.tasks_worksheet._worksheet
+    failures = [api_error(429)]
+    batch_update = worksheet.batch_update
+
+    def flaky_batch_update(data):
+        if failures:
+            raise failures.pop()
+        return batch_update(data)
+    worksheet.batch_update = flaky_batch_update
+
+    sheets.update_todo(2, task="Renamed")
+
+    assert worksheet.rows[2][1] == "Renamed"
@@ -0,0 +1,137 @@
+import sqlite3
+import pytest
+from datetime import date
+from mvp.backend import TodoQuery
+from mvp.model import Todo
+from mvp.sqlite_db import TodoSQLite
+
+
+@pytest.fixture
+def db():
+    """
+    Fixture to create an in-memory TodoSQLite backend with three todos.
+    """
+    db = TodoSQLite(":memory:")
+    db.insert_todo(Todo(task="Task 1", category="Coding",
+                        due_date="2000-01-01"))
+    db.insert_todo(Todo(task="Task 2", category="Personal"))
+    db.insert_todo(Todo(task="Task 3", category="Coding"))
+    yield db
+
+
+class TestTodoSQLite:
+    def test_insert_assigns_ids_and_positions(self, db):
+        """
+        Inserted todos receive sequential ids and positions.
+        """
+        todos = db.get_all_todos()
+
+        assert [todo.task_id for todo in todos] == [1, 2, 3]
+        assert [todo.position for todo in todos] == [1, 2, 3]
+        assert todos[1].category == "Personal"
+
+    def test_update_complete_delete(self, db):
+        """
+        Updates, completion and deletion mirror TodoGoogleSheets.
+        """
+        db.update_todo(1, task="Renamed", category="Study")
+        db.complete_todo(2)
+        db.delete_todo(1)
+
+        todos = db.get_all_todos()
+        assert [todo.task_id for todo in todos] == [2, 3]
+        assert [todo.position for todo in todos] == [1, 2]
+        assert todos[0].date_completed
+        with pytest.raises(ValueError):
+            db.complete_todo(1)
+
+    def test_reorder_todo(self, db):
+        """
+        Reordering shifts the todos in between by one position.
+        """
+        db.reorder_todo(3, 1)
+
+        assert [todo.position for todo in db.get_all_todos()] == [2, 3, 1]
+
+    @pytest.mark.parametrize("task_id, new_position, expected", [
+        (1, 500, [3, 1, 2]),
+        (2, 0, [2, 1, 3]),
+    ])
+    def test_reorder_clamps_out_of_range_positions(self, db, task_id,
+                                                   new_position, expected):
+        """
+        Positions past either end move the todo to the first or last
+        place, keeping the positions dense.
+        """
+        db.reorder_todo(task_id, new_position)
+
+        assert [todo.position for todo in db.get_all_todos()] == expected
+
+    def test_filters(self, db):
+        """
+        Category and overdue filters are evaluated in SQL.
+        """
+        assert [t.task_id for t in db.get_todos_by_category("Coding")] == [
+            1, 3
+        ]
+        assert [t.task_id for t in db.get_overdue_todos()] == [1]
+
+    def test_find_todos(self, db):
+        """
+        Every query predicate is evaluated in SQL. Text matches
+        literally and ignores case beyond ASCII, as TodoQuery.matches()
+        does.
+        """
+        db.update_todo(2, task="50% done_", due_date="2024-06-01T12:00:00")
+        db.update_todo(3, task="Äpfel kaufen")
+        db.update_todo(3, due_date="")
+        db.complete_todo(1)
+
+        def ids(**fields):
+            return [t.task_id for t in db.find_todos(TodoQuery(**fields))]
+
+        assert ids(category="Coding", status="open") == [3]
+        assert ids(status="completed") == [1]
+        assert ids(due_after=date(2024, 6, 1)) == [2]
+        assert ids(due_before=date(2024, 6, 1)) == [1]
+        assert ids(due_before=date(2024, 6, 2)) == [1, 2]
+        assert ids(text="% DONE_") == [2]
+        assert ids(text="_") == [2]
+        assert ids(text="äpfel") == ids(text="ÄPFEL") == [3]
+
+    def test_unknown_category_raises(self, db):
+        """
+        Inserting a todo with an unknown category raises ValueError.
+        """
+        with pytest.raises(ValueError):
+            db.insert_todo(Todo(task="Task", category="Unknown"))
+
+    def test_insert_todos_creates_categories(self, db):
+        """
+        Bulk inserts assign ids and positions and create categories.
+        """
+        count = db.insert_todos([
+            Todo(task="Imported 1", category="Groceries"),
+            Todo(task="Imported 2", category="Coding"),
+        ])
+
+        todos = db.get_all_todos()
+        assert count == 2
+        assert [todo.task_id for todo in todos][-2:] == [4, 5]
+        assert [todo.position for todo in todos][-2:] == [4, 5]
+        assert todos[3].category == "Groceries"
+
+    def test_failed_insert_todos_creates_no_categories(self, db):
+        """
+        A failed bulk insert rolls back the categories it created.
+        """
+        with pytest.raises(sqlite3.IntegrityError):
+            db.insert_todos([
+                Todo(task="New", category="Groceries"),
+                Todo(task="Duplicate id", category="Coding", task_id=1),
+            ])
+
+        assert "Groceries" not in [
+            category["category_name"] for category in db.get_all_categories()
+        ]
+        assert len(db.get_all_todos()) == 3
@@ -0,0 +1,39 @@
+import subprocess
+import sys
+from concurrent.futures import Future
+from unittest.mock import MagicMock, patch
+from mvp.cli import TodoCLI
+
+
+class TestStartup:
+    def test_import_does_not_load_heavy_modules(self):
+        """
+        Importing run.py loads neither gspread nor the menu modules.
+        """
+        code = (
+            "import sys, run; "
+            "print(any(name in sys.modules for name in "
+            "('gspread', 'google.oauth2', 'simple_term_menu', 'mvp.cli')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, check=True,
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_cli_uses_background_connection(self):
+        """
+        TodoCLI takes the backend from a connection future and does not
+        sleep by default.
+        """
+        backend = MagicMock()
+        connection = Future()
+        connection.set_result(backend)
+
+        with patch("mvp.cli.time.sleep") as mock_sleep, \
+                patch("mvp.cli.create_backend") as mock_create:
+            cli = TodoCLI(connection=connection)
+
+        assert cli.gs is backend
+        mock_create.assert_not_called()
+        mock_sleep.assert_not_called()
@@ -1,7 +1,9 @@
 import pytest
 from unittest.mock import patch, MagicMock
 from mvp.cli import TodoCLI
+from mvp.backend import TodoQuery
 from mvp.model import Todo
+from mvp.profiling import ActionProfiler
 
 
 # Mock time.sleep for all tests
@@ -13,12 +15,12 @@ def no_sleep(monkeypatch):
 @pytest.fixture
 def todo_cli():
     """
-    Fixture to create a TodoCLI instance with a mocked GoogleSheets backend.
+    Fixture to create a TodoCLI instance with a mocked storage backend.
     This allows for isolated testing of the CLI functionality.
     """
-    with patch('mvp.cli.TodoGoogleSheets') as mock_gs:
+    with patch('mvp.cli.create_backend') as mock_create:
         cli = TodoCLI()
-        cli.gs = mock_gs
+        cli.gs = mock_create.return_value
         yield cli
 
 
@@ -79,13 +81,16 @@ class TestTodoCLI:
         This test ensures that a selected todo can be marked as complete,
         and that the appropriate method is called on the backend.
         """
-        todo_cli.gs.get_all_todos.return_value = mock_todos
+        todo_cli.gs.find_todos.return_value = mock_todos
         with patch.multiple(
             'mvp.cli.TodoCLI',
             display_todo_selection_menu=MagicMock(return_value=mock_todos[0]),
             confirm_action=MagicMock(return_value=True)
         ):
             todo_cli.complete_todo()
+            todo_cli.gs.find_todos.assert_called_once_with(
+                TodoQuery(status="open")
+            )
             todo_cli.gs.complete_todo.assert_called_once_with(1)
 
     @pytest.mark.parametrize("input_value, required, expected", [
@@ -176,3 +181,60 @@ class TestTodoCLI:
         mock_print.assert_any_call(
             "\n[bold yellow]Todo addition cancelled.[/bold yellow]"
         )
+
+    def test_update_todo_uses_prefetched_data(self, todo_cli, mock_todos):
+        """
+        Data prefetched while the main menu is shown is reused by the next
+        action instead of being read again.
+        """
+        todo_cli.gs.get_all_todos.return_value = mock_todos
+        todo_cli.gs.get_all_categories.return_value = [
+            {"category_id": 1, "category_name": "Category 1"}
+        ]
+        todo_cli.prefetch_menu_data()
+
+        with patch('mvp.cli.TodoCLI.display_todo_selection_menu',
+                   return_value=mock_todos[0]), \
+                patch('mvp.cli.TodoCLI.get_input', return_value=None), \
+                patch('mvp.cli.TerminalMenu') as menu, \
+                patch('mvp.cli.TodoCLI.get_due_date', return_value=None):
+            menu.return_value.show.return_value = 0
+            todo_cli.update_todo()
+
+        todo_cli.gs.get_all_todos.assert_called_once()
+        todo_cli.gs.get_all_categories.assert_called_once()
+        todo_cli.gs.update_todo.assert_called_once_with(
+            1, None, "Category 1", None
+        )
+
+    def test_mutating_action_discards_prefetched_data(self, todo_cli,
+                                                      mock_todos):
+        """
+        Values prefetched before a write are not handed out after it.
+        """
+        todo_cli.gs.find_todos.return_value = mock_todos
+        todo_cli.prefetch_menu_data()
+
+        with patch.multiple(
+            'mvp.cli.TodoCLI',
+            display_todo_selection_menu=MagicMock(return_value=mock_todos[0]),
+            confirm_action=MagicMock(return_value=True)
+        ), patch('mvp.cli.console.print'):
+            todo_cli.run_action(todo_cli.complete_todo)
+        loader = MagicMock(return_value=[])
+        todo_cli.prefetcher.get("categories", loader)
+
+        todo_cli.gs.complete_todo.assert_called_once_with(1)
+        loader.assert_called_once()
+
+    def test_run_action_profiles_when_enabled(self, todo_cli, tmp_path):
+        """
+        With a profiler, each menu action writes its own reports.
+        """
+        todo_cli.profiler = ActionProfiler(str(tmp_path))
+        todo_cli.gs.get_all_todos.return_value = []
+
+        with patch('mvp.cli.console.print'):
+            todo_cli.run_action(todo_cli.show_todos)
+
+        assert len(list(tmp_path.glob("*-show_todos.*"))) == 2
@@ -0,0 +1,112 @@
+import json
+import pytest
+from mvp import tracing
+from mvp.backend import TodoQuery
+from mvp.memory_db import TodoMemory
+from mvp.tracing import SpanTracer, traced
+
+
+def read_spans(path):
+    """Return the spans logged to a trace file."""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.fixture
+def tracer(tmp_path, monkeypatch):
+    """Fixture installing a SpanTracer that logs to a temporary file."""
+    tracer = SpanTracer(path=str(tmp_path / "logs" / "trace.log"))
+    monkeypatch.setattr(tracing, "_tracer", tracer)
+    yield tracer
+    tracer.close()
+
+
+class TestSpanTracer:
+    def test_span_is_logged_as_json(self, tracer):
+        """
+        A span is logged with its name, duration and error.
+        """
+        with tracer.span("cli.show_todos"):
+            pass
+        with pytest.raises(KeyError):
+            with tracer.span("cli.delete_todo"):
+                raise KeyError(1)
+
+        first, second = read_spans(tracer.path)
+        assert first["span"] == "cli.show_todos"
+        assert first["ms"] >= 0 and first["error"] is None
+        assert second["error"] == "KeyError"
+
+    def test_empty_path_disables_tracing(self, tmp_path, monkeypatch):
+        """
+        An empty TODO_TRACE_FILE turns the tracer off.
+        """
+        monkeypatch.setenv("TODO_TRACE_FILE", "")
+        tracer = SpanTracer()
+
+        with tracer.span("cli.add_todo"):
+            pass
+
+        assert tracer.path == ""
+
+    def test_unwritable_path_disables_tracing(self, tmp_path):
+        """
+        A trace file that cannot be created turns the tracer off instead
+        of failing.
+        """
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        tracer = SpanTracer(path=str(blocker / "logs" / "trace.log"))
+
+        with tracer.span("cli.add_todo"):
+            pass
+
+        assert tracer.path == ""
+
+    def test_log_rotates(self, tmp_path):
+        """
+        The log is rotated at max_bytes, keeping backup_count files.
+        """
+        path = tmp_path / "trace.log"
+        tracer = SpanTracer(path=str(path), max_bytes=300, backup_count=2)
+
+        for _ in range(20):
+            with tracer.span("backend.get_all_todos"):
+                pass
+        tracer.close()
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "trace.log", "trace.log.1", "trace.log.2"
+        ]
+
+
+class TestTraced:
+    def test_only_outermost_call_is_logged(self, tracer):
+        """
+        Traced calls made inside a traced call are part of its span.
+        """
+        @traced("inner")
+        def inner():
+            return 1
+
+        @traced("outer")
+        def outer():
+            return inner() + 1
+
+        assert outer() == 2
+        assert inner() == 1
+        assert [s["span"] for s in read_spans(tracer.path)] == [
+            "outer", "inner"
+        ]
+
+    def test_backend_methods_are_traced(self, tracer):
+        """
+        Backend methods listed in TRACED_METHODS are logged as spans.
+        """
+        backend = TodoMemory(categories=[])
+
+        backend.find_todos(TodoQuery.overdue())
+
+        assert [s["span"] for s in read_spans(tracer.path)] == [
+            "TodoMemory.find_todos"
+        ]